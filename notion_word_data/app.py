@@ -1,167 +1,458 @@
 """The main module, the only one you should run."""
 
-# System imports
-import itertools
-import multiprocessing
+from __future__ import annotations
 
-# Third party imports
-import alive_progress
-import requests
+# System imports
+import argparse
 
 # Custom imports
-from notion_word_data import errors, logs, notion, utils, word_data
+from notion_word_data import (
+    dead_letter,
+    deadline,
+    errors,
+    logs,
+    pipeline,
+    store,
+    utils,
+    word_list,
+)
+
+# Third party imports
+alive_progress = utils.lazy_import("alive_progress")
 
 general_logger = logs.setup_logging_general(f"{__name__}.general")
 exception_logger = logs.setup_logging_exception(f"{__name__}.exception")
 
 
-PROCESSES = 4
+WORDS_FILE = "WORDS.md"
+WORDS_INDEX = 4
+# The handled words are deleted from WORDS.md by batches of this size, so that an interrupted run keeps them.
+CHECKPOINT_BATCH = 20
+
+
+def main(argv: list[str] | None = None) -> None:
+    """The main function, which gets called at runtime.
+
+    Args:
+        argv (list[str] | None, optional): The command line arguments. Defaults to sys.argv.
+    """
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    run_deadline = None
+    if args.max_duration is not None:
+        if (
+            args.replay
+            or args.export
+            or args.serve
+            or args.watch
+            or args.refresh is not None
+            or args.crawl is not None
+        ):
+            parser.error("--max-duration only applies to a run over WORDS.md")
+        # Started before anything else, as the whole run must fit in the duration.
+        run_deadline = deadline.Deadline(args.max_duration)
+    logs.start_listener()
+    try:
+        general_logger.debug("Start main process.")
+        if args.replay:
+            # Only the Notion API is needed, at its own pace, without any worker.
+            run_replay(args.replay)
+            general_logger.info("Done!")
+            return
+        if args.refresh is not None and args.no_store:
+            parser.error("--refresh needs the local store of the words")
+        word_store = None if args.no_store else store.WordStore(args.store)
+        dead_letters = dead_letter.DeadLetterStore(args.dead_letter)
+        with pipeline.Pipeline(
+            args.processes,
+            word_store,
+            # The refresh writes the changed pages itself, within its budget.
+            dry_run=args.export is not None or args.refresh is not None,
+            language_concurrency=args.language_concurrency,
+            fetch_threads=args.fetch_threads,
+        ) as word_pipeline:
+            if args.export is not None:
+                run_export(word_pipeline, args.export)
+            elif args.refresh is not None:
+                run_refresh(word_pipeline, word_store, args.refresh, args.budget)
+            elif args.serve:
+                # Imported here, as it is only needed by the long-running mode.
+                from notion_word_data import server
+
+                server.JobServer(word_pipeline, (args.host, args.port)).run()
+            elif args.watch:
+                # Imported here, as it is only needed by the long-running mode.
+                from notion_word_data import daemon
+
+                daemon.Daemon(
+                    word_pipeline,
+                    WORDS_FILE,
+                    WORDS_INDEX,
+                    spool_dir=args.spool,
+                    interval=args.interval,
+                    dead_letters=dead_letters,
+                ).run()
+            elif args.crawl is not None:
+                run_crawl(
+                    word_pipeline,
+                    args.crawl,
+                    args.crawl_max,
+                    args.crawl_lang,
+                    dead_letters,
+                )
+            else:
+                run_once(word_pipeline, dead_letters, run_deadline)
+        general_logger.info("Done!")
+    except errors.InvalidConfiguration as error:
+        general_logger.critical("The run has been stopped. %s", error)
+        raise SystemExit(1) from error
+    finally:
+        logs.stop_listener()
 
 
-def main() -> None:
-    """The main function, which gets called at runtime."""
-    general_logger.debug("Start main process.")
-    words = get_words_to_find("WORDS.md", 4)
-    session = requests.Session()
+def get_parser() -> argparse.ArgumentParser:
+    """Get the parser of the command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(
+        description="Add the words of WORDS.md to a Notion database."
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=pipeline.PROCESSES,
+        help="the number of worker processes",
+    )
+    parser.add_argument(
+        "--language-concurrency",
+        type=int,
+        metavar="WORDS",
+        help="the maximum number of words of a language processed at once",
+    )
+    parser.add_argument(
+        "--fetch-threads",
+        type=int,
+        nargs="?",
+        const=pipeline.FETCH_THREADS,
+        metavar="THREADS",
+        help="fetch the pages and update Notion with threads, the worker processes only parsing the pages",
+    )
+    parser.add_argument(
+        "--store",
+        default=store.STORE_FILE,
+        metavar="FILE",
+        help="the local SQLite database keeping every fetched word",
+    )
+    parser.add_argument(
+        "--no-store",
+        action="store_true",
+        help="do not keep the fetched words in the local database",
+    )
+    parser.add_argument(
+        "--dead-letter",
+        default=dead_letter.DEAD_LETTER_FILE,
+        metavar="FILE",
+        help="the local SQLite database keeping the failed words until they are sent again",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep running and add the new words as soon as they are written",
+    )
+    parser.add_argument(
+        "--spool",
+        metavar="DIRECTORY",
+        help="with --watch, also add the words of the files dropped in this directory",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=2.0,
+        metavar="SECONDS",
+        help="with --watch, the time between two checks for new words",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="keep running and add the words sent to the local HTTP API",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="with --serve, the address to listen to"
+    )
+    parser.add_argument(
+        "--port", type=int, default=8080, help="with --serve, the port to listen to"
+    )
+    parser.add_argument(
+        "--crawl",
+        type=int,
+        metavar="DEPTH",
+        help="also add the synonyms of the words, up to this number of hops",
+    )
+    parser.add_argument(
+        "--crawl-max",
+        type=int,
+        default=100,
+        metavar="WORDS",
+        help="with --crawl, the maximum number of discovered words",
+    )
+    parser.add_argument(
+        "--crawl-lang",
+        type=lambda value: {lang.strip().lower() for lang in value.split(",")},
+        metavar="LANGUAGES",
+        help="with --crawl, the comma-separated languages to expand",
+    )
+    parser.add_argument(
+        "--refresh",
+        type=int,
+        metavar="WORDS",
+        help="fetch again this number of the words synchronized the longest time ago, and update the changed ones",
+    )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=300,
+        metavar="REQUESTS",
+        help="with --refresh, the maximum number of requests sent to Notion",
+    )
+    parser.add_argument(
+        "--export",
+        metavar="FILE",
+        help="write the Notion payloads of the words to this .ndjson.gz file, without updating Notion",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="FILE",
+        help="publish the payloads of an --export file to Notion, resuming where it stopped",
+    )
+    parser.add_argument(
+        "--max-duration",
+        type=deadline.parse_duration,
+        metavar="DURATION",
+        help="stop sending new words when the estimated time would exceed this duration (like 90s, 45m or 2h), and leave them for the next run",
+    )
+    return parser
+
+
+def run_once(
+    word_pipeline: pipeline.Pipeline,
+    dead_letters: dead_letter.DeadLetterStore | None = None,
+    run_deadline: deadline.Deadline | None = None,
+) -> None:
+    """Add every word of WORDS.md and the due failed words, deleting the handled ones from WORDS.md as they finish.
+
+    Args:
+        word_pipeline (pipeline.Pipeline): The pipeline processing the words.
+        dead_letters (dead_letter.DeadLetterStore | None, optional): The store of the failed words. Defaults to keeping them in WORDS.md.
+        run_deadline (deadline.Deadline | None, optional): The deadline of the run, the words which would exceed it being left in WORDS.md. Defaults to no deadline.
+    """
+    words = word_list.get_due_words(
+        word_list.get_valid_words(
+            WORDS_FILE, WORDS_INDEX, dead_letters, with_priority=True
+        ),
+        dead_letters,
+    )
     success_words = []
-    with multiprocessing.Pool(processes=PROCESSES) as pool:
-        general_logger.debug("Starting multiprocessing with %i processes.", PROCESSES)
+    try:
         with alive_progress.alive_bar(
             total=len(words), title="Progress", dual_line=True
         ) as progress_bar:
             progress_bar.text = "Processing... Please wait."
-            return_words = pool.starmap(
-                worker_process, zip(words, itertools.repeat(session))
+            results = (
+                word_pipeline.run(words)
+                if run_deadline is None
+                else run_deadline.run(word_pipeline, words)
             )
-            for word in return_words:
-                if "success" == word[2]:
-                    general_logger.info(
-                        'The word "%s" has successfully been added for the language "%s".',
-                        word[0],
-                        word[1],
-                    )
-                    success_words.append(word[0])
-                elif "failure" == word[2]:
-                    general_logger.warning(
-                        'An error has been encountered trying to add the word "%s" for the language "%s". Error type: %s. Message: %s',
-                        word[0],
-                        word[1],
-                        word[3].__class__.__name__,
-                        word[3],
-                    )
-                else:
-                    general_logger.critical(
-                        'An unexpected error occurred trying to add the word "%s" for the language "%s". Error type : %s. Message: %s',
-                        word[0],
-                        word[1],
-                        word[3].__class__.__name__,
-                        word[3],
-                    )
-
+            for result in results:
+                if word_list.handle_result(result, dead_letters):
+                    success_words.append((result[0], result[1]))
+                if len(success_words) >= CHECKPOINT_BATCH:
+                    word_list.delete_word(success_words, WORDS_FILE, WORDS_INDEX)
+                    success_words = []
                 progress_bar()
+    finally:
+        # The handled words are deleted even when the run is stopped, so that they are not sent again.
+        word_list.delete_word(success_words, WORDS_FILE, WORDS_INDEX)
+    if run_deadline is not None:
+        report_deferred(run_deadline)
+
 
-    delete_word(success_words, "WORDS.md", 4)
-    general_logger.info("Done!")
+def report_deferred(run_deadline: deadline.Deadline) -> None:
+    """Log the summary of the words deferred to the next run.
+
+    Args:
+        run_deadline (deadline.Deadline): The deadline of the run.
+    """
+    summary = run_deadline.get_summary()
+    if not summary["deferred"]:
+        general_logger.info("Every word has been processed before the deadline.")
+        return
+    for word in run_deadline.deferred:
+        general_logger.debug('Deferred "%s" in "%s".', word[0], word[1])
+    languages_text = ", ".join(
+        f"{count} in {lang}" for lang, count in sorted(summary["languages"].items())
+    )
+    if summary["eta"] is None:
+        general_logger.info(
+            "%i word(s) deferred to the next run (%s), no throughput measured.",
+            summary["deferred"],
+            languages_text,
+        )
+        return
+    general_logger.info(
+        "%i word(s) deferred to the next run (%s), about %.0f second(s) at %.2f word(s) per second.",
+        summary["deferred"],
+        languages_text,
+        summary["eta"],
+        summary["rate"],
+    )
 
 
-def get_words_to_find(file_name: str, index: int, default_lang="en") -> list[str]:
-    """Get the list of words you want to fetch data for, and their corresponding languages.
+def run_crawl(
+    word_pipeline: pipeline.Pipeline,
+    depth: int,
+    max_words: int,
+    crawl_languages: set[str] | None,
+    dead_letters: dead_letter.DeadLetterStore | None = None,
+) -> None:
+    """Add every word of WORDS.md and the words discovered through their synonyms.
 
     Args:
-        file_name (str): The file name containing the words.
-        index (int): The number of lines that should be ignored at the beginning of the file.
-        default_lang (str, optional): The default word language. Defaults to "en".
+        word_pipeline (pipeline.Pipeline): The pipeline processing the words.
+        depth (int): The maximum number of synonym hops from a word of WORDS.md.
+        max_words (int): The maximum number of discovered words.
+        crawl_languages (set[str] | None): The languages to expand. Defaults to every language.
+        dead_letters (dead_letter.DeadLetterStore | None, optional): The store of the failed words. Defaults to keeping them in WORDS.md.
+    """
+    # Imported here, as it is only needed by this mode.
+    from notion_word_data import crawl
 
-    Raises:
-        errors.InvalidDeclaration: An exception to indicate that a declaration in WORDS.md is invalid.
+    seeds = word_list.get_due_words(
+        word_list.get_valid_words(WORDS_FILE, WORDS_INDEX, dead_letters), dead_letters
+    )
+    seed_keys = {tuple(seed) for seed in seeds}
+    try:
+        word_pipeline.index.refresh(pipeline.requests.Session())
+    except Exception as error:  # pylint: disable=broad-except
+        general_logger.warning(
+            "The Notion index could not be refreshed, existing words may be added again. Error type: %s. Message: %s",
+            error.__class__.__name__,
+            error,
+        )
+    success_words = []
+    try:
+        with alive_progress.alive_bar(
+            total=len(seeds) + max_words, title="Crawling", dual_line=True
+        ) as progress_bar:
+            progress_bar.text = "Processing... Please wait."
+            crawler = crawl.Crawler(word_pipeline, depth, max_words, crawl_languages)
+            for result in crawler.run(seeds):
+                # Only the failures of the seed words are kept, as the others can be discovered again.
+                is_seed = (result[0], result[1]) in seed_keys
+                if (
+                    word_list.handle_result(result, dead_letters if is_seed else None)
+                    and is_seed
+                ):
+                    success_words.append((result[0], result[1]))
+                progress_bar()
+    finally:
+        word_list.delete_word(success_words, WORDS_FILE, WORDS_INDEX)
 
-    Returns:
-        list[str]: A list containing each word to find, and its language.
+
+def run_export(word_pipeline: pipeline.Pipeline, file_name: str) -> None:
+    """Write the Notion payloads of every word of WORDS.md to a file, keeping WORDS.md as it is.
+
+    Args:
+        word_pipeline (pipeline.Pipeline): The pipeline processing the words, in dry run.
+        file_name (str): The file name of the export.
     """
-    general_logger.debug("Searching for words.")
-    words_list = []
-    with open(file_name, "r", encoding="utf-8") as file:
-        lines = file.readlines()[index:]
-        for line in lines:
-            try:
-                data = line.split(",")
-                data[-1] = data[-1].strip().replace("\n", "")
-                if data[-1] == "":
-                    data.pop()
-                if len(data) > 2 or not data:
-                    line_index = lines.index(line) + index + 1
-                    raise errors.InvalidDeclaration(data, line_index)
-                if len(data) < 2:
-                    data.append(default_lang)
-            except errors.InvalidDeclaration as error:
-                general_logger.warning(
-                    "An error has been encountered trying to get the words in WORDS.md. Error type: %s. Message: %s",
-                    error.__class__.__name__,
-                    error,
+    # Imported here, as it is only needed by this mode.
+    from notion_word_data import export
+
+    words = word_list.get_valid_words(WORDS_FILE, WORDS_INDEX)
+    with export.PayloadWriter(file_name) as writer, alive_progress.alive_bar(
+        total=len(words), title="Exporting", dual_line=True
+    ) as progress_bar:
+        progress_bar.text = "Processing... Please wait."
+        for result in word_pipeline.run(words):
+            if "success" == result[2]:
+                writer.write(result[0], result[1], result[3])
+                general_logger.info(
+                    'The word "%s" has successfully been exported for the language "%s".',
+                    result[0],
+                    result[1],
                 )
-                exception_logger.exception("Caught an expected error.", exc_info=True)
             else:
-                general_logger.debug("OK %s", data)
-                words_list.append(
-                    [
-                        utils.prettify(data[0].replace("\n", "")),
-                        utils.prettify(data[1].replace("\n", "")).lower(),
-                    ]
-                )
-    general_logger.debug("Found %i word(s).", len(words_list))
-    return words_list
+                pipeline.log_result(result)
+            progress_bar()
 
 
-def delete_word(words: list[str], file_name: str, index: int) -> None:
-    """Delete the words in a file from a given list.
+def run_refresh(
+    word_pipeline: pipeline.Pipeline,
+    word_store: store.WordStore,
+    limit: int,
+    budget: int,
+) -> None:
+    """Fetch the stalest words of the store again, and update their pages if they have changed.
 
     Args:
-        words (list[str]): The words to be deleted.
-        file_name (str): The file name containing the words.
-        index (int): The number of lines that should be ignored at the beginning of the file.
+        word_pipeline (pipeline.Pipeline): The pipeline processing the words, in dry run.
+        word_store (store.WordStore): The store of the words.
+        limit (int): The maximum number of words to be fetched.
+        budget (int): The maximum number of requests sent to Notion.
     """
-    general_logger.debug("Deleting %i word(s).", len(words))
-    with open(file_name, "r", encoding="utf-8") as file:
-        lines = file.readlines()
-        first_lines = lines[:index]
-        other_lines = lines[index:]
-    with open(file_name, "w", encoding="utf-8") as file:
-        for first_line in first_lines:
-            file.write(first_line)
-        for other_line in other_lines:
-            if not any(word in other_line.replace("\n", "") for word in words):
-                file.write(other_line)
-    general_logger.debug("Deleted %s.", words)
-
-
-def worker_process(
-    word: list[str],
-    session: requests.sessions.Session,
-) -> list[str]:
-    """The process that will be repeated by the multiprocessing's workers.
+    # Imported here, as it is only needed by this mode.
+    from notion_word_data import refresh
 
-    Args:
-        word (list[str]): A list containing the word and the language to be processed.
-        session (requests.sessions.Session): The session used to process the request.
+    refresher = refresh.Refresher(word_pipeline, word_store, budget)
+    with alive_progress.alive_bar(
+        total=limit, title="Refreshing", dual_line=True
+    ) as progress_bar:
+        progress_bar.text = "Processing... Please wait."
+        for result in refresher.run(limit):
+            if result[2] in ("unchanged", "deferred"):
+                general_logger.debug(
+                    'The word "%s" is %s for the language "%s".',
+                    result[0],
+                    result[2],
+                    result[1],
+                )
+            else:
+                pipeline.log_result(result)
+            progress_bar()
+    general_logger.info(
+        "Refreshed %i word(s): %i updated, %i unchanged, %i deferred by the budget, %i failed, with %i request(s).",
+        sum(refresher.counts.values()),
+        refresher.counts["updated"],
+        refresher.counts["unchanged"],
+        refresher.counts["deferred"],
+        refresher.counts["failed"],
+        refresher.get_used(),
+    )
 
-    Returns:
-        list[str]: A list containing the word name, its language and the result of the process.
+
+def run_replay(file_name: str) -> None:
+    """Publish the payloads of an export file, then delete the published words from WORDS.md.
+
+    Args:
+        file_name (str): The file name of the export.
     """
-    word_name = word[0]
-    word_lang = word[1]
+    # Imported here, as it is only needed by this mode.
+    from notion_word_data import export
+
+    success_words = []
     try:
-        notion.NotionSync(
-            word_data.WordData(word_name, word_lang, session).data, session
-        )
-    except errors.CustomException as error:
-        exception_logger.exception("Caught an expected error.", exc_info=True)
-        return [word_name, word_lang, "failure", error]
-    except Exception as error:
-        exception_logger.exception("Caught an unexpected error.", exc_info=True)
-        return [word_name, word_lang, error]
-    else:
-        exception_logger.debug("No error caught.")
-        return [word_name, word_lang, "success"]
+        with alive_progress.alive_bar(
+            title="Replaying", dual_line=True
+        ) as progress_bar:
+            progress_bar.text = "Publishing... Please wait."
+            for result in export.Replayer(file_name).run():
+                if pipeline.log_result(result):
+                    success_words.append((result[0], result[1]))
+                progress_bar()
+    finally:
+        word_list.delete_word(success_words, WORDS_FILE, WORDS_INDEX)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,220 @@
+"""A custom module to archive the duplicate pages of the Notion databases.
+
+Each database is scanned once, and its pages are grouped by exact title. The page of each
+group with its informations filled, and the most recently edited, is kept, and the others
+are archived (they can still be restored from the trash of Notion).
+
+Usage:
+    python -m notion_word_data.cleanup --dry-run
+    python -m notion_word_data.cleanup --archive-empty
+"""
+
+from __future__ import annotations
+
+# System imports
+import argparse
+import concurrent.futures
+import itertools
+import threading
+import time
+import zlib
+
+# Custom imports
+from notion_word_data import logs, notion, throttle, utils
+
+# Third party imports
+requests = utils.lazy_import("requests")
+
+general_logger = logs.setup_logging_general(f"{__name__}.general")
+exception_logger = logs.setup_logging_exception(f"{__name__}.exception")
+
+# The number of pages archived between two progress reports.
+CLEANUP_BATCH = 50
+
+
+def select_survivor(entries: list[dict]) -> tuple[dict, list[dict]]:
+    """Select the page to be kept among the pages of a title.
+
+    Args:
+        entries (list[dict]): The indexed informations of the pages.
+
+    Returns:
+        tuple[dict, list[dict]]: The page to be kept, and the others.
+    """
+    ranked = sorted(
+        entries,
+        key=lambda entry: (entry["has_infos"], entry["last_edited_time"]),
+        reverse=True,
+    )
+    return ranked[0], ranked[1:]
+
+
+class GarbageCollector:
+    """A class to find the duplicate pages of the Notion databases, and to archive them."""
+
+    def __init__(self, archive_empty: bool = False) -> None:
+        """The initialization function of GarbageCollector.
+
+        Args:
+            archive_empty (bool, optional): True to also archive the only page of a title if its informations are empty. Defaults to False.
+        """
+        self.archive_empty = archive_empty
+        self.index = notion.NotionIndex()
+        # The integrations able to write to each database, which share its pages.
+        self.integrations = {}
+        for integration in notion.get_integrations():
+            self.integrations.setdefault(integration.database_id, []).append(
+                integration
+            )
+        notion.set_rate_limiters(
+            {
+                integration.name: throttle.RateLimiter(notion.NOTION_RATE)
+                for integrations in self.integrations.values()
+                for integration in integrations
+            }
+        )
+        # A session by thread, as a session should not be shared between threads.
+        self.local = threading.local()
+        # Loads requests before the threads start, as a lazy module must not be loaded by two threads at once.
+        self.get_session()
+
+    def get_session(self) -> requests.sessions.Session:
+        """Get the session of the current thread.
+
+        Returns:
+            requests.sessions.Session: The session.
+        """
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+        return self.local.session
+
+    def get_garbage(self) -> list[dict]:
+        """Scan the databases and get the pages to be archived.
+
+        Returns:
+            list[dict]: The indexed informations of the pages to be archived.
+        """
+        self.index.refresh(self.get_session())
+        garbage = []
+        for entries in self.index.pages.values():
+            by_database = {}
+            for entry in entries:
+                by_database.setdefault(entry["database_id"], []).append(entry)
+            for database_entries in by_database.values():
+                survivor, others = select_survivor(database_entries)
+                garbage.extend(others)
+                if self.archive_empty and not survivor["has_infos"]:
+                    garbage.append(survivor)
+        return garbage
+
+    def archive_entry(self, entry: dict) -> Exception | None:
+        """Archive a page, with one of the integrations of its database.
+
+        Args:
+            entry (dict): The indexed informations of the page.
+
+        Returns:
+            Exception | None: The error which prevented the page from being archived, if any.
+        """
+        integrations = self.integrations[entry["database_id"]]
+        integration = integrations[
+            zlib.crc32(entry["id"].encode("utf-8")) % len(integrations)
+        ]
+        try:
+            notion.NotionSync.archive_page(
+                entry["id"],
+                notion.get_headers(integration),
+                self.get_session(),
+                integration,
+            )
+        except Exception as error:  # pylint: disable=broad-except
+            exception_logger.exception("Caught an unexpected error.", exc_info=True)
+            return error
+        return None
+
+    def archive(self, garbage: list[dict]):
+        """Archive pages, with as many requests in flight as the rate limits allow.
+
+        Args:
+            garbage (list[dict]): The indexed informations of the pages to be archived.
+
+        Yields:
+            tuple[dict, Exception | None]: Each page, and the error which prevented it from being archived, if any.
+        """
+        workers = notion.NOTION_RATE * sum(map(len, self.integrations.values()))
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            entries = iter(garbage)
+            while batch := list(itertools.islice(entries, CLEANUP_BATCH)):
+                yield from zip(batch, executor.map(self.archive_entry, batch))
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Archive the duplicate pages from the command line.
+
+    Args:
+        argv (list[str] | None, optional): The command line arguments. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(
+        description="Archive the duplicate pages of the Notion databases."
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="only report the pages which would be archived",
+    )
+    parser.add_argument(
+        "--archive-empty",
+        action="store_true",
+        help="also archive the only page of a word if its informations are empty",
+    )
+    args = parser.parse_args(argv)
+
+    logs.start_listener()
+    try:
+        start = time.monotonic()
+        collector = GarbageCollector(args.archive_empty)
+        garbage = collector.get_garbage()
+        pages = sum(map(len, collector.index.pages.values()))
+        general_logger.info(
+            "Scanned %i page(s) with %i title(s), %i page(s) to be archived.",
+            pages,
+            len(collector.index),
+            len(garbage),
+        )
+        if args.dry_run:
+            for entry in garbage:
+                general_logger.info(
+                    "%s: %s (%s)",
+                    entry["title"],
+                    entry["id"],
+                    entry["last_edited_time"],
+                )
+            return
+        archived = 0
+        failed = 0
+        for position, (entry, error) in enumerate(collector.archive(garbage), 1):
+            if error is None:
+                archived += 1
+            else:
+                failed += 1
+                general_logger.warning(
+                    'The page %s of "%s" could not be archived. Error type: %s. Message: %s',
+                    entry["id"],
+                    entry["title"],
+                    error.__class__.__name__,
+                    error,
+                )
+            if position % CLEANUP_BATCH == 0:
+                general_logger.info("Archived %i/%i page(s).", position, len(garbage))
+        general_logger.info(
+            "Archived %i page(s), %i failed, in %.1f second(s).",
+            archived,
+            failed,
+            time.monotonic() - start,
+        )
+    finally:
+        logs.stop_listener()
+
+
+if __name__ == "__main__":
+    main()
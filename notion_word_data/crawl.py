@@ -0,0 +1,128 @@
+"""A custom module to expand the vocabulary database through the synonyms of some seed words."""
+
+# System imports
+import collections
+
+# Custom imports
+from notion_word_data import logs, pipeline, utils
+
+general_logger = logs.setup_logging_general(f"{__name__}.general")
+
+
+def get_synonyms(data: dict) -> list[str]:
+    """Get every synonym of a word, in order of appearance and without duplicates.
+
+    Args:
+        data (dict): The data of the word, as set by WordData.
+
+    Returns:
+        list[str]: The synonyms.
+    """
+    synonyms = {}
+    for definitions in data[utils.dict_get_element_by_index(data, 0)].values():
+        for _, definition_synonyms in definitions.values():
+            synonyms.update(dict.fromkeys(definition_synonyms))
+    return list(synonyms)
+
+
+class Crawler:
+    """A class to do a bounded breadth-first expansion from seed words through their synonyms.
+
+    The frontier only holds admitted words, so it never holds more than max_words words,
+    and they are streamed to the pipeline with a bounded number of words in flight.
+    """
+
+    def __init__(
+        self,
+        word_pipeline: pipeline.Pipeline,
+        depth: int,
+        max_words: int,
+        languages: set[str] | None = None,
+    ) -> None:
+        """The initialization function of Crawler.
+
+        Args:
+            word_pipeline (pipeline.Pipeline): The pipeline processing the words.
+            depth (int): The maximum number of synonym hops from a seed word.
+            max_words (int): The maximum number of discovered words to be added.
+            languages (set[str] | None, optional): The languages whose words are expanded. Defaults to every language.
+        """
+        self.pipeline = word_pipeline
+        self.depth = depth
+        self.max_words = max_words
+        self.languages = languages
+        self.window = word_pipeline.processes * 2
+        self.seen = set()
+        self.frontier = collections.deque()
+        self.depths = {}
+        self.discovered = 0
+
+    def admit(self, word: list[str], depth: int) -> None:
+        """Add a word to the frontier, unless it is already known or over the limit.
+
+        Args:
+            word (list[str]): A list containing the word and its language.
+            depth (int): The number of synonym hops from a seed word.
+        """
+        key = tuple(word)
+        if key in self.seen:
+            return
+        if depth > 0:
+            if self.discovered >= self.max_words:
+                return
+            self.seen.add(key)
+            in_notion = word[0] in self.pipeline.index
+            if in_notion and self.pipeline.get_cached(word) is None:
+                general_logger.debug('Skipping "%s", already in Notion.', word[0])
+                return
+            self.discovered += 1
+        else:
+            self.seen.add(key)
+        self.frontier.append((word, depth))
+
+    def expand(self, word: list[str], data: dict, depth: int) -> None:
+        """Admit the synonyms of a word.
+
+        Args:
+            word (list[str]): A list containing the word and its language.
+            data (dict): The data of the word.
+            depth (int): The number of synonym hops from a seed word to this word.
+        """
+        if depth >= self.depth:
+            return
+        if self.languages is not None and word[1] not in self.languages:
+            return
+        for synonym in get_synonyms(data):
+            self.admit([utils.prettify(synonym), word[1]], depth + 1)
+
+    def run(self, seeds: list[list[str]]):
+        """Add the seed words, then the words discovered through their synonyms.
+
+        Args:
+            seeds (list[list[str]]): A list containing each seed word and its language.
+
+        Yields:
+            list: The result of each word processed by the pipeline, in completion order.
+        """
+        for seed in seeds:
+            self.admit(seed, 0)
+        while self.frontier or self.pipeline.in_flight:
+            while self.frontier and len(self.pipeline.in_flight) < self.window:
+                word, depth = self.frontier.popleft()
+                data = self.pipeline.get_cached(word)
+                if data is not None and depth > 0:
+                    # Already fetched and written, only its synonyms are needed.
+                    self.expand(word, data, depth)
+                    continue
+                self.depths[tuple(word)] = depth
+                self.pipeline.submit(word)
+            if not self.pipeline.in_flight:
+                continue
+            result = self.pipeline.get_result()
+            depth = self.depths.pop((result[0], result[1]), self.depth)
+            if "success" == result[2]:
+                self.expand(result, result[3], depth)
+            yield result
+        general_logger.debug(
+            "Crawled %i word(s), %i discovered.", len(self.seen), self.discovered
+        )
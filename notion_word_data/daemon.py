@@ -0,0 +1,166 @@
+"""A custom module to keep adding the new words of WORDS.md as they are written."""
+
+# System imports
+import os
+import signal
+import threading
+import time
+
+# Custom imports
+from notion_word_data import dead_letter, logs, pipeline, word_list
+
+general_logger = logs.setup_logging_general(f"{__name__}.general")
+exception_logger = logs.setup_logging_exception(f"{__name__}.exception")
+
+# The time after which the Notion index is scanned again, in seconds.
+INDEX_TTL = 3600
+
+
+class Daemon:
+    """A class to watch WORDS.md and a spool directory, and send their new words to a warm pipeline."""
+
+    def __init__(
+        self,
+        word_pipeline: pipeline.Pipeline,
+        file_name: str,
+        index: int,
+        spool_dir: str | None = None,
+        interval: float = 2.0,
+        dead_letters: dead_letter.DeadLetterStore | None = None,
+    ) -> None:
+        """The initialization function of Daemon.
+
+        Args:
+            word_pipeline (pipeline.Pipeline): The pipeline processing the words.
+            file_name (str): The file name containing the words.
+            index (int): The number of lines that should be ignored at the beginning of the file.
+            spool_dir (str | None, optional): The directory where other files of words can be dropped. Defaults to None.
+            interval (float, optional): The time between two checks for new words, in seconds. Defaults to 2.0.
+            dead_letters (dead_letter.DeadLetterStore | None, optional): The store of the failed words. Defaults to keeping them in WORDS.md.
+        """
+        self.pipeline = word_pipeline
+        self.file_name = file_name
+        self.index = index
+        self.spool_dir = spool_dir
+        self.interval = interval
+        self.dead_letters = dead_letters
+        self.stopping = threading.Event()
+        self.file_mtime = None
+        # The words which failed, not sent again until they are written again.
+        self.failed = set()
+
+    def stop(self, *_) -> None:
+        """Stop accepting new words, and finish the ones in flight."""
+        if not self.stopping.is_set():
+            general_logger.info("Stopping after the words in flight...")
+        self.stopping.set()
+
+    def run(self) -> None:
+        """Process the new words until a SIGINT or a SIGTERM is received."""
+        previous_handlers = {
+            signum: signal.signal(signum, self.stop)
+            for signum in (signal.SIGINT, signal.SIGTERM)
+        }
+        general_logger.info("Watching %s for new words.", self.file_name)
+        try:
+            while not self.stopping.is_set():
+                self.refresh_index()
+                self.read_spool()
+                self.read_words()
+                self.read_dead_letters()
+                self.handle_results(self.interval)
+            # The queued words are left in WORDS.md and in the dead letters for the next start.
+            self.pipeline.drop_queued()
+            while self.pipeline.in_flight:
+                self.handle_results(self.interval)
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+    def refresh_index(self) -> None:
+        """Scan the Notion database again if the index is too old."""
+        refreshed_at = self.pipeline.index.refreshed_at
+        if refreshed_at is not None and time.time() - refreshed_at < INDEX_TTL:
+            return
+        try:
+            self.pipeline.index.refresh(pipeline.requests.Session())
+        except Exception as error:  # pylint: disable=broad-except
+            general_logger.warning(
+                "The Notion index could not be refreshed. Error type: %s. Message: %s",
+                error.__class__.__name__,
+                error,
+            )
+            exception_logger.exception("Caught an unexpected error.", exc_info=True)
+            # Try again later rather than on every check.
+            self.pipeline.index.refreshed_at = time.time()
+
+    def read_spool(self) -> None:
+        """Move the words of the files dropped in the spool directory to WORDS.md."""
+        if self.spool_dir is None or not os.path.isdir(self.spool_dir):
+            return
+        entries = sorted(os.scandir(self.spool_dir), key=lambda entry: entry.name)
+        for entry in entries:
+            if not entry.is_file() or entry.name.startswith("."):
+                continue
+            with open(entry.path, "r", encoding="utf-8") as file:
+                lines = [line.strip() for line in file if line.strip()]
+            if lines:
+                with open(self.file_name, "a+", encoding="utf-8") as file:
+                    file.seek(0, os.SEEK_END)
+                    if file.tell():
+                        file.seek(file.tell() - 1)
+                        if file.read(1) != "\n":
+                            file.write("\n")
+                    file.write("\n".join(lines) + "\n")
+            os.remove(entry.path)
+            general_logger.debug("Spooled %i line(s) from %s.", len(lines), entry.name)
+
+    def read_words(self) -> None:
+        """Send the new words of WORDS.md to the pipeline, if it has changed."""
+        mtime = os.stat(self.file_name).st_mtime_ns
+        if mtime == self.file_mtime:
+            return
+        self.file_mtime = mtime
+        words = word_list.get_valid_words(
+            self.file_name, self.index, self.dead_letters, with_priority=True
+        )
+        keys = {tuple(word[:2]) for word in words}
+        self.failed &= keys
+        for word in words:
+            if tuple(word[:2]) not in self.failed:
+                self.pipeline.submit(word, dispatch=False)
+        self.pipeline.dispatch()
+
+    def read_dead_letters(self) -> None:
+        """Send the failed words whose next attempt is due to the pipeline."""
+        if self.dead_letters is None:
+            return
+        # The words already in flight are not sent twice.
+        for word in self.dead_letters.get_due():
+            self.pipeline.submit(word)
+
+    def handle_results(self, timeout: float) -> None:
+        """Handle the results of the workers, deleting the successful words from WORDS.md.
+
+        Args:
+            timeout (float): The time to spend waiting for results, in seconds.
+        """
+        deadline = time.monotonic() + timeout
+        success_words = []
+        try:
+            while self.pipeline.in_flight:
+                result = self.pipeline.get_result(max(0.0, deadline - time.monotonic()))
+                if result is None:
+                    break
+                if word_list.handle_result(result, self.dead_letters):
+                    success_words.append((result[0], result[1]))
+                else:
+                    self.failed.add((result[0], result[1]))
+            else:
+                self.stopping.wait(max(0.0, deadline - time.monotonic()))
+        finally:
+            # The handled words are deleted even when the daemon is stopped by a configuration error.
+            if success_words:
+                word_list.delete_word(success_words, self.file_name, self.index)
+                # Read the file again, in case new words were written meanwhile.
+                self.file_mtime = None
@@ -0,0 +1,306 @@
+"""A custom module to keep the words which failed, and to send them again when it may succeed.
+
+The transient failures (rate limits, server errors, timeouts...) are sent again after
+a delay growing with each attempt, until MAX_ATTEMPTS. The permanent ones, like a misspelled
+word, are parked until they are replayed from the command line.
+
+Usage:
+    python -m notion_word_data.dead_letter list --status parked
+    python -m notion_word_data.dead_letter replay Test --lang en
+    python -m notion_word_data.dead_letter replay --all
+"""
+
+from __future__ import annotations
+
+# System imports
+import argparse
+import contextlib
+import sqlite3
+import time
+
+# Custom imports
+from notion_word_data import errors, logs, notion, utils
+
+# Third party imports
+requests = utils.lazy_import("requests")
+
+general_logger = logs.setup_logging_general(f"{__name__}.general")
+
+DEAD_LETTER_FILE = "dead_letter.sqlite3"
+# The delay before the first new attempt, doubled for each attempt, in seconds.
+BASE_DELAY = 60
+MAX_DELAY = 6 * 3600
+# The number of attempts after which a transient failure is parked too.
+MAX_ATTEMPTS = 8
+# The errors caused by the configuration, which every word would fail with.
+CONFIGURATION_ERRORS = (errors.InvalidToken, errors.InvalidDatabaseID)
+# The status codes of the Notion API refusing the token of an integration.
+CONFIGURATION_STATUS_CODES = (401, 403)
+# An unknown layout needs a new extraction profile, so it is not tried again until it is replayed.
+PERMANENT_ERRORS = (
+    errors.InvalidWord,
+    errors.InvalidDeclaration,
+    errors.InvalidLanguage,
+    errors.UnknownLayout,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dead_letters (
+    word TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    error TEXT NOT NULL,
+    message TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    first_failed_at REAL NOT NULL,
+    last_failed_at REAL NOT NULL,
+    next_attempt_at REAL,
+    PRIMARY KEY (word, lang)
+);
+CREATE INDEX IF NOT EXISTS dead_letters_next_attempt ON dead_letters (next_attempt_at);
+"""
+
+
+def classify(error: Exception) -> str:
+    """Classify an error, depending on whether the same word may succeed later.
+
+    Args:
+        error (Exception): The error returned by pipeline.worker_process.
+
+    Returns:
+        str: "permanent" or "transient".
+    """
+    if isinstance(error, PERMANENT_ERRORS):
+        return "permanent"
+    if isinstance(error, requests.HTTPError):
+        status_code = getattr(error.response, "status_code", None)
+        if status_code is not None and status_code != 429 and status_code < 500:
+            return "permanent"
+    # Timeouts, connection errors and the unexpected errors are tried again, up to MAX_ATTEMPTS.
+    return "transient"
+
+
+def is_configuration_error(error: Exception) -> bool:
+    """Check if an error is caused by the configuration rather than by the word.
+
+    Args:
+        error (Exception): The error returned by pipeline.worker_process.
+
+    Returns:
+        bool: True if every word would fail with this error, False otherwise.
+    """
+    if isinstance(error, CONFIGURATION_ERRORS):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in CONFIGURATION_STATUS_CODES and (
+            error.response.url or ""
+        ).startswith(notion.NOTION_ENDPOINT_API)
+    return False
+
+
+def get_delay(attempts: int) -> float:
+    """Get the delay before the next attempt.
+
+    Args:
+        attempts (int): The number of attempts which already failed.
+
+    Returns:
+        float: The delay, in seconds.
+    """
+    return min(BASE_DELAY * 2 ** (attempts - 1), MAX_DELAY)
+
+
+class DeadLetterStore:
+    """A class to keep the failed words in an SQLite database, with their next attempt."""
+
+    def __init__(self, file_name: str = DEAD_LETTER_FILE) -> None:
+        """The initialization function of DeadLetterStore.
+
+        Args:
+            file_name (str, optional): The file name of the database. Defaults to DEAD_LETTER_FILE.
+        """
+        self.file_name = file_name
+        with self.connect() as connection:
+            connection.executescript(SCHEMA)
+
+    @contextlib.contextmanager
+    def connect(self):
+        """Open a transaction in a new connection.
+
+        Yields:
+            sqlite3.Connection: The connection, committed and closed when leaving.
+        """
+        connection = sqlite3.connect(self.file_name, timeout=30)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def add(self, word: str, lang: str, error: Exception) -> dict:
+        """Add a failed attempt of a word, and schedule the next one.
+
+        Args:
+            word (str): The word.
+            lang (str): The language code.
+            error (Exception): The error of the attempt.
+
+        Returns:
+            dict: The entry of the word.
+        """
+        now = time.time()
+        kind = classify(error)
+        with self.connect() as connection:
+            row = connection.execute(
+                "SELECT attempts, first_failed_at FROM dead_letters "
+                "WHERE word = ? AND lang = ?",
+                (word, lang),
+            ).fetchone()
+            attempts = row["attempts"] + 1 if row else 1
+            first_failed_at = row["first_failed_at"] if row else now
+            parked = kind == "permanent" or attempts >= MAX_ATTEMPTS
+            entry = {
+                "word": word,
+                "lang": lang,
+                "error": error.__class__.__name__,
+                "message": str(error),
+                "kind": kind,
+                "status": "parked" if parked else "scheduled",
+                "attempts": attempts,
+                "first_failed_at": first_failed_at,
+                "last_failed_at": now,
+                "next_attempt_at": None if parked else now + get_delay(attempts),
+            }
+            connection.execute(
+                "INSERT OR REPLACE INTO dead_letters VALUES "
+                "(:word, :lang, :error, :message, :kind, :status, :attempts, "
+                ":first_failed_at, :last_failed_at, :next_attempt_at)",
+                entry,
+            )
+        general_logger.debug(
+            'Dead-lettered "%s" in "%s" (%s, attempt %i).',
+            word,
+            lang,
+            entry["status"],
+            attempts,
+        )
+        return entry
+
+    def remove(self, word: str, lang: str) -> None:
+        """Remove a word, after it has succeeded.
+
+        Args:
+            word (str): The word.
+            lang (str): The language code.
+        """
+        with self.connect() as connection:
+            connection.execute(
+                "DELETE FROM dead_letters WHERE word = ? AND lang = ?", (word, lang)
+            )
+
+    def get_due(self, now: float | None = None) -> list[list[str]]:
+        """Get the scheduled words whose next attempt is due.
+
+        Args:
+            now (float | None, optional): The current time. Defaults to time.time().
+
+        Returns:
+            list[list[str]]: A list containing each due word and its language.
+        """
+        with self.connect() as connection:
+            rows = connection.execute(
+                "SELECT word, lang FROM dead_letters "
+                "WHERE status = 'scheduled' AND next_attempt_at <= ? "
+                "ORDER BY next_attempt_at",
+                (time.time() if now is None else now,),
+            ).fetchall()
+        return [[row["word"], row["lang"]] for row in rows]
+
+    def get_entries(self, status: str | None = None) -> list[dict]:
+        """Get the failed words.
+
+        Args:
+            status (str | None, optional): "scheduled" or "parked". Defaults to every word.
+
+        Returns:
+            list[dict]: The entry of each word, the most recent failures first.
+        """
+        with self.connect() as connection:
+            rows = connection.execute(
+                "SELECT * FROM dead_letters WHERE ? IS NULL OR status = ? "
+                "ORDER BY last_failed_at DESC",
+                (status, status),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def replay(self, word: str | None = None, lang: str | None = None) -> int:
+        """Schedule words for an immediate attempt, with their attempts reset.
+
+        Args:
+            word (str | None, optional): The word to be replayed. Defaults to every word.
+            lang (str | None, optional): The language of the word. Defaults to every language.
+
+        Returns:
+            int: The number of replayed words.
+        """
+        with self.connect() as connection:
+            # An invalid declaration must be fixed and written again in WORDS.md instead.
+            cursor = connection.execute(
+                "UPDATE dead_letters SET status = 'scheduled', attempts = 0, "
+                "next_attempt_at = ? "
+                "WHERE (? IS NULL OR word = ?) AND (? IS NULL OR lang = ?) "
+                "AND error != 'InvalidDeclaration'",
+                (time.time(), word, word, lang, lang),
+            )
+        return cursor.rowcount
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Inspect or replay the failed words from the command line.
+
+    Args:
+        argv (list[str] | None, optional): The command line arguments. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Inspect or replay the failed words.")
+    parser.add_argument(
+        "--dead-letter", default=DEAD_LETTER_FILE, help="the database file"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    list_parser = subparsers.add_parser("list", help="list the failed words")
+    list_parser.add_argument("--status", choices=("scheduled", "parked"))
+    replay_parser = subparsers.add_parser(
+        "replay", help="send failed words again on the next run"
+    )
+    replay_parser.add_argument("word", nargs="?")
+    replay_parser.add_argument("--lang")
+    replay_parser.add_argument(
+        "--all", action="store_true", help="replay every failed word"
+    )
+    args = parser.parse_args(argv)
+
+    dead_letters = DeadLetterStore(args.dead_letter)
+    if args.command == "list":
+        for entry in dead_letters.get_entries(args.status):
+            next_attempt = (
+                time.strftime(
+                    "%Y-%m-%d %H:%M:%S", time.localtime(entry["next_attempt_at"])
+                )
+                if entry["next_attempt_at"] is not None
+                else "parked"
+            )
+            print(
+                f"{entry['word']} ({entry['lang']}): {entry['error']}, "
+                f"{entry['kind']}, {entry['attempts']} attempt(s), next: {next_attempt}. "
+                f"{entry['message']}"
+            )
+    else:
+        if args.word is None and not args.all:
+            parser.error("replay needs a word or --all")
+        count = dead_letters.replay(args.word, args.lang)
+        print(f"{count} word(s) will be sent again on the next run.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""A custom module to process the words of a run within a maximum duration.
+
+The throughput of each stage is measured while the words are processed: the words finished
+per second, and the requests sent to Notion by word, as the Notion API cannot send more
+than the rate limits of the integrations. New words are only sent while the words in flight
+and the new word can be finished before the deadline, according to the slowest stage. The
+other words are deferred to the next run.
+"""
+
+from __future__ import annotations
+
+# System imports
+import collections
+import re
+import time
+
+# Custom imports
+from notion_word_data import logs, notion
+
+general_logger = logs.setup_logging_general(f"{__name__}.general")
+
+# The weight of the newest measure in the moving averages of the throughput.
+EWMA_ALPHA = 0.3
+# The minimum time between two measures, so that a burst of results is measured as a whole, in seconds.
+SAMPLE_INTERVAL = 1.0
+# The time kept on top of the estimates, to finish the words in flight, in seconds.
+SAFETY_MARGIN = 10.0
+DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600}
+
+
+def parse_duration(string: str) -> float:
+    """Parse a duration, like "90", "90s", "45m" or "1.5h".
+
+    Args:
+        string (str): The duration, in seconds without unit.
+
+    Raises:
+        ValueError: An exception to indicate that the duration is invalid.
+
+    Returns:
+        float: The duration, in seconds.
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*", string.lower())
+    if match is None or float(match.group(1)) <= 0:
+        raise ValueError(f"invalid duration: {string!r}")
+    return float(match.group(1)) * DURATION_UNITS[match.group(2)]
+
+
+def get_ewma(average: float | None, value: float) -> float:
+    """Add a measure to an exponentially weighted moving average.
+
+    Args:
+        average (float | None): The current average, or None without any measure yet.
+        value (float): The new measure.
+
+    Returns:
+        float: The new average.
+    """
+    if average is None:
+        return value
+    return EWMA_ALPHA * value + (1 - EWMA_ALPHA) * average
+
+
+class Deadline:
+    """A class estimating the time left to process words, and stopping to send new words before a deadline."""
+
+    def __init__(self, max_duration: float, margin: float = SAFETY_MARGIN) -> None:
+        """The initialization function of Deadline.
+
+        Args:
+            max_duration (float): The maximum duration of the run, from now, in seconds.
+            margin (float, optional): The time kept on top of the estimates, in seconds. Defaults to SAFETY_MARGIN.
+        """
+        self.max_duration = max_duration
+        self.margin = margin
+        self.started_at = time.monotonic()
+        self.ends_at = self.started_at + max_duration
+        # The number of requests per second of every integration, set by run.
+        self.notion_rate = None
+        self.word_rate = None
+        self.requests_per_word = None
+        self.measured_at = self.started_at
+        self.measured_words = 0
+        self.measured_requests = 0
+        self.deferred = []
+
+    def get_remaining(self, now: float | None = None) -> float:
+        """Get the time left before the deadline.
+
+        Args:
+            now (float | None, optional): The current time. Defaults to time.monotonic().
+
+        Returns:
+            float: The time left, in seconds, negative once the deadline has passed.
+        """
+        return self.ends_at - (time.monotonic() if now is None else now)
+
+    def observe(self, words: int, requests: int, now: float | None = None) -> None:
+        """Measure the throughput, from the number of words finished and Notion requests sent since the start.
+
+        Args:
+            words (int): The number of finished words.
+            requests (int): The number of requests sent to Notion.
+            now (float | None, optional): The current time. Defaults to time.monotonic().
+        """
+        now = time.monotonic() if now is None else now
+        elapsed = now - self.measured_at
+        new_words = words - self.measured_words
+        if new_words <= 0 or elapsed < SAMPLE_INTERVAL:
+            return
+        self.word_rate = get_ewma(self.word_rate, new_words / elapsed)
+        self.requests_per_word = get_ewma(
+            self.requests_per_word, (requests - self.measured_requests) / new_words
+        )
+        self.measured_at = now
+        self.measured_words = words
+        self.measured_requests = requests
+
+    def get_rate(self) -> float | None:
+        """Get the number of words which can be finished per second, limited by the slowest stage.
+
+        Returns:
+            float | None: The number of words per second, or None before the first measure.
+        """
+        if self.word_rate is None:
+            return None
+        if self.notion_rate and self.requests_per_word:
+            return min(self.word_rate, self.notion_rate / self.requests_per_word)
+        return self.word_rate
+
+    def get_eta(self, words: int) -> float | None:
+        """Get the estimated time to finish words.
+
+        Args:
+            words (int): The number of words.
+
+        Returns:
+            float | None: The time, in seconds, or None before the first measure.
+        """
+        rate = self.get_rate()
+        if rate is None:
+            return None
+        return words / rate
+
+    def can_admit(self, in_flight: int, now: float | None = None) -> bool:
+        """Check if a new word can be finished before the deadline, after the words in flight.
+
+        Args:
+            in_flight (int): The number of words in flight.
+            now (float | None, optional): The current time. Defaults to time.monotonic().
+
+        Returns:
+            bool: True if the word can be sent, False otherwise.
+        """
+        eta = self.get_eta(in_flight + 1)
+        # Before the first measure, only the margin is kept.
+        return (eta or 0.0) + self.margin < self.get_remaining(now)
+
+    def run(self, word_pipeline, words: list[list]):
+        """Process words in the order of the scheduler of the pipeline until the deadline nears, then finish the words in flight.
+
+        Args:
+            word_pipeline (pipeline.Pipeline): The pipeline processing the words.
+            words (list[list]): A list containing each word, its language and optionally its priority.
+
+        Yields:
+            list: The result of each word, in completion order. The words which were not sent are kept in deferred.
+        """
+        self.notion_rate = notion.NOTION_RATE * len(word_pipeline.integrations)
+        start_requests = word_pipeline.get_request_count()
+        finished = 0
+        # Every word is queued, so that the scheduler orders them by priority and language, and
+        # each word is only sent once the deadline admits it.
+        for word in words:
+            word_pipeline.submit(word, dispatch=False)
+        word_pipeline.admission = self.can_admit
+        try:
+            word_pipeline.dispatch()
+            while True:
+                if (
+                    len(word_pipeline.scheduler)
+                    and word_pipeline.dispatched < word_pipeline.window
+                    and not self.can_admit(word_pipeline.dispatched)
+                ):
+                    general_logger.info(
+                        "%.0f second(s) left, deferring %i word(s) and finishing the %i word(s) in flight.",
+                        self.get_remaining(),
+                        len(word_pipeline.scheduler),
+                        word_pipeline.dispatched,
+                    )
+                    self.deferred.extend(word_pipeline.drop_queued())
+                if not word_pipeline.in_flight:
+                    return
+                result = word_pipeline.get_result()
+                finished += 1
+                self.observe(
+                    finished, word_pipeline.get_request_count() - start_requests
+                )
+                yield result
+        finally:
+            word_pipeline.admission = None
+
+    def get_summary(self) -> dict:
+        """Get the summary of the deferred words.
+
+        Returns:
+            dict: The number of deferred words, their number by language, the estimated time to process them (None without measure) and the measured words per second.
+        """
+        return {
+            "deferred": len(self.deferred),
+            "languages": dict(collections.Counter(word[1] for word in self.deferred)),
+            "eta": self.get_eta(len(self.deferred)),
+            "rate": self.get_rate(),
+        }
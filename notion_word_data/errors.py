@@ -110,3 +110,70 @@ class InvalidDeclaration(CustomException):
             str: The text that will be printed if InvalidDeclaration is raised.
         """
         return f'The declaration "{self.string}" line {self.line} is invalid. It contains too much ",".'
+
+
+class UnknownLayout(CustomException):
+    """An exception to indicate that no extraction profile matches a Google Search page."""
+
+    def __init__(self, lang: str, profiles: list[str]) -> None:
+        """The initialization function of UnknownLayout.
+
+        Args:
+            lang (str): The language of the page that raised this exception.
+            profiles (list[str]): The name of the extraction profiles which have been tried.
+        """
+        self.lang = lang
+        self.profiles = profiles
+        super().__init__(self.lang, self.profiles)
+
+    def __str__(self) -> str:
+        """The error text of UnknownLayout.
+
+        Returns:
+            str: The text that will be printed if UnknownLayout is raised.
+        """
+        return f'The layout of Google Search in "{self.lang}" matches none of the extraction profiles {self.profiles}. It has probably changed.'
+
+
+class InvalidQuery(CustomException):
+    """An exception to indicate that a full-text query of the word store is invalid."""
+
+    def __init__(self, query: str, reason: str) -> None:
+        """The initialization function of InvalidQuery.
+
+        Args:
+            query (str): The query that raised this exception.
+            reason (str): The reason given by SQLite.
+        """
+        self.query = query
+        self.reason = reason
+        super().__init__(self.query, self.reason)
+
+    def __str__(self) -> str:
+        """The error text of InvalidQuery.
+
+        Returns:
+            str: The text that will be printed if InvalidQuery is raised.
+        """
+        return f'The query "{self.query}" is invalid: {self.reason}. See the FTS5 query syntax.'
+
+
+class InvalidConfiguration(CustomException):
+    """An exception to indicate that the configuration of Notion is invalid, so that every word would fail."""
+
+    def __init__(self, error: Exception) -> None:
+        """The initialization function of InvalidConfiguration.
+
+        Args:
+            error (Exception): The error returned for a word, caused by the configuration.
+        """
+        self.error = error
+        super().__init__(self.error)
+
+    def __str__(self) -> str:
+        """The error text of InvalidConfiguration.
+
+        Returns:
+            str: The text that will be printed if InvalidConfiguration is raised.
+        """
+        return f"The configuration of Notion is invalid ({self.error.__class__.__name__}: {self.error}). Verify the tokens and the database IDs of .env, and that each integration can access its database. The words handled before the error have been deleted from WORDS.md, the others have been left in it."
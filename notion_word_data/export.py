@@ -0,0 +1,174 @@
+"""A custom module to export the Notion payloads of words to a file, and to publish them later.
+
+An export is a gzip-compressed NDJSON file, with the payloads of one word per line.
+A replay keeps the number of lines already published in a checkpoint file next to the export,
+so that an interrupted replay starts again from the first unpublished word.
+"""
+
+from __future__ import annotations
+
+# System imports
+import gzip
+import json
+import os
+
+# Custom imports
+from notion_word_data import logs, notion, throttle, utils
+
+# Third party imports
+requests = utils.lazy_import("requests")
+
+general_logger = logs.setup_logging_general(f"{__name__}.general")
+exception_logger = logs.setup_logging_exception(f"{__name__}.exception")
+
+CHECKPOINT_SUFFIX = ".done"
+
+
+class PayloadWriter:
+    """A class to stream the payloads of words to an export file."""
+
+    def __init__(self, file_name: str) -> None:
+        """The initialization function of PayloadWriter.
+
+        Args:
+            file_name (str): The file name of the export.
+        """
+        self.file_name = file_name
+        self.file = None
+        self.count = 0
+
+    def __enter__(self) -> "PayloadWriter":
+        """Open the export file, replacing any previous export.
+
+        Returns:
+            PayloadWriter: The opened writer.
+        """
+        self.file = gzip.open(self.file_name, "wt", encoding="utf-8")
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the export file."""
+        self.file.close()
+        general_logger.debug("Exported %i word(s) to %s.", self.count, self.file_name)
+
+    def write(self, word: str, lang: str, data: dict) -> None:
+        """Write the payloads of a word.
+
+        Args:
+            word (str): The word, as written in WORDS.md.
+            lang (str): The language code.
+            data (dict): The data of the word.
+        """
+        record = {"word": word, "lang": lang, **notion.NotionSync.get_payloads(data)}
+        # Sorted keys, so that the exports of two releases can be compared.
+        self.file.write(json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n")
+        self.count += 1
+
+
+def iter_records(file_name: str, start: int = 0):
+    """Iterate over the payloads of an export file.
+
+    Args:
+        file_name (str): The file name of the export.
+        start (int, optional): The number of records to be skipped. Defaults to 0.
+
+    Yields:
+        tuple[int, dict]: The position of each record and the record.
+    """
+    with gzip.open(file_name, "rt", encoding="utf-8") as file:
+        for position, line in enumerate(file):
+            if position >= start and line.strip():
+                yield position, json.loads(line)
+
+
+def get_checkpoint(file_name: str) -> int:
+    """Get the number of records of an export which have already been published.
+
+    Args:
+        file_name (str): The file name of the export.
+
+    Returns:
+        int: The number of published records.
+    """
+    try:
+        with open(file_name + CHECKPOINT_SUFFIX, "r", encoding="utf-8") as file:
+            return int(file.read().strip() or 0)
+    except FileNotFoundError:
+        return 0
+
+
+def set_checkpoint(file_name: str, position: int) -> None:
+    """Set the number of records of an export which have already been published.
+
+    Args:
+        file_name (str): The file name of the export.
+        position (int): The number of published records.
+    """
+    checkpoint_file = file_name + CHECKPOINT_SUFFIX
+    with open(checkpoint_file + ".tmp", "w", encoding="utf-8") as file:
+        file.write(str(position))
+    # Replaced at once, so that an interruption never leaves a partial checkpoint.
+    os.replace(checkpoint_file + ".tmp", checkpoint_file)
+
+
+class Replayer:
+    """A class to publish the payloads of an export file to Notion, at the pace of the API."""
+
+    def __init__(self, file_name: str) -> None:
+        """The initialization function of Replayer.
+
+        Args:
+            file_name (str): The file name of the export.
+        """
+        self.file_name = file_name
+        self.rate_limiters = {
+            integration.name: throttle.RateLimiter(notion.NOTION_RATE)
+            for integration in notion.get_integrations()
+        }
+        notion.set_rate_limiters(self.rate_limiters)
+        self.index = notion.NotionIndex()
+
+    def run(self, session: requests.sessions.Session | None = None):
+        """Publish the records which have not been published yet, stopping at the first error.
+
+        Args:
+            session (requests.sessions.Session | None, optional): The session used to process the requests. Defaults to a new session.
+
+        Yields:
+            list: The result of each record, like the ones returned by pipeline.worker_process.
+        """
+        session = session or requests.Session()
+        start = get_checkpoint(self.file_name)
+        general_logger.debug("Replaying %s from record %i.", self.file_name, start)
+        try:
+            self.index.refresh(session)
+        except Exception as error:  # pylint: disable=broad-except
+            general_logger.warning(
+                "The Notion index could not be refreshed, the database will be queried for each word. Error type: %s. Message: %s",
+                error.__class__.__name__,
+                error,
+            )
+        for position, record in iter_records(self.file_name, start):
+            title = record["title"]
+            integration = notion.get_integration(record["word"], record["lang"])
+            page_ids = (
+                self.index.get(title, integration.database_id)
+                if self.index.refreshed_at
+                else None
+            )
+            try:
+                page_id = notion.NotionSync.publish(
+                    record,
+                    notion.get_headers(integration),
+                    session,
+                    page_ids,
+                    integration,
+                )
+            except Exception as error:  # pylint: disable=broad-except
+                exception_logger.exception("Caught an unexpected error.", exc_info=True)
+                # The checkpoint is left before this record, which is tried first on the next replay.
+                yield [record["word"], record["lang"], "error", error]
+                return
+            self.index.set(title, page_id, integration.database_id)
+            set_checkpoint(self.file_name, position + 1)
+            yield [record["word"], record["lang"], "success", record, page_id]
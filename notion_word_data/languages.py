@@ -0,0 +1,135 @@
+"""A custom module to manage the languages listed in SUPPORTED_LANGUAGES.md."""
+
+# System imports
+import functools
+import re
+import types
+import typing
+
+# Custom imports
+from notion_word_data import errors, logs
+
+general_logger = logs.setup_logging_general(f"{__name__}.general")
+
+LANGUAGES_FILE = "SUPPORTED_LANGUAGES.md"
+LANGUAGE_PATTERN = re.compile(
+    r"^- (?P<name>[^:\n]+):\s*```(?P<hl>[^`\n]+)```\s*$", re.MULTILINE
+)
+
+
+class Language(typing.NamedTuple):
+    """A supported language.
+
+    Attributes:
+        code (str): The lowercase language code, as written in WORDS.md.
+        name (str): The language name.
+        hl (str): The value of the "hl" parameter of Google Search.
+    """
+
+    code: str
+    name: str
+    hl: str
+
+
+class LanguageRegistry:
+    """A class holding the supported languages, parsed once from SUPPORTED_LANGUAGES.md."""
+
+    def __init__(self, languages: typing.Iterable[Language]) -> None:
+        """The initialization function of LanguageRegistry.
+
+        Args:
+            languages (typing.Iterable[Language]): The supported languages.
+        """
+        self.languages = types.MappingProxyType(
+            {language.code: language for language in languages}
+        )
+        self.codes = frozenset(self.languages)
+
+    def __contains__(self, code: str) -> bool:
+        """Check if a language code is supported.
+
+        Args:
+            code (str): The language code you want to verify.
+
+        Returns:
+            bool: True if the language is supported, False otherwise.
+        """
+        return code.lower() in self.codes
+
+    def __len__(self) -> int:
+        """Get the number of supported languages.
+
+        Returns:
+            int: The number of supported languages.
+        """
+        return len(self.codes)
+
+    @classmethod
+    def from_file(cls, file_name: str) -> "LanguageRegistry":
+        """Parse the list of the supported languages.
+
+        Args:
+            file_name (str): The file name containing the supported languages.
+
+        Returns:
+            LanguageRegistry: The supported languages.
+        """
+        general_logger.debug('Parsing the supported languages in "%s".', file_name)
+        with open(file_name, "r", encoding="utf-8") as file:
+            content = file.read()
+        return cls(
+            Language(
+                code=match["hl"].strip().lower(),
+                name=match["name"].strip(),
+                hl=match["hl"].strip(),
+            )
+            for match in LANGUAGE_PATTERN.finditer(content)
+        )
+
+    def get(self, code: str) -> Language:
+        """Get a supported language from its code.
+
+        Args:
+            code (str): The language code.
+
+        Raises:
+            errors.InvalidLanguage: An exception to indicate that the given language cannot be found in SUPPORTED_LANGUAGES.md.
+
+        Returns:
+            Language: The corresponding language.
+        """
+        try:
+            return self.languages[code.lower()]
+        except KeyError:
+            raise errors.InvalidLanguage(code) from None
+
+    def validate(self, words: list[list[str]]) -> tuple[list, list]:
+        """Split a list of words between the ones with a supported language and the others.
+
+        Args:
+            words (list[list[str]]): A list containing each word and its language.
+
+        Returns:
+            tuple[list, list]: The words with a supported language, and the others with their error.
+        """
+        valid_words = []
+        invalid_words = []
+        for word in words:
+            if word[1] in self:
+                valid_words.append(word)
+            else:
+                invalid_words.append([*word, errors.InvalidLanguage(word[1])])
+        general_logger.debug(
+            "Validated %i word(s), %i invalid.", len(valid_words), len(invalid_words)
+        )
+        return valid_words, invalid_words
+
+
+@functools.cache
+def get_registry() -> LanguageRegistry:
+    """Get the supported languages, parsed the first time they are needed.
+
+    Returns:
+        LanguageRegistry: The supported languages.
+    """
+    return LanguageRegistry.from_file(LANGUAGES_FILE)
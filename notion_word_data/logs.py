@@ -1,11 +1,65 @@
-"""A custom module to manage logging."""
+"""A custom module to manage logging.
+
+Every logger of the package propagates to a single package logger, which only
+holds a QueueHandler. The records are written and rotated by one QueueListener
+running in the main process, so that the workers never touch the log file.
+"""
 
 # System imports
+import itertools
 import logging
+import multiprocessing
+import os
 import sys
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 
 LOG_FILE = "./notion_word_data/logs.log"
+# The level used when LOG_LEVEL is not set or invalid.
+# Read from the environment by start_listener, like LOG_SAMPLING.
+LOG_LEVEL = logging.DEBUG
+PACKAGE_LOGGER = "notion_word_data"
+
+# The sampling rates of the DEBUG records, by stage (function name).
+# A rate of 10 means that only one record out of 10 is kept.
+# Example: LOG_SAMPLING="set_word_info=10,get_web_data=5"
+# Read from the environment by start_listener, so that an invalid value never prevents an import.
+SAMPLING = {}
+
+_queue = None
+_listener = None
+# The handlers and the level of the package logger before the listener started.
+_previous_state = None
+
+
+class SamplingFilter(logging.Filter):
+    """A filter keeping only one DEBUG record out of N for the sampled stages."""
+
+    def __init__(self, sampling: dict) -> None:
+        """The initialization function of SamplingFilter.
+
+        Args:
+            sampling (dict): The sampling rates, by stage.
+        """
+        super().__init__()
+        self.sampling = sampling
+        self.counters = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Check if a record should be kept.
+
+        Args:
+            record (logging.LogRecord): The record to be checked.
+
+        Returns:
+            bool: True if the record should be kept, False otherwise.
+        """
+        if record.levelno > logging.DEBUG:
+            return True
+        rate = self.sampling.get(record.funcName)
+        if not rate or rate <= 1:
+            return True
+        counter = self.counters.setdefault(record.funcName, itertools.count())
+        return next(counter) % rate == 0
 
 
 @staticmethod
@@ -15,9 +69,9 @@ def get_file_handler() -> logging.Handler:
     Returns:
         logging.Handler: The handler managing file output.
     """
-    file_handler = TimedRotatingFileHandler(LOG_FILE, when="midnight")
+    file_handler = TimedRotatingFileHandler(LOG_FILE, when="midnight", delay=True)
     file_format = logging.Formatter(
-        "%(asctime)s, %(levelname)-8s [%(filename)s:%(module)s:%(funcName)s:%(lineno)d] %(message)s"
+        "%(asctime)s, %(levelname)-8s [%(processName)s:%(filename)s:%(module)s:%(funcName)s:%(lineno)d] %(message)s"
     )
     file_handler.setFormatter(file_format)
     file_handler.setLevel(logging.DEBUG)
@@ -35,9 +89,181 @@ def get_console_handler() -> logging.Handler:
     console_format = logging.Formatter("%(message)s")
     console_handler.setFormatter(console_format)
     console_handler.setLevel(logging.INFO)
+    # The exceptions are only written to the file.
+    console_handler.addFilter(lambda record: not record.name.endswith(".exception"))
     return console_handler
 
 
+@staticmethod
+def get_queue_handler(queue, sampling: dict) -> logging.Handler:
+    """Get the queue handler, which sends the records to the listener.
+
+    Args:
+        queue (multiprocessing.Queue): The queue read by the listener.
+        sampling (dict): The sampling rates of the DEBUG records, by stage.
+
+    Returns:
+        logging.Handler: The handler sending the records to the queue.
+    """
+    queue_handler = QueueHandler(queue)
+    queue_handler.addFilter(SamplingFilter(sampling))
+    return queue_handler
+
+
+@staticmethod
+def set_handler(handler: logging.Handler, level: int = LOG_LEVEL) -> None:
+    """Replace the handlers of the package logger by a given handler.
+
+    Args:
+        handler (logging.Handler): The only handler the package logger should have.
+        level (int, optional): The minimum level of the records. Defaults to LOG_LEVEL.
+    """
+    package_logger = logging.getLogger(PACKAGE_LOGGER)
+    for old_handler in list(package_logger.handlers):
+        package_logger.removeHandler(old_handler)
+    package_logger.addHandler(handler)
+    package_logger.setLevel(level)
+
+
+@staticmethod
+def get_level() -> tuple[int, str | None]:
+    """Get the minimum level of the records from LOG_LEVEL.
+
+    Returns:
+        tuple[int, str | None]: The level, LOG_LEVEL if the value is invalid, and the invalid value or None.
+    """
+    value = os.environ.get("LOG_LEVEL", "").strip()
+    if not value:
+        return LOG_LEVEL, None
+    level = logging.getLevelName(value.upper())
+    if not isinstance(level, int):
+        return LOG_LEVEL, value
+    return level, None
+
+
+@staticmethod
+def parse_sampling(value: str) -> tuple[dict, list[str]]:
+    """Parse the sampling rates of a LOG_SAMPLING value.
+
+    Args:
+        value (str): The comma-separated stage=rate entries.
+
+    Returns:
+        tuple[dict, list[str]]: The sampling rates by stage, and the invalid entries.
+    """
+    sampling = {}
+    invalid_entries = []
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        stage, _, rate = item.partition("=")
+        if not stage.strip() or not rate.strip().isdigit():
+            invalid_entries.append(item.strip())
+            continue
+        sampling[stage.strip()] = int(rate)
+    return sampling, invalid_entries
+
+
+@staticmethod
+def set_sampling(stage: str, rate: int) -> None:
+    """Keep only one DEBUG record out of a given rate for a given stage.
+
+    Args:
+        stage (str): The name of the function emitting the records.
+        rate (int): The sampling rate. 1 keeps every record.
+    """
+    SAMPLING[stage] = rate
+
+
+@staticmethod
+def start_listener():
+    """Start the listener writing the records of every process, if it is not running yet.
+
+    Returns:
+        multiprocessing.Queue: The queue to be given to the workers.
+    """
+    global _queue, _listener, _previous_state
+    if _listener is None:
+        package_logger = logging.getLogger(PACKAGE_LOGGER)
+        _previous_state = (list(package_logger.handlers), package_logger.level)
+        _queue = multiprocessing.Queue(-1)
+        _listener = QueueListener(
+            _queue,
+            get_console_handler(),
+            get_file_handler(),
+            respect_handler_level=True,
+        )
+        sampling, invalid_entries = parse_sampling(os.environ.get("LOG_SAMPLING", ""))
+        # The rates set by set_sampling are kept.
+        for stage, rate in sampling.items():
+            SAMPLING.setdefault(stage, rate)
+        level, invalid_level = get_level()
+        _listener.start()
+        set_handler(get_queue_handler(_queue, SAMPLING), level)
+        general_logger = setup_logging_general(f"{__name__}.general")
+        if invalid_level is not None:
+            general_logger.warning(
+                'Ignored the invalid LOG_LEVEL "%s", using %s.',
+                invalid_level,
+                logging.getLevelName(LOG_LEVEL),
+            )
+        for item in invalid_entries:
+            general_logger.warning(
+                'Ignored the invalid LOG_SAMPLING entry "%s", expected stage=rate.',
+                item,
+            )
+    return _queue
+
+
+@staticmethod
+def stop_listener() -> None:
+    """Flush the remaining records, stop the listener and give the package logger its previous handlers back."""
+    global _queue, _listener, _previous_state
+    if _listener is not None:
+        # Detached first, so that no record is sent to the closed queue.
+        handlers, level = _previous_state
+        package_logger = logging.getLogger(PACKAGE_LOGGER)
+        for handler in list(package_logger.handlers):
+            package_logger.removeHandler(handler)
+        for handler in handlers:
+            package_logger.addHandler(handler)
+        package_logger.setLevel(level)
+        _listener.stop()
+        _queue.close()
+        _queue.join_thread()
+        _listener = None
+        _queue = None
+        _previous_state = None
+
+
+@staticmethod
+def setup_worker_logging(queue, sampling: dict) -> None:
+    """Send the records of a worker process to the listener of the main process.
+
+    Args:
+        queue (multiprocessing.Queue): The queue read by the listener.
+        sampling (dict): The sampling rates of the DEBUG records, by stage.
+    """
+    SAMPLING.update(sampling)
+    # The main process has already warned about an invalid value.
+    set_handler(get_queue_handler(queue, SAMPLING), get_level()[0])
+
+
+@staticmethod
+def get_logger_name(logger_name: str) -> str:
+    """Get the name of a logger inside the package hierarchy, even when run as __main__.
+
+    Args:
+        logger_name (str): The requested name of the logger.
+
+    Returns:
+        str: The name of a logger propagating to the package logger.
+    """
+    if logger_name.startswith(f"{PACKAGE_LOGGER}."):
+        return logger_name
+    return f"{PACKAGE_LOGGER}.{logger_name}"
+
+
 @staticmethod
 def setup_logging_general(logger_name: str) -> logging.Logger:
     """Setup a logger for general informations.
@@ -48,12 +274,8 @@ def setup_logging_general(logger_name: str) -> logging.Logger:
     Returns:
         logging.Logger: The created logger.
     """
-    logger = logging.getLogger(logger_name)
-    logger.addHandler(get_console_handler())
-    logger.addHandler(get_file_handler())
-    logger.setLevel(logging.DEBUG)
-    logger.debug("Creating logger %s.", logger_name)
-    return logger
+    # The level is left unset, so that the level of the package logger, set by start_listener, applies.
+    return logging.getLogger(get_logger_name(logger_name))
 
 
 @staticmethod
@@ -66,8 +288,6 @@ def setup_logging_exception(logger_name: str) -> logging.Logger:
     Returns:
         logging.Logger: The created logger.
     """
-    logger = logging.getLogger(logger_name)
-    logger.addHandler(get_file_handler())
+    logger = logging.getLogger(get_logger_name(logger_name))
     logger.setLevel(logging.ERROR)
-    logger.debug("Creating logger %s.", logger_name)
     return logger
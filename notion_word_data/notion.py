@@ -1,71 +1,364 @@
 """A custom module to update a Notion database with the given data."""
 
+from __future__ import annotations
+
 # System imports
+import copy
+import functools
 import json
 import os
-
-# Third party imports
-import dotenv
-import requests
+import sys
+import time
+import zlib
+from typing import NamedTuple
 
 # Custom imports
 from notion_word_data import errors, logs, utils
 
+# Third party imports
+dotenv = utils.lazy_import("dotenv")
+requests = utils.lazy_import("requests")
+
 general_logger = logs.setup_logging_general(f"{__name__}.general")
 
-dotenv.load_dotenv()
-DATABASE_ID = os.environ.get("DATABASE_ID")
-TOKEN = os.environ.get("TOKEN")
+# DATABASE_ID and TOKEN are read from .env the first time they are used (see __getattr__).
+# More integrations can be added with TOKEN_2 and DATABASE_ID_2, TOKEN_3 and DATABASE_ID_3...
+CONFIG_NAMES = ("DATABASE_ID", "TOKEN")
+NOTION_ENDPOINT_API = "https://api.notion.com/"
 NOTION_ENDPOINT_DATABASE = "https://api.notion.com/v1/databases/"
 NOTION_ENDPOINT_PAGE = "https://api.notion.com/v1/pages/"
 NOTION_ENDPOINT_BLOCKS = "https://api.notion.com/v1/blocks/"
+NOTION_VERSION = "2022-02-22"
+# Notion limits the number of requests to 3 per second.
+NOTION_RATE = 3
+NOTION_PAGE_SIZE = 100
+NOTION_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.000Z"
+
+# The rate limiter of each integration, shared by every process, set by set_rate_limiters.
+_rate_limiters = {}
+
+
+class Integration(NamedTuple):
+    """A Notion integration and the database it writes to, with its own rate limit."""
+
+    name: str
+    token: str
+    database_id: str
+
+
+def load_config() -> None:
+    """Load .env and set the configuration values which have not been set yet."""
+    general_logger.debug("Loading the configuration.")
+    dotenv.load_dotenv()
+    module_globals = globals()
+    for name in CONFIG_NAMES:
+        module_globals.setdefault(name, os.environ.get(name))
+
+
+def __getattr__(name: str):
+    """Load the configuration the first time one of its values is requested.
+
+    Args:
+        name (str): The name of the requested attribute.
+
+    Raises:
+        AttributeError: An exception to indicate that the attribute does not exist.
+
+    Returns:
+        str: The value of the configuration.
+    """
+    if name in CONFIG_NAMES:
+        load_config()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_config(name: str) -> str:
+    """Get a configuration value, loading the configuration if needed.
+
+    Args:
+        name (str): The name of the configuration value.
+
+    Returns:
+        str: The configuration value.
+    """
+    return getattr(sys.modules[__name__], name)
+
+
+@functools.lru_cache(maxsize=None)
+def get_integrations() -> tuple[Integration, ...]:
+    """Get the integrations, from TOKEN and DATABASE_ID, then TOKEN_2 and DATABASE_ID_2...
+
+    The environment is only read the first time, as the integrations are needed for every word.
+
+    Returns:
+        tuple[Integration, ...]: The integrations, in order.
+    """
+    integrations = [Integration("1", get_config("TOKEN"), get_config("DATABASE_ID"))]
+    number = 2
+    while os.environ.get(f"TOKEN_{number}"):
+        integrations.append(
+            Integration(
+                str(number),
+                os.environ[f"TOKEN_{number}"],
+                # Several integrations can share a database, each with its own rate limit.
+                os.environ.get(f"DATABASE_ID_{number}") or integrations[0].database_id,
+            )
+        )
+        number += 1
+    return tuple(integrations)
+
+
+def get_integration(word: str, lang: str) -> Integration:
+    """Get the integration of a word, which is always the same for a given set of integrations.
+
+    Args:
+        word (str): The word.
+        lang (str): The language code.
+
+    Returns:
+        Integration: The integration writing the word.
+    """
+    integrations = get_integrations()
+    shard = zlib.crc32(f"{word}\0{lang}".encode("utf-8")) % len(integrations)
+    return integrations[shard]
+
+
+def get_headers(integration: Integration | None = None) -> dict:
+    """Get the headers used to send requests to the Notion API.
+
+    Args:
+        integration (Integration | None, optional): The integration sending the requests. Defaults to the first one.
+
+    Returns:
+        dict: The headers.
+    """
+    integration = integration or get_integrations()[0]
+    return {
+        "Authorization": f"Bearer {integration.token}",
+        "Content-Type": "application/json",
+        "Notion-Version": NOTION_VERSION,
+    }
+
+
+def set_rate_limiters(rate_limiters: dict) -> None:
+    """Set the rate limiters used before each request sent to the Notion API.
+
+    Args:
+        rate_limiters (dict): The rate limiter of each integration, by name, shared by every process.
+    """
+    global _rate_limiters
+    _rate_limiters = rate_limiters
+
+
+def wait_rate_limit(integration: Integration | None = None) -> None:
+    """Wait until a request can be sent to the Notion API.
+
+    Args:
+        integration (Integration | None, optional): The integration sending the request. Defaults to the first one.
+    """
+    rate_limiter = _rate_limiters.get(integration.name if integration else "1")
+    if rate_limiter is not None:
+        rate_limiter.acquire()
+
+
+class NotionIndex:
+    """A class to keep the pages of a Notion database, by title, without querying it for each word."""
+
+    def __init__(self) -> None:
+        """The initialization function of NotionIndex."""
+        self.pages = {}
+        self.refreshed_at = None
+
+    def __contains__(self, title: str) -> bool:
+        """Check if a title has at least one page.
+
+        Args:
+            title (str): The page title.
+
+        Returns:
+            bool: True if the title has a page, False otherwise.
+        """
+        return bool(self.pages.get(title))
+
+    def __len__(self) -> int:
+        """Get the number of titles.
+
+        Returns:
+            int: The number of titles.
+        """
+        return len(self.pages)
+
+    @classmethod
+    def iter_pages(
+        cls,
+        headers: dict,
+        session: requests.sessions.Session,
+        payload: dict = None,
+        integration: Integration | None = None,
+    ):
+        """Iterate over every page of a database, one result page at a time.
+
+        Args:
+            headers (dict): The headers used to process the request.
+            session (requests.sessions.Session): The session used to process the request.
+            payload (dict, optional): The filter and sorts of the query. Defaults to every page.
+            integration (Integration | None, optional): The integration whose database is queried. Defaults to the first one.
+
+        Yields:
+            dict: A page of the database.
+        """
+        payload = dict(payload or {}, page_size=NOTION_PAGE_SIZE)
+        while True:
+            response = NotionSync.query_database(headers, payload, session, integration)
+            yield from response["results"]
+            if not response.get("has_more"):
+                break
+            payload["start_cursor"] = response["next_cursor"]
+
+    @classmethod
+    def get_page_entry(cls, page: dict) -> dict:
+        """Get the indexed informations of a page.
+
+        Args:
+            page (dict): The page, as returned by the Notion API.
+
+        Returns:
+            dict: The page ID, title, last edition time and whether its informations are filled.
+        """
+        properties = page["properties"]
+        return {
+            "id": page["id"],
+            "title": "".join(
+                text["plain_text"] for text in properties["Word"]["title"]
+            ),
+            "last_edited_time": page.get("last_edited_time", ""),
+            "has_infos": bool(properties.get("Informations", {}).get("rich_text")),
+        }
+
+    def refresh(self, session: requests.sessions.Session) -> None:
+        """Scan the whole database of each integration.
+
+        Args:
+            session (requests.sessions.Session): The session used to process the request.
+        """
+        general_logger.debug("Refreshing the Notion index.")
+        pages = {}
+        # A database shared by several integrations is only scanned once.
+        databases = {}
+        for integration in get_integrations():
+            databases.setdefault(integration.database_id, integration)
+        for database_id, integration in databases.items():
+            for page in self.iter_pages(
+                get_headers(integration), session, integration=integration
+            ):
+                entry = self.get_page_entry(page)
+                entry["database_id"] = database_id
+                pages.setdefault(entry["title"], []).append(entry)
+        self.pages = pages
+        self.refreshed_at = time.time()
+        general_logger.debug("Indexed %i title(s).", len(self.pages))
+
+    def get(self, title: str, database_id: str | None = None) -> list[str]:
+        """Get the ID of the pages with a given title.
+
+        Args:
+            title (str): The page title.
+            database_id (str | None, optional): The database of the pages. Defaults to every database.
+
+        Returns:
+            list[str]: The ID of the pages.
+        """
+        return [
+            entry["id"]
+            for entry in self.pages.get(title, [])
+            if database_id is None or entry.get("database_id") == database_id
+        ]
+
+    def set(self, title: str, page_id: str, database_id: str | None = None) -> None:
+        """Set the only page of a title in a database, after it has been synchronized.
+
+        Args:
+            title (str): The page title.
+            page_id (str): The page ID.
+            database_id (str | None, optional): The database of the page. Defaults to None.
+        """
+        self.pages[title] = [
+            entry
+            for entry in self.pages.get(title, [])
+            if entry.get("database_id") != database_id
+        ] + [
+            {
+                "id": page_id,
+                "title": title,
+                "last_edited_time": time.strftime(NOTION_TIME_FORMAT, time.gmtime()),
+                "has_infos": True,
+                "database_id": database_id,
+            }
+        ]
 
 
 class NotionSync:
     """A class to update a Notion database from a database ID with the given data."""
 
-    def __init__(self, data: dict, session: requests.sessions.Session) -> None:
+    # The colors of the parts of speech are only known once the page exists,
+    # so the payloads refer to them by name, as in "pos:Noun".
+    POS_COLOR_PREFIX = "pos:"
+
+    def __init__(
+        self,
+        data: dict,
+        session: requests.sessions.Session,
+        page_ids: list[str] | None = None,
+        integration: Integration | None = None,
+    ) -> None:
         """The initialization function of NotionSync.
 
         Args:
             data (dict): The dictionary containing all the data to be added.
             session (requests.sessions.Session): The session used to fetch data.
+            page_ids (list[str] | None, optional): The ID of the existing pages, if already known. Defaults to querying the database.
+            integration (Integration | None, optional): The integration writing the word. Defaults to the first one.
         """
         self.data = data
         self.name = utils.dict_get_element_by_index(self.data, 0)
         general_logger.debug('Initializing Notion class for "%s".', self.name)
-        self.identifier = ""
-        self.json_data = {"parent": {"database_id": DATABASE_ID}, "properties": {}}
+        self.integration = integration or get_integrations()[0]
+        self.headers = get_headers(self.integration)
+        self.session = session
+        self.payloads = self.get_payloads(self.data)
+        self.identifier = self.publish(
+            self.payloads, self.headers, self.session, page_ids, self.integration
+        )
 
-        self.headers = {
-            "Authorization": f"Bearer {TOKEN}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2022-02-22",
-        }
-        self.payload = {
+    @classmethod
+    def get_query_payload(cls, title: str) -> dict:
+        """Get the payload used to find the pages of a word.
+
+        Args:
+            title (str): The word name.
+
+        Returns:
+            dict: The payload.
+        """
+        return {
             "filter": {
                 "and": [
                     {"property": "Word", "title": {"is_not_empty": True}},
-                    {"property": "Word", "title": {"starts_with": self.name}},
+                    {"property": "Word", "title": {"equals": title}},
                 ],
                 "start_cursor": "string",
                 "page_size": 250,
             }
         }
-        self.session = session
-
-        def update_notion():
-            """Update a Notion database with the given data."""
-            id_list = self.get_database_id(self.headers, self.payload, self.session)
-            for page_id in id_list:
-                self.delete_page(page_id, self.headers, self.session)
-            self.set_new_page()
-
-        update_notion()
 
     @classmethod
     def query_database(
-        cls, headers: dict, payload: dict, session: requests.sessions.Session
+        cls,
+        headers: dict,
+        payload: dict,
+        session: requests.sessions.Session,
+        integration: Integration | None = None,
     ) -> dict:
         """Get the content of a database.
 
@@ -73,6 +366,7 @@ class NotionSync:
             headers (dict): The headers used to process the request.
             payload (dict): The payload used to process the request.
             session (requests.sessions.Session): The session used to process the request.
+            integration (Integration | None, optional): The integration whose database is queried. Defaults to the first one.
 
         Raises:
             errors.InvalidDatabaseID: An exception to indicate that the given database ID is invalid.
@@ -82,18 +376,25 @@ class NotionSync:
             dict: A dictionary of the existing data.
         """
         general_logger.debug("Querying the database.")
-        database_url = f"{NOTION_ENDPOINT_DATABASE}{DATABASE_ID}/query"
+        integration = integration or get_integrations()[0]
+        database_id = integration.database_id
+        database_url = f"{NOTION_ENDPOINT_DATABASE}{database_id}/query"
+        wait_rate_limit(integration)
         response = session.post(url=database_url, headers=headers, json=payload)
         if response.status_code == 400 and response.reason == "Bad Request":
-            raise errors.InvalidDatabaseID(DATABASE_ID)
+            raise errors.InvalidDatabaseID(database_id)
         if response.status_code == 401 and response.reason == "Unauthorized":
-            raise errors.InvalidToken(TOKEN)
+            raise errors.InvalidToken(integration.token)
         response.raise_for_status()
         return response.json()
 
     @classmethod
     def get_database_id(
-        cls, headers: dict, payload: dict, session: requests.sessions.Session
+        cls,
+        headers: dict,
+        payload: dict,
+        session: requests.sessions.Session,
+        integration: Integration | None = None,
     ) -> list[str]:
         """Get the ID of the pages matching the word name.
 
@@ -101,35 +402,46 @@ class NotionSync:
             headers (dict): The headers used to process the request.
             payload (dict): The payload used to process the request.
             session (requests.sessions.Session): The session used to process the request.
+            integration (Integration | None, optional): The integration whose database is queried. Defaults to the first one.
 
         Returns:
             list[str]: A list of all the pages ID matching the word name.
         """
         general_logger.debug(
             'Getting the database ID for "%s".',
-            payload["filter"]["and"][1]["title"]["starts_with"],
+            next(iter(payload["filter"]["and"][1]["title"].values())),
         )
-        existing_data = cls.query_database(headers, payload, session)
+        existing_data = cls.query_database(headers, payload, session, integration)
         id_list = [page["id"] for page in existing_data["results"]]
         return id_list
 
     @classmethod
     def create_page(
-        cls, data_to_send: dict, headers: dict, session: requests.sessions.Session
-    ) -> None:
+        cls,
+        data_to_send: dict,
+        headers: dict,
+        session: requests.sessions.Session,
+        integration: Integration | None = None,
+    ) -> dict:
         """Create a new database entry.
 
         Args:
             data_to_send (dict): The dictionary containing the data you want to add to a database entry.
             headers (dict): The headers used to process the request.
             session (requests.sessions.Session): The payload used to process the request.
+            integration (Integration | None, optional): The integration sending the request. Defaults to the first one.
+
+        Returns:
+            dict: The new page, as returned by the Notion API.
         """
         general_logger.debug("Creating a page.")
         data_to_send = json.dumps(data_to_send)
+        wait_rate_limit(integration)
         response = session.post(
             url=NOTION_ENDPOINT_PAGE, data=data_to_send, headers=headers
         )
         response.raise_for_status()
+        return response.json()
 
     @classmethod
     def update_page(
@@ -138,6 +450,7 @@ class NotionSync:
         data_to_send: dict,
         headers: dict,
         session: requests.sessions.Session,
+        integration: Integration | None = None,
     ) -> None:
         """Update a database entry.
 
@@ -146,16 +459,46 @@ class NotionSync:
             data_to_send (dict): The dictionary containing the data you want to add to the database entry.
             headers (dict): The headers used to process the request.
             session (requests.sessions.Session): The session used to process the request.
+            integration (Integration | None, optional): The integration sending the request. Defaults to the first one.
         """
         general_logger.debug("Updating a page.")
         data_to_send = json.dumps(data_to_send)
         page_url = f"{NOTION_ENDPOINT_PAGE}{page_id}"
+        wait_rate_limit(integration)
         response = session.patch(url=page_url, data=data_to_send, headers=headers)
         response.raise_for_status()
 
+    @classmethod
+    def archive_page(
+        cls,
+        page_id: str,
+        headers: dict,
+        session: requests.sessions.Session,
+        integration: Integration | None = None,
+    ) -> None:
+        """Archive a database entry, which can still be restored from the trash.
+
+        Args:
+            page_id (str): The ID of the database entry to be archived.
+            headers (dict): The headers used to process the request.
+            session (requests.sessions.Session): The session used to process the request.
+            integration (Integration | None, optional): The integration sending the request. Defaults to the first one.
+        """
+        general_logger.debug("Archiving a page.")
+        page_url = f"{NOTION_ENDPOINT_PAGE}{page_id}"
+        wait_rate_limit(integration)
+        response = session.patch(
+            url=page_url, data=json.dumps({"archived": True}), headers=headers
+        )
+        response.raise_for_status()
+
     @classmethod
     def delete_page(
-        cls, page_id: str, headers: dict, session: requests.sessions.Session
+        cls,
+        page_id: str,
+        headers: dict,
+        session: requests.sessions.Session,
+        integration: Integration | None = None,
     ) -> None:
         """Delete a database entry.
 
@@ -163,116 +506,174 @@ class NotionSync:
             page_id (str): The ID of the database entry to be deleted.
             headers (dict): The headers used to process the request.
             session (requests.sessions.Session): The payload used to process the request.
+            integration (Integration | None, optional): The integration sending the request. Defaults to the first one.
         """
         general_logger.debug("Deleting a page.")
         page_url = f"{NOTION_ENDPOINT_BLOCKS}{page_id}"
+        wait_rate_limit(integration)
         response = session.delete(url=page_url, headers=headers)
         response.raise_for_status()
 
-    def set_new_page(self) -> None:
-        """Create a new page with the given data."""
-        general_logger.debug('Setting new page for "%s".', self.name)
-
-        def set_word_block() -> dict:
-            """Set the JSON block for the 'Word' property.
-
-            Returns:
-                dict: A dictionary containing the 'Word' property.
-            """
-            general_logger.debug('Setting word block for "%s".', self.name)
-            word_property = {"title": [{"text": {"content": self.name}}]}
-            return word_property
-
-        word_block = set_word_block()
-        self.json_data["properties"]["Word"] = word_block
-
-        def set_pos_block() -> dict:
-            """Set the JSON block for the 'Part Of Speech' property.
-
-            Returns:
-                dict: A dictionary containing the 'Part Of Speech' property.
-            """
-            general_logger.debug('Setting pos block for "%s".', self.name)
-            pos_list = list(self.data[utils.dict_get_element_by_index(self.data, 0)])
-            pos_property = {"multi_select": [{"name": pos} for pos in pos_list]}
-            return pos_property
-
-        pos_block = set_pos_block()
-        self.json_data["properties"]["Part Of Speech"] = pos_block
-
-        self.create_page(self.json_data, self.headers, self.session)
-        self.identifier = self.get_database_id(
-            self.headers, self.payload, self.session
-        )[0]
-
-        def set_infos_block() -> None:
-            """Set the JSON block for the 'Informations' property.
-
-            Returns:
-                dict: A dictionary containing the 'Informations' property.
-            """
-            general_logger.debug('Setting infos block for "%s".', self.name)
-
-            def get_pos_color() -> dict:
-                """Get the Notion color for the parts of speechs.
-
-                Returns:
-                    dict: A dictionary containing the parts of speechs and their corresponding colors.
-                """
-                general_logger.debug('Getting pos color for "%s".', self.name)
-                existing_data = self.query_database(
-                    self.headers, self.payload, self.session
-                )
-                pos_color_dict = {
-                    pos["name"]: pos["color"]
-                    for pos in existing_data["results"][0]["properties"][
-                        "Part Of Speech"
-                    ]["multi_select"]
+    @classmethod
+    def get_payloads(cls, data: dict) -> dict:
+        """Get the payloads of a word, which can be published later by publish.
+
+        Args:
+            data (dict): The dictionary containing all the data to be added.
+
+        Returns:
+            dict: The word name, the payload creating its page and the payload setting its informations.
+        """
+        name = utils.dict_get_element_by_index(data, 0)
+        general_logger.debug('Setting new page for "%s".', name)
+        return {
+            "title": name,
+            "create": {
+                "properties": {
+                    "Word": cls.get_word_property(name),
+                    "Part Of Speech": cls.get_pos_property(data),
                 }
-                return pos_color_dict
-
-            color_dict = get_pos_color()
-            infos_property = {"rich_text": []}
-            for pos in self.data[utils.dict_get_element_by_index(self.data, 0)]:
-                color = color_dict[pos]
-                number = 1
-                for definition in self.data[
-                    utils.dict_get_element_by_index(self.data, 0)
-                ][pos]:
+            },
+            "update": {"properties": {"Informations": cls.get_infos_property(data)}},
+        }
+
+    @classmethod
+    def get_word_property(cls, name: str) -> dict:
+        """Set the JSON block for the 'Word' property.
+
+        Args:
+            name (str): The word name.
+
+        Returns:
+            dict: A dictionary containing the 'Word' property.
+        """
+        general_logger.debug('Setting word block for "%s".', name)
+        return {"title": [{"text": {"content": name}}]}
+
+    @classmethod
+    def get_pos_property(cls, data: dict) -> dict:
+        """Set the JSON block for the 'Part Of Speech' property.
+
+        Args:
+            data (dict): The dictionary containing all the data to be added.
+
+        Returns:
+            dict: A dictionary containing the 'Part Of Speech' property.
+        """
+        name = utils.dict_get_element_by_index(data, 0)
+        general_logger.debug('Setting pos block for "%s".', name)
+        return {"multi_select": [{"name": pos} for pos in data[name]]}
+
+    @classmethod
+    def get_infos_property(cls, data: dict) -> dict:
+        """Set the JSON block for the 'Informations' property, with the colors of the parts of speech left to resolve.
+
+        Args:
+            data (dict): The dictionary containing all the data to be added.
+
+        Returns:
+            dict: A dictionary containing the 'Informations' property.
+        """
+        name = utils.dict_get_element_by_index(data, 0)
+        general_logger.debug('Setting infos block for "%s".', name)
+        infos_property = {"rich_text": []}
+        for pos, definitions in data[name].items():
+            color = f"{cls.POS_COLOR_PREFIX}{pos}"
+            for number, (definition, (examples, synonyms)) in enumerate(
+                definitions.items(), start=1
+            ):
+                infos_property["rich_text"].append(
+                    {
+                        "text": {"content": f"{number}. {definition}\n"},
+                        "annotations": {"bold": True, "color": color},
+                    }
+                )
+                if examples:
+                    infos_property["rich_text"].append(
+                        {"text": {"content": ", ".join(examples) + "\n"}}
+                    )
+                if synonyms:
                     infos_property["rich_text"].append(
                         {
-                            "text": {"content": str(number) + ". " + definition + "\n"},
-                            "annotations": {"bold": True, "color": color},
+                            "text": {"content": ", ".join(synonyms) + "\n"},
+                            "annotations": {"italic": True, "color": "gray"},
                         }
                     )
-                    number += 1
-                    example_str = ""
-                    for example in self.data[
-                        utils.dict_get_element_by_index(self.data, 0)
-                    ][pos][definition][0]:
-                        example_str += f"{example}, "
-                    if example_str != "":
-                        infos_property["rich_text"].append(
-                            {"text": {"content": example_str[:-2] + "\n"}}
-                        )
-                    synonym_str = ""
-                    for synonym in self.data[
-                        utils.dict_get_element_by_index(self.data, 0)
-                    ][pos][definition][1]:
-                        synonym_str += f"{synonym}, "
-                    if synonym_str != "":
-                        infos_property["rich_text"].append(
-                            {
-                                "text": {"content": synonym_str[:-2] + "\n"},
-                                "annotations": {"italic": True, "color": "gray"},
-                            }
-                        )
-                infos_property["rich_text"].append({"text": {"content": "\n"}})
-            infos_property["rich_text"][-1]["text"]["content"] = infos_property[
-                "rich_text"
-            ][-1]["text"]["content"][:-2]
-            return infos_property
-
-        infos_block = set_infos_block()
-        self.json_data["properties"]["Informations"] = infos_block
-        self.update_page(self.identifier, self.json_data, self.headers, self.session)
+            infos_property["rich_text"].append({"text": {"content": "\n"}})
+        infos_property["rich_text"][-1]["text"]["content"] = infos_property[
+            "rich_text"
+        ][-1]["text"]["content"][:-2]
+        return infos_property
+
+    @classmethod
+    def resolve_pos_colors(cls, payload: dict, color_dict: dict) -> dict:
+        """Replace the parts of speech referred to in a payload by their Notion color.
+
+        Args:
+            payload (dict): The payload setting the informations of a word.
+            color_dict (dict): The parts of speechs and their corresponding colors.
+
+        Returns:
+            dict: A copy of the payload, with the colors resolved.
+        """
+        payload = copy.deepcopy(payload)
+        for text in payload["properties"]["Informations"]["rich_text"]:
+            annotations = text.get("annotations", {})
+            color = annotations.get("color", "")
+            if color.startswith(cls.POS_COLOR_PREFIX):
+                annotations["color"] = color_dict[color[len(cls.POS_COLOR_PREFIX) :]]
+        return payload
+
+    @classmethod
+    def publish(
+        cls,
+        payloads: dict,
+        headers: dict,
+        session: requests.sessions.Session,
+        page_ids: list[str] | None = None,
+        integration: Integration | None = None,
+    ) -> str:
+        """Replace the pages of a word by a new page, from the payloads of get_payloads.
+
+        Args:
+            payloads (dict): The payloads of the word.
+            headers (dict): The headers used to process the request.
+            session (requests.sessions.Session): The session used to process the request.
+            page_ids (list[str] | None, optional): The ID of the existing pages, if already known. Defaults to querying the database.
+            integration (Integration | None, optional): The integration writing the word. Defaults to the first one.
+
+        Returns:
+            str: The ID of the new page.
+        """
+        integration = integration or get_integrations()[0]
+        payload = cls.get_query_payload(payloads["title"])
+        id_list = (
+            page_ids
+            if page_ids is not None
+            else cls.get_database_id(headers, payload, session, integration)
+        )
+        for page_id in id_list:
+            cls.delete_page(page_id, headers, session, integration)
+        # The new page holds the colors given to its parts of speech.
+        page = cls.create_page(
+            {
+                "parent": {"database_id": integration.database_id},
+                **payloads["create"],
+            },
+            headers,
+            session,
+            integration,
+        )
+        general_logger.debug('Getting pos color for "%s".', payloads["title"])
+        color_dict = {
+            pos["name"]: pos["color"]
+            for pos in page["properties"]["Part Of Speech"]["multi_select"]
+        }
+        cls.update_page(
+            page["id"],
+            cls.resolve_pos_colors(payloads["update"], color_dict),
+            headers,
+            session,
+            integration,
+        )
+        return page["id"]
@@ -0,0 +1,728 @@
+"""A custom module to process words with a pool of warm workers."""
+
+from __future__ import annotations
+
+# System imports
+import collections
+import concurrent.futures
+import multiprocessing
+import multiprocessing.shared_memory
+import os
+import queue
+import signal
+import threading
+import time
+
+# Custom imports
+from notion_word_data import (
+    errors,
+    languages,
+    logs,
+    notion,
+    scheduler,
+    store,
+    throttle,
+    utils,
+    word_data,
+)
+
+# Third party imports
+requests = utils.lazy_import("requests")
+
+general_logger = logs.setup_logging_general(f"{__name__}.general")
+exception_logger = logs.setup_logging_exception(f"{__name__}.exception")
+
+PROCESSES = 4
+# The number of words sent to the workers at once, by worker, the others waiting in the scheduler.
+WINDOW_BY_PROCESS = 2
+# The number of WordData results kept in memory, to skip fetching a word again.
+CACHE_SIZE = 1024
+# The results are written to the word store by batches of this size, or after this time (in seconds).
+STORE_BATCH = 50
+STORE_FLUSH_INTERVAL = 5.0
+# The modules loaded by the main process before starting the workers, so that they inherit them.
+WARM_MODULES = ("bs4", "requests")
+# The number of threads fetching the pages of the words, in the hybrid mode.
+FETCH_THREADS = 16
+
+# The session of the current worker, created once by init_worker.
+_session = None
+# The event set by the main process when the workers must stop at once, given by init_worker.
+_terminating = None
+
+
+def warm_up() -> None:
+    """Load the heavy modules, the configuration and the languages in the main process."""
+    general_logger.debug("Warming up the main process.")
+    for module_name in WARM_MODULES:
+        # pylint: disable-next=expression-not-assigned
+        utils.lazy_import(module_name).__name__
+    notion.load_config()
+    languages.get_registry()
+
+
+def stop_worker(*_) -> None:
+    """Exit a worker receiving SIGTERM, only if the main process is terminating the pool."""
+    if _terminating is not None and _terminating.is_set():
+        os._exit(1)  # pylint: disable=protected-access
+
+
+def init_worker(
+    logs_queue, sampling: dict, rate_limiters: dict, terminating=None
+) -> None:
+    """Initialize a worker, which then keeps its logging, session and rate limiters for every word.
+
+    Args:
+        logs_queue (multiprocessing.Queue): The queue read by the logging listener.
+        sampling (dict): The sampling rates of the DEBUG records, by stage.
+        rate_limiters (dict): The rate limiter of each Notion integration, shared by every process.
+        terminating (multiprocessing.Event | None, optional): The event set when the pool is terminated. Defaults to ignoring SIGTERM.
+    """
+    global _session, _terminating
+    # The main process decides when to stop, and lets the workers finish their word.
+    _terminating = terminating
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, stop_worker)
+    logs.setup_worker_logging(logs_queue, sampling)
+    notion.set_rate_limiters(rate_limiters)
+    _session = requests.Session()
+
+
+def get_pool(
+    logs_queue, rate_limiters: dict, processes: int = PROCESSES, terminating=None
+) -> multiprocessing.pool.Pool:
+    """Get a pool of workers, forked from the warmed up main process when possible.
+
+    Args:
+        logs_queue (multiprocessing.Queue): The queue read by the logging listener.
+        rate_limiters (dict): The rate limiter of each Notion integration, shared by every process.
+        processes (int, optional): The number of workers. Defaults to PROCESSES.
+        terminating (multiprocessing.Event | None, optional): The event set when the pool is terminated. Defaults to the workers ignoring SIGTERM.
+
+    Returns:
+        multiprocessing.pool.Pool: The pool of workers.
+    """
+    warm_up()
+    start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+    context = multiprocessing.get_context(start_method)
+    return context.Pool(
+        processes=processes,
+        initializer=init_worker,
+        initargs=(logs_queue, logs.SAMPLING, rate_limiters, terminating),
+    )
+
+
+def worker_process(
+    word: list[str],
+    data: dict | None = None,
+    page_ids: list[str] | None = None,
+    session: requests.sessions.Session | None = None,
+    dry_run: bool = False,
+) -> list:
+    """The process that will be repeated by the multiprocessing's workers.
+
+    Args:
+        word (list[str]): A list containing the word and the language to be processed.
+        data (dict | None, optional): The data of the word, if already known. Defaults to fetching it.
+        page_ids (list[str] | None, optional): The ID of the existing pages of the word, if already known. Defaults to querying the database.
+        session (requests.sessions.Session | None, optional): The session used to process the request. Defaults to the session of the worker.
+        dry_run (bool, optional): True to only fetch the data, without updating Notion. Defaults to False.
+
+    Returns:
+        list: A list containing the word name, its language and the result of the process.
+    """
+    global _session
+    if session is None:
+        if _session is None:
+            _session = requests.Session()
+        session = _session
+    word_name = word[0]
+    word_lang = word[1]
+    try:
+        if data is None:
+            data = word_data.WordData(word_name, word_lang, session).data
+        if dry_run:
+            return [word_name, word_lang, "success", data, None]
+        integration = notion.get_integration(word_name, word_lang)
+        sync = notion.NotionSync(data, session, page_ids, integration)
+    except errors.CustomException as error:
+        exception_logger.exception("Caught an expected error.", exc_info=True)
+        return [word_name, word_lang, "failure", error]
+    except Exception as error:
+        exception_logger.exception("Caught an unexpected error.", exc_info=True)
+        return [word_name, word_lang, "error", error]
+    else:
+        return [word_name, word_lang, "success", data, sync.identifier]
+
+
+def get_error_result(word: list[str], error: Exception) -> list:
+    """Log the error of a word, from the except block which caught it.
+
+    Args:
+        word (list[str]): A list containing the word and its language.
+        error (Exception): The caught error.
+
+    Returns:
+        list: A list containing the word name, its language and the result of the process.
+    """
+    if isinstance(error, errors.CustomException):
+        exception_logger.exception("Caught an expected error.", exc_info=True)
+        return [word[0], word[1], "failure", error]
+    exception_logger.exception("Caught an unexpected error.", exc_info=True)
+    return [word[0], word[1], "error", error]
+
+
+def parse_process(word: list[str], memory_name: str, size: int) -> list:
+    """The process parsing the page of a word fetched by the main process, in the hybrid mode.
+
+    Args:
+        word (list[str]): A list containing the word and the language to be processed.
+        memory_name (str): The name of the shared memory block holding the page.
+        size (int): The size of the page, in bytes.
+
+    Returns:
+        list: A list containing the word name, its language and the result of the parsing, without the page ID.
+    """
+    memory = multiprocessing.shared_memory.SharedMemory(name=memory_name)
+    try:
+        content = bytes(memory.buf[:size])
+    finally:
+        # The main process unlinks the block once the result is back.
+        memory.close()
+    try:
+        data = word_data.WordData(word[0], word[1], None, content).data
+    except Exception as error:  # pylint: disable=broad-except
+        return get_error_result(word, error)
+    return [word[0], word[1], "success", data, None]
+
+
+def free_memory(memory: multiprocessing.shared_memory.SharedMemory) -> None:
+    """Close and remove a shared memory block, even if it has already been removed.
+
+    Args:
+        memory (multiprocessing.shared_memory.SharedMemory): The shared memory block.
+    """
+    memory.close()
+    try:
+        memory.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def log_result(result: list) -> bool:
+    """Log the result of a word.
+
+    Args:
+        result (list): The result returned by worker_process.
+
+    Returns:
+        bool: True if the word has successfully been added, False otherwise.
+    """
+    if "success" == result[2]:
+        general_logger.info(
+            'The word "%s" has successfully been added for the language "%s".',
+            result[0],
+            result[1],
+        )
+        return True
+    if "failure" == result[2]:
+        general_logger.warning(
+            'An error has been encountered trying to add the word "%s" for the language "%s". Error type: %s. Message: %s',
+            result[0],
+            result[1],
+            result[3].__class__.__name__,
+            result[3],
+        )
+    else:
+        general_logger.critical(
+            'An unexpected error occurred trying to add the word "%s" for the language "%s". Error type : %s. Message: %s',
+            result[0],
+            result[1],
+            result[3].__class__.__name__,
+            result[3],
+        )
+    return False
+
+
+class Pipeline:
+    """A class keeping a pool of warm workers, a lookup cache, a Notion index and rate limiters between batches."""
+
+    def __init__(
+        self,
+        processes: int = PROCESSES,
+        word_store: store.WordStore | None = None,
+        dry_run: bool = False,
+        language_concurrency: int | None = None,
+        fetch_threads: int | None = None,
+    ) -> None:
+        """The initialization function of Pipeline.
+
+        Args:
+            processes (int, optional): The number of workers. Defaults to PROCESSES.
+            word_store (store.WordStore | None, optional): The local store of the successful words. Defaults to None.
+            dry_run (bool, optional): True to only fetch the data, without updating Notion. Defaults to False.
+            language_concurrency (int | None, optional): The maximum number of words in flight by language. Defaults to no limit.
+            fetch_threads (int | None, optional): The number of threads fetching the pages and updating Notion, the workers only parsing the pages (the hybrid mode). Defaults to the workers doing everything.
+        """
+        self.processes = processes
+        self.dry_run = dry_run
+        self.scheduler = scheduler.FairScheduler(language_concurrency)
+        self.fetch_threads = fetch_threads
+        self.window = max(processes * WINDOW_BY_PROCESS, fetch_threads or 0)
+        self.dispatched = 0
+        # A function checking if one more word can be sent, given the number of words sent, like Deadline.can_admit.
+        self.admission = None
+        self.integrations = notion.get_integrations()
+        # Each integration has its own rate limit, so its own rate limiter.
+        self.rate_limiters = {
+            integration.name: throttle.RateLimiter(notion.NOTION_RATE)
+            for integration in self.integrations
+        }
+        notion.set_rate_limiters(self.rate_limiters)
+        self.cache = collections.OrderedDict()
+        # The cache can also be read by the threads of the HTTP server.
+        self.cache_lock = threading.Lock()
+        self.index = notion.NotionIndex()
+        self.pool = None
+        self.terminating = None
+        # In the hybrid mode, the threads waiting for Google, and the ones waiting for Notion.
+        self.fetch_executor = None
+        self.sync_executor = None
+        # A session by thread, as a session should not be shared between threads.
+        self.local = threading.local()
+        # The words sent to the workers, and the ones waiting in the scheduler (as None).
+        self.in_flight = {}
+        # The words sent to the workers by integration, only updated by the main thread, so that
+        # the threads of the HTTP server can read them while in_flight changes.
+        self.dispatched_by_integration = collections.Counter()
+        self.results = queue.SimpleQueue()
+        self.store = word_store
+        self.store_buffer = []
+        self.store_flushed_at = time.monotonic()
+
+    def __enter__(self) -> "Pipeline":
+        """Start the pool of workers.
+
+        Returns:
+            Pipeline: The started pipeline.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        """Finish the words in flight and stop the pool of workers, or stop them at once after an error.
+
+        Args:
+            exc_type (type | None): The type of the raised exception, if any.
+        """
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+    def start(self) -> None:
+        """Start the pool of workers, if it is not running yet."""
+        if self.pool is None:
+            general_logger.debug(
+                "Starting multiprocessing with %i processes.", self.processes
+            )
+            self.terminating = multiprocessing.Event()
+            self.pool = get_pool(
+                logs.start_listener(),
+                self.rate_limiters,
+                self.processes,
+                self.terminating,
+            )
+            if self.fetch_threads:
+                # Started after get_pool, which loads requests before the threads use it.
+                self.fetch_executor = concurrent.futures.ThreadPoolExecutor(
+                    self.fetch_threads, thread_name_prefix="fetch"
+                )
+                self.sync_executor = concurrent.futures.ThreadPoolExecutor(
+                    notion.NOTION_RATE * len(self.integrations),
+                    thread_name_prefix="sync",
+                )
+
+    def close(self) -> None:
+        """Finish the words in flight and stop the pool of workers."""
+        if self.pool is not None:
+            general_logger.debug(
+                "Waiting for %i word(s) in flight.", len(self.in_flight)
+            )
+            # The fetches send their pages to the pool, and the pool sends its results to the updates.
+            if self.fetch_executor is not None:
+                self.fetch_executor.shutdown()
+                self.fetch_executor = None
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+            if self.sync_executor is not None:
+                self.sync_executor.shutdown()
+                self.sync_executor = None
+            self.log_shard_stats()
+        self.flush_store()
+
+    def terminate(self) -> None:
+        """Stop the pool of workers at once, dropping the words in flight."""
+        if self.pool is not None:
+            general_logger.debug("Dropping %i word(s) in flight.", len(self.in_flight))
+            # The workers only exit on SIGTERM once the event is set, as they must finish their word otherwise.
+            self.terminating.set()
+            for executor in (self.fetch_executor, self.sync_executor):
+                if executor is not None:
+                    executor.shutdown(wait=False, cancel_futures=True)
+            self.fetch_executor = None
+            self.sync_executor = None
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+            self.in_flight.clear()
+            self.dispatched_by_integration.clear()
+            self.scheduler = scheduler.FairScheduler(
+                self.scheduler.language_concurrency
+            )
+            self.dispatched = 0
+        self.flush_store()
+
+    def get_shard_stats(self) -> list[dict]:
+        """Get the throughput and the backlog of each integration.
+
+        Returns:
+            list[dict]: The name, number of requests, requests per second, backlog in seconds and words sent to the workers of each integration.
+        """
+        return [
+            {
+                "integration": integration.name,
+                "requests": self.rate_limiters[integration.name].count.value,
+                "throughput": self.rate_limiters[integration.name].throughput(),
+                "backlog": self.rate_limiters[integration.name].backlog(),
+                "in_flight": self.dispatched_by_integration[integration.name],
+            }
+            for integration in self.integrations
+        ]
+
+    def log_shard_stats(self) -> None:
+        """Log the throughput and the backlog of each integration."""
+        for stats in self.get_shard_stats():
+            general_logger.info(
+                "Integration %s: %i request(s), %.2f request(s) per second, %.1f second(s) of backlog, %i word(s) in flight.",
+                stats["integration"],
+                stats["requests"],
+                stats["throughput"],
+                stats["backlog"],
+                stats["in_flight"],
+            )
+
+    def flush_store(self, force: bool = True) -> None:
+        """Write the buffered results to the word store, in a single transaction.
+
+        Args:
+            force (bool, optional): False to only write a full or old enough buffer. Defaults to True.
+        """
+        if self.store is None or not self.store_buffer:
+            return
+        age = time.monotonic() - self.store_flushed_at
+        if (
+            force
+            or len(self.store_buffer) >= STORE_BATCH
+            or age >= STORE_FLUSH_INTERVAL
+        ):
+            self.store.add_many(self.store_buffer)
+            self.store_buffer = []
+            self.store_flushed_at = time.monotonic()
+
+    def get_cached(self, word: list[str]) -> dict | None:
+        """Get the data of a word from the lookup cache.
+
+        Args:
+            word (list[str]): A list containing the word and its language.
+
+        Returns:
+            dict | None: The data of the word, or None if it has not been fetched yet.
+        """
+        key = tuple(word[:2])
+        with self.cache_lock:
+            if key not in self.cache:
+                return None
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+    def set_cached(self, word: list[str], data: dict) -> None:
+        """Add the data of a word to the lookup cache.
+
+        Args:
+            word (list[str]): A list containing the word and its language.
+            data (dict): The data of the word.
+        """
+        key = tuple(word[:2])
+        with self.cache_lock:
+            self.cache[key] = data
+            self.cache.move_to_end(key)
+            while len(self.cache) > CACHE_SIZE:
+                self.cache.popitem(last=False)
+
+    def forget(self, word: list[str]) -> None:
+        """Remove a word from the lookup cache, so that it is fetched again.
+
+        Args:
+            word (list[str]): A list containing the word and its language.
+        """
+        with self.cache_lock:
+            self.cache.pop(tuple(word[:2]), None)
+
+    def get_request_count(self) -> int:
+        """Get the number of requests sent to the Notion API, by every integration.
+
+        Returns:
+            int: The number of requests.
+        """
+        return sum(
+            rate_limiter.count.value for rate_limiter in self.rate_limiters.values()
+        )
+
+    def submit(self, word: list, dispatch: bool = True) -> bool:
+        """Queue a word, which is sent to the workers as soon as the scheduler allows it.
+
+        Args:
+            word (list): A list containing the word, its language and optionally its priority.
+            dispatch (bool, optional): False to only queue the word, when more words are queued at once. Defaults to True.
+
+        Returns:
+            bool: True if the word has been queued, False if it is already in flight.
+        """
+        key = tuple(word[:2])
+        if key in self.in_flight:
+            return False
+        self.start()
+        self.in_flight[key] = None
+        priority = word[2] if len(word) > 2 else scheduler.DEFAULT_PRIORITY
+        self.scheduler.push(list(key), priority)
+        if dispatch:
+            self.dispatch()
+        return True
+
+    def drop_queued(self) -> list[list[str]]:
+        """Forget the words waiting in the scheduler, so that only the words sent to the workers are finished.
+
+        Returns:
+            list[list[str]]: A list containing each forgotten word and its language.
+        """
+        words = self.scheduler.clear()
+        for word in words:
+            self.in_flight.pop(tuple(word), None)
+        general_logger.debug("Dropped %i queued word(s).", len(words))
+        return words
+
+    def can_dispatch(self) -> bool:
+        """Check if one more word can be sent to the workers.
+
+        Returns:
+            bool: True if the window is not full and the admission allows it, False otherwise.
+        """
+        if self.dispatched >= self.window:
+            return False
+        return self.admission is None or self.admission(self.dispatched)
+
+    def dispatch(self) -> None:
+        """Send the next words of the scheduler to the workers, until the window is full or the admission refuses them."""
+        while self.can_dispatch():
+            word = self.scheduler.pop()
+            if word is None:
+                return
+            key = tuple(word)
+            data = self.get_cached(word)
+            page_ids = None
+            if data is not None:
+                title = utils.dict_get_element_by_index(data, 0)
+                database_id = notion.get_integration(*key).database_id
+                if self.index.get(title, database_id):
+                    page_ids = self.index.get(title, database_id)
+            general_logger.debug('Submitting "%s" in "%s".', key[0], key[1])
+            self.dispatched += 1
+            self.dispatched_by_integration[notion.get_integration(*key).name] += 1
+            if self.fetch_threads:
+                if data is None:
+                    self.in_flight[key] = self.submit_thread(
+                        self.fetch_executor, self.fetch, word
+                    )
+                elif self.dry_run:
+                    self.results.put([*key, "success", data, None])
+                else:
+                    self.in_flight[key] = self.submit_thread(
+                        self.sync_executor, self.sync, word, data, page_ids
+                    )
+                continue
+            self.in_flight[key] = self.pool.apply_async(
+                worker_process,
+                (word, data, page_ids, None, self.dry_run),
+                callback=self.results.put,
+                error_callback=lambda error, key=key: self.results.put(
+                    [*key, "error", error]
+                ),
+            )
+
+    def get_session(self) -> requests.sessions.Session:
+        """Get the session of the current thread.
+
+        Returns:
+            requests.sessions.Session: The session.
+        """
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+        return self.local.session
+
+    def submit_thread(
+        self, executor: concurrent.futures.Executor, function, word: list[str], *args
+    ) -> concurrent.futures.Future:
+        """Run a stage of a word in a thread, reporting an error the stage did not catch as its result.
+
+        Args:
+            executor (concurrent.futures.Executor): The threads running the stage.
+            function (Callable): The stage, which puts the result of the word in the results.
+            word (list[str]): A list containing the word and its language.
+            *args: The other arguments of the stage.
+
+        Returns:
+            concurrent.futures.Future: The future of the stage.
+        """
+
+        def report(future: concurrent.futures.Future) -> None:
+            """Put the error of a stage in the results, so that the word does not stay in flight.
+
+            Args:
+                future (concurrent.futures.Future): The finished future of the stage.
+            """
+            if future.cancelled() or future.exception() is None:
+                return
+            exception_logger.error(
+                "Caught an unexpected error.", exc_info=future.exception()
+            )
+            self.results.put([word[0], word[1], "error", future.exception()])
+
+        future = executor.submit(function, word, *args)
+        future.add_done_callback(report)
+        return future
+
+    def fetch(self, word: list[str]) -> None:
+        """Fetch the page of a word in a thread, and send it to the workers to be parsed.
+
+        Args:
+            word (list[str]): A list containing the word and its language.
+        """
+        memory = None
+        try:
+            language = word_data.WordData.check_language(word[1])
+            content = word_data.WordData.get_web_data(
+                word_data.WordData.get_url(word[0].lower(), language),
+                word_data.WordData.get_request_headers(),
+                self.get_session(),
+            ).content
+            # The page is copied once into shared memory, instead of being pickled to the worker.
+            memory = multiprocessing.shared_memory.SharedMemory(
+                create=True, size=max(len(content), 1)
+            )
+            memory.buf[: len(content)] = content
+            self.pool.apply_async(
+                parse_process,
+                (word, memory.name, len(content)),
+                callback=lambda result: self.release(word, memory, result),
+                error_callback=lambda error: self.release(
+                    word, memory, [*word, "error", error]
+                ),
+            )
+        except Exception as error:  # pylint: disable=broad-except
+            if memory is not None:
+                free_memory(memory)
+            self.results.put(get_error_result(word, error))
+
+    def release(
+        self,
+        word: list[str],
+        memory: multiprocessing.shared_memory.SharedMemory,
+        result: list,
+    ) -> None:
+        """Free the shared memory of a parsed page, and send the data to Notion, in the thread of the pool.
+
+        Args:
+            word (list[str]): A list containing the word and its language.
+            memory (multiprocessing.shared_memory.SharedMemory): The shared memory holding the page.
+            result (list): The result returned by parse_process.
+        """
+        # Nothing may be raised here, as it would stop the thread handling every result of the pool.
+        try:
+            free_memory(memory)
+            if "success" != result[2] or self.dry_run:
+                self.results.put(result)
+            else:
+                self.submit_thread(self.sync_executor, self.sync, word, result[3])
+        except Exception as error:  # pylint: disable=broad-except
+            self.results.put(get_error_result(word, error))
+
+    def sync(
+        self, word: list[str], data: dict, page_ids: list[str] | None = None
+    ) -> None:
+        """Update the Notion page of a word in a thread.
+
+        Args:
+            word (list[str]): A list containing the word and its language.
+            data (dict): The data of the word.
+            page_ids (list[str] | None, optional): The ID of the existing pages of the word, if already known. Defaults to querying the database.
+        """
+        try:
+            integration = notion.get_integration(word[0], word[1])
+            notion_sync = notion.NotionSync(
+                data, self.get_session(), page_ids, integration
+            )
+        except Exception as error:  # pylint: disable=broad-except
+            self.results.put(get_error_result(word, error))
+            return
+        self.results.put([word[0], word[1], "success", data, notion_sync.identifier])
+
+    def get_result(self, timeout: float | None = None) -> list | None:
+        """Wait for the next result of the workers.
+
+        Args:
+            timeout (float | None, optional): The maximum time to wait, in seconds. Defaults to waiting forever.
+
+        Returns:
+            list | None: The result returned by worker_process, or None if there is none yet.
+        """
+        try:
+            result = self.results.get(timeout=timeout)
+        except queue.Empty:
+            self.flush_store(force=False)
+            return None
+        self.in_flight.pop((result[0], result[1]), None)
+        self.dispatched -= 1
+        self.dispatched_by_integration[
+            notion.get_integration(result[0], result[1]).name
+        ] -= 1
+        self.scheduler.done(result)
+        if "success" == result[2]:
+            self.set_cached(result, result[3])
+            if result[4]:
+                title = utils.dict_get_element_by_index(result[3], 0)
+                database_id = notion.get_integration(result[0], result[1]).database_id
+                self.index.set(title, result[4], database_id)
+            # A dry run does not synchronize Notion, so the store is left as it is.
+            if self.store is not None and not self.dry_run:
+                self.store_buffer.append((result[0], result[1], result[3], result[4]))
+                self.flush_store(force=False)
+        self.dispatch()
+        return result
+
+    def run(self, words: list[list[str]]):
+        """Process a batch of words.
+
+        Args:
+            words (list[list]): A list containing each word, its language and optionally its priority.
+
+        Yields:
+            list: The result of each word, in completion order.
+        """
+        # Every word is queued first, so that the ones with the highest priority are sent first.
+        for word in words:
+            self.submit(word, dispatch=False)
+        self.dispatch()
+        while self.in_flight:
+            yield self.get_result()
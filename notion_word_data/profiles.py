@@ -0,0 +1,205 @@
+"""A custom module to describe where the data is in Google's result pages.
+
+An extraction profile maps each field to CSS selectors, in order of preference.
+The layout of a page is detected once, by resolving each field to the first selector
+matching somewhere in the page. The words are then extracted with these selectors only.
+The selectors are run by the select methods of bs4, whose CSS engine keeps them compiled.
+"""
+
+from __future__ import annotations
+
+# Custom imports
+from notion_word_data import errors, logs
+
+general_logger = logs.setup_logging_general(f"{__name__}.general")
+
+# The fields which must be found for a page to match a profile.
+REQUIRED_FIELDS = (
+    "name",
+    "pos_wrapper",
+    "pos",
+    "info_wrapper",
+    "sense",
+    "definition",
+)
+
+
+class ExtractionProfile:
+    """A class holding the selectors of a version of Google's layout."""
+
+    def __init__(self, name: str, selectors: dict[str, tuple[str, ...]]) -> None:
+        """The initialization function of ExtractionProfile.
+
+        Args:
+            name (str): The versioned name of the profile.
+            selectors (dict[str, tuple[str, ...]]): The CSS selectors of each field, in order of preference.
+        """
+        self.name = name
+        self.selectors = selectors
+
+    def __repr__(self) -> str:
+        """Get the representation of the profile.
+
+        Returns:
+            str: The representation of the profile.
+        """
+        return f"ExtractionProfile({self.name!r})"
+
+    def resolve(self, soup) -> ResolvedProfile | None:
+        """Detect which selector of each field matches a page.
+
+        Args:
+            soup (bs4.BeautifulSoup): The parsed page.
+
+        Returns:
+            ResolvedProfile | None: The selectors to be used for the page, or None if the page does not match the profile.
+        """
+        resolved = {}
+        fallbacks = {}
+        for field, selectors in self.selectors.items():
+            for position, selector in enumerate(selectors):
+                if soup.select_one(selector) is not None:
+                    resolved[field] = selector
+                    fallbacks[field] = position
+                    break
+            else:
+                if field in REQUIRED_FIELDS:
+                    return None
+                # Optional fields, like examples or synonyms, can be missing from a page.
+                resolved[field] = selectors[0]
+                fallbacks[field] = 0
+        return ResolvedProfile(self, resolved, fallbacks)
+
+
+class ResolvedProfile:
+    """A class holding the selectors detected for a page."""
+
+    def __init__(
+        self,
+        profile: ExtractionProfile,
+        selectors: dict[str, str],
+        fallbacks: dict[str, int],
+    ) -> None:
+        """The initialization function of ResolvedProfile.
+
+        Args:
+            profile (ExtractionProfile): The profile matching the page.
+            selectors (dict[str, str]): The CSS selector to be used for each field.
+            fallbacks (dict[str, int]): The position of the selector used for each field.
+        """
+        self.profile = profile
+        self.selectors = selectors
+        self.fallbacks = fallbacks
+
+    def __str__(self) -> str:
+        """Get the description of the profile, and of the fallbacks used.
+
+        Returns:
+            str: The description of the profile.
+        """
+        used = [
+            f"{field}#{position}"
+            for field, position in self.fallbacks.items()
+            if position
+        ]
+        return f"{self.profile.name} ({', '.join(used) or 'no fallback'})"
+
+    def select(self, field: str, tag) -> list:
+        """Get every element matching a field in a tag.
+
+        Args:
+            field (str): The field name.
+            tag (bs4.Tag): The tag to search in.
+
+        Returns:
+            list: The matching elements.
+        """
+        return tag.select(self.selectors[field])
+
+    def select_one(self, field: str, tag):
+        """Get the first element matching a field in a tag.
+
+        Args:
+            field (str): The field name.
+            tag (bs4.Tag): The tag to search in.
+
+        Returns:
+            bs4.Tag | None: The matching element, or None if there is none.
+        """
+        return tag.select_one(self.selectors[field])
+
+
+GOOGLE_2022_04 = ExtractionProfile(
+    "google-2022-04",
+    {
+        "name": ('[data-dobid="hdw"]',),
+        "pos_wrapper": ("div.lW8rQd",),
+        "pos": ("span.YrbPuc",),
+        "info_wrapper": ("ol.eQJLDd",),
+        "sense": ("div.thODed",),
+        "definition": ('[data-dobid="dfn"]',),
+        "example": ("div.ubHt5c",),
+        "synonym": (
+            'div[class="EmSASc gWUzU MR2UAc F5z5N jEdCLc LsYFnd p9F8Cd I6a0ee rjpYgb gjoUyf"]',
+            "div.EmSASc.gjoUyf",
+            "div.EmSASc",
+        ),
+    },
+)
+
+DEFAULT_PROFILES = (GOOGLE_2022_04,)
+# The profiles of the languages whose layout differs, by language code.
+LANGUAGE_PROFILES = {}
+
+# The profile which last matched a page, by language, tried first.
+_last_profiles = {}
+
+
+def get_profiles(lang: str) -> tuple[ExtractionProfile, ...]:
+    """Get the profiles to be tried for a language, in order.
+
+    Args:
+        lang (str): The language code.
+
+    Returns:
+        tuple[ExtractionProfile, ...]: The profiles of the language, then the default ones.
+    """
+    profiles = LANGUAGE_PROFILES.get(lang.lower(), ()) + DEFAULT_PROFILES
+    last_profile = _last_profiles.get(lang.lower())
+    if last_profile is None:
+        return profiles
+    return (last_profile,) + tuple(
+        profile for profile in profiles if profile is not last_profile
+    )
+
+
+def detect(soup, lang: str, word: str) -> ResolvedProfile:
+    """Detect the layout of a page.
+
+    Args:
+        soup (bs4.BeautifulSoup): The parsed page.
+        lang (str): The language code of the page.
+        word (str): The searched word.
+
+    Raises:
+        errors.InvalidWord: An exception to indicate that the given word cannot be found on Google Search.
+        errors.UnknownLayout: An exception to indicate that no extraction profile matches the page.
+
+    Returns:
+        ResolvedProfile: The selectors to be used for the page.
+    """
+    profiles = get_profiles(lang)
+    name_found = False
+    for profile in profiles:
+        name = profile.selectors["name"]
+        if not any(soup.select_one(selector) is not None for selector in name):
+            continue
+        name_found = True
+        resolved = profile.resolve(soup)
+        if resolved is not None:
+            _last_profiles[lang.lower()] = profile
+            general_logger.debug('Detected profile %s for "%s".', resolved, word)
+            return resolved
+    if not name_found:
+        raise errors.InvalidWord(word)
+    raise errors.UnknownLayout(lang, [profile.name for profile in profiles])
@@ -0,0 +1,135 @@
+"""A custom module to keep the Notion pages up to date, a few words at a time.
+
+The words synchronized the longest time ago are fetched again, and only the pages
+whose content has changed are written, as long as the request budget allows it.
+"""
+
+from __future__ import annotations
+
+# System imports
+import collections
+
+# Custom imports
+from notion_word_data import logs, notion, pipeline, store
+
+general_logger = logs.setup_logging_general(f"{__name__}.general")
+exception_logger = logs.setup_logging_exception(f"{__name__}.exception")
+
+# The number of requests to find the pages of a word, when the store does not know its page.
+QUERY_COST = 1
+# The number of requests to write a page, on top of one deletion by existing page: the creation and the update.
+WRITE_COST = 2
+
+
+class Refresher:
+    """A class to fetch the stalest words again, and to write the changed ones within a request budget."""
+
+    def __init__(
+        self,
+        word_pipeline: pipeline.Pipeline,
+        word_store: store.WordStore,
+        budget: int,
+    ) -> None:
+        """The initialization function of Refresher.
+
+        Args:
+            word_pipeline (pipeline.Pipeline): The pipeline fetching the words, in dry run.
+            word_store (store.WordStore): The store of the words, with their content hash and synchronization time.
+            budget (int): The maximum number of requests sent to the Notion API.
+        """
+        self.pipeline = word_pipeline
+        self.store = word_store
+        self.budget = budget
+        self.counts = collections.Counter()
+        self.start_count = word_pipeline.get_request_count()
+
+    def get_used(self) -> int:
+        """Get the number of requests sent to the Notion API since the refresh started.
+
+        Returns:
+            int: The number of requests.
+        """
+        return self.pipeline.get_request_count() - self.start_count
+
+    def get_page_ids(
+        self,
+        entry: dict,
+        payloads: dict,
+        integration: notion.Integration,
+        session: pipeline.requests.sessions.Session,
+    ) -> list[str] | None:
+        """Get the pages of a word to be replaced, from the store, or from its database within the budget.
+
+        Args:
+            entry (dict): The entry of the word in the store.
+            payloads (dict): The payloads of the word, returned by notion.NotionSync.get_payloads.
+            integration (notion.Integration): The integration of the word.
+            session (requests.sessions.Session): The session used to query the database.
+
+        Returns:
+            list[str] | None: The ID of the pages, or None if the budget does not allow to query them.
+        """
+        if entry["page_id"]:
+            return [entry["page_id"]]
+        if self.get_used() + QUERY_COST + WRITE_COST > self.budget:
+            return None
+        return notion.NotionSync.get_database_id(
+            notion.get_headers(integration),
+            notion.NotionSync.get_query_payload(payloads["title"]),
+            session,
+            integration,
+        )
+
+    def run(self, limit: int):
+        """Fetch the stalest words again, and write the ones which have changed.
+
+        Args:
+            limit (int): The maximum number of words to be fetched.
+
+        Yields:
+            list: The result of each word, like the ones of pipeline.worker_process, with "unchanged" or "deferred" as status when the page is not written.
+        """
+        entries = {
+            (entry["word"], entry["lang"]): entry
+            for entry in self.store.get_stalest(limit)
+        }
+        general_logger.debug("Refreshing %i word(s).", len(entries))
+        for key in entries:
+            self.pipeline.forget(key)
+        session = pipeline.requests.Session()
+        for result in self.pipeline.run([list(key) for key in entries]):
+            entry = entries[(result[0], result[1])]
+            if "success" != result[2]:
+                self.counts["failed"] += 1
+                yield result
+                continue
+            data = result[3]
+            if store.get_content_hash(data) == entry["content_hash"]:
+                self.store.touch(entry["id"])
+                self.counts["unchanged"] += 1
+                yield [result[0], result[1], "unchanged", data, entry["page_id"]]
+                continue
+            integration = notion.get_integration(result[0], result[1])
+            headers = notion.get_headers(integration)
+            payloads = notion.NotionSync.get_payloads(data)
+            try:
+                page_ids = self.get_page_ids(entry, payloads, integration, session)
+                if page_ids is None or (
+                    self.get_used() + len(page_ids) + WRITE_COST > self.budget
+                ):
+                    # Left as it is, so that it is among the stalest words of the next refresh.
+                    self.counts["deferred"] += 1
+                    yield [result[0], result[1], "deferred", data, None]
+                    continue
+                page_id = notion.NotionSync.publish(
+                    payloads, headers, session, page_ids, integration
+                )
+            except Exception as error:  # pylint: disable=broad-except
+                exception_logger.exception("Caught an unexpected error.", exc_info=True)
+                self.counts["failed"] += 1
+                yield [result[0], result[1], "error", error]
+                continue
+            self.store.add_many([(result[0], result[1], data, page_id)])
+            self.pipeline.index.set(payloads["title"], page_id, integration.database_id)
+            self.counts["updated"] += 1
+            yield [result[0], result[1], "success", data, page_id]
@@ -0,0 +1,112 @@
+"""A custom module to decide which word is sent to the workers next.
+
+The words with the highest priority are always sent first. Between words of the same
+priority, the languages take turns, so that a large batch in one language does not hold
+back the others, and each language can be limited to a number of words in flight, as
+Google throttles the bursts of requests in one language.
+"""
+
+# System imports
+import collections
+import heapq
+import itertools
+
+# Custom imports
+from notion_word_data import logs
+
+general_logger = logs.setup_logging_general(f"{__name__}.general")
+
+# The default priority of a word, when WORDS.md does not give one.
+DEFAULT_PRIORITY = 0
+
+
+class FairScheduler:
+    """A class keeping a queue of words by language, served by priority, then in turn."""
+
+    def __init__(self, language_concurrency: int | None = None) -> None:
+        """The initialization function of FairScheduler.
+
+        Args:
+            language_concurrency (int | None, optional): The maximum number of words in flight by language. Defaults to no limit.
+        """
+        self.language_concurrency = language_concurrency
+        # A heap of (-priority, order, word) by language, so that equal priorities keep their order.
+        self.queues = {}
+        # The languages, the next one to be served first.
+        self.turns = collections.deque()
+        self.running = collections.Counter()
+        self.order = itertools.count()
+
+    def __len__(self) -> int:
+        """Get the number of queued words.
+
+        Returns:
+            int: The number of queued words.
+        """
+        return sum(len(heap) for heap in self.queues.values())
+
+    def push(self, word: list[str], priority: int = DEFAULT_PRIORITY) -> None:
+        """Queue a word.
+
+        Args:
+            word (list[str]): A list containing the word and its language.
+            priority (int, optional): The priority of the word, the highest first. Defaults to DEFAULT_PRIORITY.
+        """
+        lang = word[1]
+        if lang not in self.queues:
+            self.queues[lang] = []
+            self.turns.append(lang)
+        heapq.heappush(self.queues[lang], (-priority, next(self.order), list(word[:2])))
+
+    def pop(self) -> list[str] | None:
+        """Get the next word to be sent, and count it as running.
+
+        Returns:
+            list[str] | None: A list containing the word and its language, or None if no language can be served.
+        """
+        best_lang = None
+        best_priority = None
+        for lang in self.turns:
+            heap = self.queues[lang]
+            if not heap:
+                continue
+            if (
+                self.language_concurrency is not None
+                and self.running[lang] >= self.language_concurrency
+            ):
+                continue
+            # The turns are in order, so the first language with the best priority is served.
+            if best_priority is None or heap[0][0] < best_priority:
+                best_lang = lang
+                best_priority = heap[0][0]
+        if best_lang is None:
+            return None
+        _, _, word = heapq.heappop(self.queues[best_lang])
+        self.running[best_lang] += 1
+        # The served language waits for every other language before its next turn.
+        self.turns.remove(best_lang)
+        if self.queues[best_lang]:
+            self.turns.append(best_lang)
+        else:
+            del self.queues[best_lang]
+        return word
+
+    def clear(self) -> list[list[str]]:
+        """Remove every queued word, keeping the count of the running ones.
+
+        Returns:
+            list[list[str]]: A list containing each removed word and its language.
+        """
+        words = [word for heap in self.queues.values() for _, _, word in heap]
+        self.queues.clear()
+        self.turns.clear()
+        return words
+
+    def done(self, word: list[str]) -> None:
+        """Count a word as finished.
+
+        Args:
+            word (list[str]): A list containing the word and its language.
+        """
+        if self.running[word[1]] > 0:
+            self.running[word[1]] -= 1
@@ -0,0 +1,386 @@
+"""A custom module to receive words from other tools through a local HTTP API.
+
+Endpoints:
+    POST /jobs: Add a job, from a body like {"words": [["Example", "en"], ["Exemple", "fr"]]}.
+    GET /jobs/<job_id>: Get the status of a job.
+    GET /jobs/<job_id>/results: Get the result of each word of a job.
+    GET /stats: Get the throughput and the backlog of each Notion integration.
+"""
+
+# System imports
+import contextlib
+import http.server
+import json
+import signal
+import sqlite3
+import threading
+import time
+import uuid
+
+# Custom imports
+from notion_word_data import languages, logs, pipeline, utils
+
+general_logger = logs.setup_logging_general(f"{__name__}.general")
+exception_logger = logs.setup_logging_exception(f"{__name__}.exception")
+
+JOBS_FILE = "jobs.sqlite3"
+# The maximum number of words in a job.
+MAX_JOB_WORDS = 1000
+# The maximum size of a request body, in bytes.
+MAX_BODY_SIZE = 1_000_000
+
+
+class JobQueue:
+    """A class to keep the jobs and the state of their words in an SQLite database."""
+
+    def __init__(self, file_name: str = JOBS_FILE) -> None:
+        """The initialization function of JobQueue.
+
+        Args:
+            file_name (str, optional): The file name of the database. Defaults to JOBS_FILE.
+        """
+        self.file_name = file_name
+        with self.connect() as connection:
+            connection.executescript(
+                """
+                PRAGMA journal_mode = WAL;
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    created_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS job_words (
+                    job_id TEXT NOT NULL REFERENCES jobs (id),
+                    position INTEGER NOT NULL,
+                    word TEXT NOT NULL,
+                    lang TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    result TEXT,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (job_id, position)
+                );
+                CREATE INDEX IF NOT EXISTS job_words_status ON job_words (status);
+                """
+            )
+
+    @contextlib.contextmanager
+    def connect(self):
+        """Open a transaction in a new connection, as each thread needs its own.
+
+        Yields:
+            sqlite3.Connection: The connection, committed and closed when leaving.
+        """
+        connection = sqlite3.connect(self.file_name, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def add(self, words: list[list], cached: dict) -> str:
+        """Add a job.
+
+        Args:
+            words (list[list]): A list containing each word of the job and its language.
+            cached (dict): The data of the words already known, by (word, language).
+
+        Returns:
+            str: The job ID.
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self.connect() as connection:
+            connection.execute("INSERT INTO jobs VALUES (?, ?)", (job_id, now))
+            connection.executemany(
+                "INSERT INTO job_words VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        job_id,
+                        position,
+                        word[0],
+                        word[1],
+                        "cached" if tuple(word) in cached else "pending",
+                        json.dumps({"data": cached[tuple(word)]})
+                        if tuple(word) in cached
+                        else None,
+                        now,
+                    )
+                    for position, word in enumerate(words)
+                ],
+            )
+        general_logger.debug("Added job %s with %i word(s).", job_id, len(words))
+        return job_id
+
+    def get_pending(self) -> list[list[str]]:
+        """Get the words which have not been sent to the pipeline yet.
+
+        Returns:
+            list[list[str]]: A list containing each pending word and its language.
+        """
+        with self.connect() as connection:
+            # Locked, so that no job can be added between the two queries.
+            connection.execute("BEGIN IMMEDIATE")
+            rows = connection.execute(
+                "SELECT DISTINCT word, lang FROM job_words WHERE status = 'pending'"
+            ).fetchall()
+            connection.execute(
+                "UPDATE job_words SET status = 'running' WHERE status = 'pending'"
+            )
+        return [list(row) for row in rows]
+
+    def reset_running(self) -> None:
+        """Set the words interrupted by a previous stop as pending again."""
+        with self.connect() as connection:
+            connection.execute(
+                "UPDATE job_words SET status = 'pending' WHERE status = 'running'"
+            )
+
+    def set_result(self, result: list) -> None:
+        """Set the result of a word, for every job waiting for it.
+
+        Args:
+            result (list): The result returned by pipeline.worker_process.
+        """
+        if "success" == result[2]:
+            status = "success"
+            content = {"data": result[3], "page_id": result[4]}
+        else:
+            status = result[2]
+            content = {
+                "error": result[3].__class__.__name__,
+                "message": str(result[3]),
+            }
+        with self.connect() as connection:
+            connection.execute(
+                "UPDATE job_words SET status = ?, result = ?, updated_at = ? "
+                "WHERE word = ? AND lang = ? AND status = 'running'",
+                (status, json.dumps(content), time.time(), result[0], result[1]),
+            )
+
+    def get_status(self, job_id: str) -> dict | None:
+        """Get the status of a job.
+
+        Args:
+            job_id (str): The job ID.
+
+        Returns:
+            dict | None: The status of the job and the number of words by status, or None if the job does not exist.
+        """
+        with self.connect() as connection:
+            job = connection.execute(
+                "SELECT created_at FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if job is None:
+                return None
+            counts = dict(
+                connection.execute(
+                    "SELECT status, COUNT(*) FROM job_words "
+                    "WHERE job_id = ? GROUP BY status",
+                    (job_id,),
+                ).fetchall()
+            )
+        done = not counts.get("pending") and not counts.get("running")
+        return {
+            "job_id": job_id,
+            "status": "done" if done else "running",
+            "created_at": job[0],
+            "words": counts,
+        }
+
+    def get_results(self, job_id: str) -> list[dict]:
+        """Get the result of each word of a job.
+
+        Args:
+            job_id (str): The job ID.
+
+        Returns:
+            list[dict]: The result of each word, in the order of the job.
+        """
+        with self.connect() as connection:
+            rows = connection.execute(
+                "SELECT word, lang, status, result FROM job_words "
+                "WHERE job_id = ? ORDER BY position",
+                (job_id,),
+            ).fetchall()
+        return [
+            {
+                "word": word,
+                "lang": lang,
+                "status": status,
+                **json.loads(result or "{}"),
+            }
+            for word, lang, status, result in rows
+        ]
+
+
+class RequestHandler(http.server.BaseHTTPRequestHandler):
+    """A class to answer the requests of the HTTP API."""
+
+    server: "JobServer"
+
+    def send_json(self, status: int, content: dict | list) -> None:
+        """Send a JSON response.
+
+        Args:
+            status (int): The HTTP status code.
+            content (dict | list): The content of the response.
+        """
+        body = json.dumps(content).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+        """Log a request with the package loggers rather than on stderr."""
+        general_logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Answer GET /jobs/<job_id>, GET /jobs/<job_id>/results and GET /stats."""
+        parts = self.path.strip("/").split("/")
+        if parts == ["stats"]:
+            self.send_json(200, self.server.pipeline.get_shard_stats())
+            return
+        if len(parts) not in (2, 3) or parts[0] != "jobs":
+            self.send_json(404, {"error": "Not found."})
+            return
+        status = self.server.jobs.get_status(parts[1])
+        if status is None:
+            self.send_json(404, {"error": f'The job "{parts[1]}" does not exist.'})
+        elif len(parts) == 2:
+            self.send_json(200, status)
+        elif parts[2] == "results":
+            self.send_json(200, self.server.jobs.get_results(parts[1]))
+        else:
+            self.send_json(404, {"error": "Not found."})
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Answer POST /jobs."""
+        if self.path.strip("/") != "jobs":
+            self.send_json(404, {"error": "Not found."})
+            return
+        try:
+            words = self.read_words()
+        except ValueError as error:
+            self.send_json(400, {"error": str(error)})
+            return
+        cached = {}
+        for word in words:
+            data = self.server.pipeline.get_cached(word)
+            if data is not None:
+                cached[tuple(word)] = data
+        job_id = self.server.jobs.add(words, cached)
+        self.server.wake_up.set()
+        self.send_json(202, self.server.jobs.get_status(job_id))
+
+    def read_words(self) -> list[list[str]]:
+        """Read and validate the words of a POST request.
+
+        Raises:
+            ValueError: An exception to indicate that the request body is invalid.
+
+        Returns:
+            list[list[str]]: A list containing each word and its language.
+        """
+        length = int(self.headers.get("Content-Length") or 0)
+        if not 0 < length <= MAX_BODY_SIZE:
+            raise ValueError(
+                f"The body must contain between 1 and {MAX_BODY_SIZE} bytes."
+            )
+        try:
+            body = json.loads(self.rfile.read(length))
+            words = []
+            for word in body["words"]:
+                if isinstance(word, dict):
+                    word = [word["word"], word.get("lang", "en")]
+                words.append([utils.prettify(word[0]), utils.prettify(word[1]).lower()])
+        except (json.JSONDecodeError, AttributeError, IndexError, KeyError, TypeError):
+            raise ValueError(
+                'The body must look like {"words": [["Example", "en"], ...]}.'
+            ) from None
+        if not 0 < len(words) <= MAX_JOB_WORDS:
+            raise ValueError(f"A job must contain between 1 and {MAX_JOB_WORDS} words.")
+        _, invalid_words = languages.get_registry().validate(words)
+        if invalid_words:
+            raise ValueError(str(invalid_words[0][2]))
+        return words
+
+
+class JobServer(http.server.ThreadingHTTPServer):
+    """A class serving the HTTP API, while the main thread sends the jobs to a warm pipeline."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        word_pipeline: pipeline.Pipeline,
+        address: tuple[str, int],
+        jobs: JobQueue | None = None,
+    ) -> None:
+        """The initialization function of JobServer.
+
+        Args:
+            word_pipeline (pipeline.Pipeline): The pipeline processing the words.
+            address (tuple[str, int]): The host and the port to listen to.
+            jobs (JobQueue | None, optional): The job queue. Defaults to JOBS_FILE.
+        """
+        super().__init__(address, RequestHandler)
+        self.pipeline = word_pipeline
+        self.jobs = jobs or JobQueue()
+        self.stopping = threading.Event()
+        self.wake_up = threading.Event()
+
+    def stop(self, *_) -> None:
+        """Stop accepting new jobs, and finish the words in flight."""
+        if not self.stopping.is_set():
+            general_logger.info("Stopping after the words in flight...")
+        self.stopping.set()
+        self.wake_up.set()
+
+    def run(self, interval: float = 1.0) -> None:
+        """Serve the HTTP API until a SIGINT or a SIGTERM is received.
+
+        Args:
+            interval (float, optional): The time between two checks for new jobs, in seconds. Defaults to 1.0.
+        """
+        previous_handlers = {
+            signum: signal.signal(signum, self.stop)
+            for signum in (signal.SIGINT, signal.SIGTERM)
+        }
+        self.jobs.reset_running()
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        general_logger.info("Listening on http://%s:%i.", *self.server_address[:2])
+        try:
+            while not self.stopping.is_set():
+                # A word already in flight for another job shares its result.
+                for word in self.jobs.get_pending():
+                    self.pipeline.submit(word)
+                self.handle_results(interval)
+            self.shutdown()
+            # The queued words of the jobs are sent again on the next start.
+            self.pipeline.drop_queued()
+            while self.pipeline.in_flight:
+                self.handle_results(interval)
+        finally:
+            self.server_close()
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+    def handle_results(self, timeout: float) -> None:
+        """Save the results of the workers.
+
+        Args:
+            timeout (float): The maximum time to wait for a result or a new job, in seconds.
+        """
+        self.wake_up.clear()
+        if not self.pipeline.in_flight:
+            self.wake_up.wait(timeout)
+            return
+        result = self.pipeline.get_result(timeout)
+        while result is not None:
+            pipeline.log_result(result)
+            self.jobs.set_result(result)
+            if self.wake_up.is_set():
+                return
+            result = self.pipeline.get_result(0)
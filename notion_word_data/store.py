@@ -0,0 +1,368 @@
+"""A custom module to keep every fetched word in a local SQLite database, and to query it offline.
+
+Usage:
+    python -m notion_word_data.store lookup Test
+    python -m notion_word_data.store synonym-of Trial --lang en
+    python -m notion_word_data.store search "quality of something"
+"""
+
+# System imports
+import argparse
+import contextlib
+import hashlib
+import json
+import sqlite3
+import time
+
+# Custom imports
+from notion_word_data import errors, logs, utils
+
+general_logger = logs.setup_logging_general(f"{__name__}.general")
+
+STORE_FILE = "words.sqlite3"
+SCHEMA = """
+PRAGMA journal_mode = WAL;
+CREATE TABLE IF NOT EXISTS words (
+    id INTEGER PRIMARY KEY,
+    word TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    title TEXT NOT NULL,
+    page_id TEXT,
+    content_hash TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    UNIQUE (title, lang)
+);
+CREATE INDEX IF NOT EXISTS words_word ON words (word COLLATE NOCASE, lang);
+CREATE INDEX IF NOT EXISTS words_synced_at ON words (synced_at);
+CREATE TABLE IF NOT EXISTS parts_of_speech (
+    id INTEGER PRIMARY KEY,
+    word_id INTEGER NOT NULL REFERENCES words (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS parts_of_speech_word ON parts_of_speech (word_id);
+CREATE TABLE IF NOT EXISTS senses (
+    id INTEGER PRIMARY KEY,
+    pos_id INTEGER NOT NULL REFERENCES parts_of_speech (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    definition TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS senses_pos ON senses (pos_id);
+CREATE TABLE IF NOT EXISTS examples (
+    id INTEGER PRIMARY KEY,
+    sense_id INTEGER NOT NULL REFERENCES senses (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS examples_sense ON examples (sense_id);
+CREATE TABLE IF NOT EXISTS synonyms (
+    id INTEGER PRIMARY KEY,
+    sense_id INTEGER NOT NULL REFERENCES senses (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS synonyms_sense ON synonyms (sense_id);
+CREATE INDEX IF NOT EXISTS synonyms_text ON synonyms (text COLLATE NOCASE);
+CREATE VIRTUAL TABLE IF NOT EXISTS senses_fts USING fts5 (
+    definition, content = 'senses', content_rowid = 'id'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS synonyms_fts USING fts5 (
+    text, content = 'synonyms', content_rowid = 'id'
+);
+CREATE TRIGGER IF NOT EXISTS senses_insert AFTER INSERT ON senses BEGIN
+    INSERT INTO senses_fts (rowid, definition) VALUES (new.id, new.definition);
+END;
+CREATE TRIGGER IF NOT EXISTS senses_delete AFTER DELETE ON senses BEGIN
+    INSERT INTO senses_fts (senses_fts, rowid, definition)
+    VALUES ('delete', old.id, old.definition);
+END;
+CREATE TRIGGER IF NOT EXISTS synonyms_insert AFTER INSERT ON synonyms BEGIN
+    INSERT INTO synonyms_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS synonyms_delete AFTER DELETE ON synonyms BEGIN
+    INSERT INTO synonyms_fts (synonyms_fts, rowid, text)
+    VALUES ('delete', old.id, old.text);
+END;
+"""
+
+
+@staticmethod
+def get_content_hash(data: dict) -> str:
+    """Get a hash of the data of a word, to know if it has changed.
+
+    Args:
+        data (dict): The data of the word, as set by WordData.
+
+    Returns:
+        str: The hash of the data.
+    """
+    return hashlib.sha256(
+        json.dumps(data, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+class WordStore:
+    """A class to keep the data of the words in a normalized SQLite database, with full-text indexes."""
+
+    def __init__(self, file_name: str = STORE_FILE) -> None:
+        """The initialization function of WordStore.
+
+        Args:
+            file_name (str, optional): The file name of the database. Defaults to STORE_FILE.
+        """
+        self.file_name = file_name
+        with self.connect() as connection:
+            connection.executescript(SCHEMA)
+
+    @contextlib.contextmanager
+    def connect(self):
+        """Open a transaction in a new connection.
+
+        Yields:
+            sqlite3.Connection: The connection, committed and closed when leaving.
+        """
+        connection = sqlite3.connect(self.file_name, timeout=30)
+        connection.execute("PRAGMA foreign_keys = ON")
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def add_many(self, entries: list[tuple]) -> None:
+        """Add or replace the data of several words, in a single transaction.
+
+        Args:
+            entries (list[tuple]): The word, its language, its data and its Notion page ID, for each word.
+        """
+        if not entries:
+            return
+        now = time.time()
+        with self.connect() as connection:
+            for word, lang, data, page_id in entries:
+                title = utils.dict_get_element_by_index(data, 0)
+                connection.execute(
+                    "DELETE FROM words WHERE title = ? AND lang = ?", (title, lang)
+                )
+                word_id = connection.execute(
+                    "INSERT INTO words "
+                    "(word, lang, title, page_id, content_hash, synced_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (word, lang, title, page_id, get_content_hash(data), now),
+                ).lastrowid
+                self.add_senses(connection, word_id, data[title])
+        general_logger.debug("Stored %i word(s).", len(entries))
+
+    @classmethod
+    def add_senses(
+        cls, connection: sqlite3.Connection, word_id: int, parts_of_speech: dict
+    ) -> None:
+        """Add the parts of speech of a word, and their definitions, examples and synonyms.
+
+        Args:
+            connection (sqlite3.Connection): The connection to the database.
+            word_id (int): The ID of the word in the database.
+            parts_of_speech (dict): The definitions of the word, by part of speech.
+        """
+        for pos_position, (pos, definitions) in enumerate(parts_of_speech.items()):
+            pos_id = connection.execute(
+                "INSERT INTO parts_of_speech (word_id, position, name) "
+                "VALUES (?, ?, ?)",
+                (word_id, pos_position, pos),
+            ).lastrowid
+            for position, (definition, infos) in enumerate(definitions.items()):
+                sense_id = connection.execute(
+                    "INSERT INTO senses (pos_id, position, definition) "
+                    "VALUES (?, ?, ?)",
+                    (pos_id, position, definition),
+                ).lastrowid
+                for table, texts in (("examples", infos[0]), ("synonyms", infos[1])):
+                    connection.executemany(
+                        f"INSERT INTO {table} (sense_id, position, text) "
+                        "VALUES (?, ?, ?)",
+                        [(sense_id, index, text) for index, text in enumerate(texts)],
+                    )
+
+    def get_data(self, connection: sqlite3.Connection, word_id: int) -> dict:
+        """Rebuild the data of a word, in the format of WordData.
+
+        Args:
+            connection (sqlite3.Connection): The connection to the database.
+            word_id (int): The ID of the word in the database.
+
+        Returns:
+            dict: The data of the word.
+        """
+        title = connection.execute(
+            "SELECT title FROM words WHERE id = ?", (word_id,)
+        ).fetchone()[0]
+        data = {title: {}}
+        senses = {}
+        for pos, sense_id, definition in connection.execute(
+            "SELECT parts_of_speech.name, senses.id, senses.definition "
+            "FROM parts_of_speech JOIN senses ON senses.pos_id = parts_of_speech.id "
+            "WHERE parts_of_speech.word_id = ? "
+            "ORDER BY parts_of_speech.position, senses.position",
+            (word_id,),
+        ):
+            senses[sense_id] = data[title].setdefault(pos, {})[definition] = [[], []]
+        for table, index in (("examples", 0), ("synonyms", 1)):
+            for sense_id, text in connection.execute(
+                f"SELECT sense_id, text FROM {table} WHERE sense_id IN "
+                "(SELECT senses.id FROM senses JOIN parts_of_speech "
+                "ON senses.pos_id = parts_of_speech.id WHERE word_id = ?) "
+                "ORDER BY sense_id, position",
+                (word_id,),
+            ):
+                senses[sense_id][index].append(text)
+        return data
+
+    def get_stalest(self, limit: int) -> list[dict]:
+        """Get the words synchronized the longest time ago.
+
+        Args:
+            limit (int): The maximum number of words.
+
+        Returns:
+            list[dict]: The ID, word, language, title, page ID, content hash and synchronization time of each word, the oldest first.
+        """
+        with self.connect() as connection:
+            connection.row_factory = sqlite3.Row
+            rows = connection.execute(
+                "SELECT id, word, lang, title, page_id, content_hash, synced_at "
+                "FROM words ORDER BY synced_at LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def touch(self, word_id: int) -> None:
+        """Set a word as synchronized now, when it has not changed.
+
+        Args:
+            word_id (int): The ID of the word in the database.
+        """
+        with self.connect() as connection:
+            connection.execute(
+                "UPDATE words SET synced_at = ? WHERE id = ?", (time.time(), word_id)
+            )
+
+    def lookup(self, word: str, lang: str | None = None) -> list[dict]:
+        """Get the data of a word, searched by its title or by the word it was fetched with.
+
+        Args:
+            word (str): The word.
+            lang (str | None, optional): The language of the word. Defaults to every language.
+
+        Returns:
+            list[dict]: The data of each matching word.
+        """
+        with self.connect() as connection:
+            rows = connection.execute(
+                "SELECT id FROM words WHERE (title = ? COLLATE NOCASE "
+                "OR word = ? COLLATE NOCASE) AND (? IS NULL OR lang = ?)",
+                (word, word, lang, lang),
+            ).fetchall()
+            return [self.get_data(connection, row[0]) for row in rows]
+
+    def synonym_of(self, synonym: str, lang: str | None = None) -> list[tuple]:
+        """Get the words which have a given synonym.
+
+        Args:
+            synonym (str): The synonym.
+            lang (str | None, optional): The language of the words. Defaults to every language.
+
+        Returns:
+            list[tuple]: The title, language, part of speech and definition of each matching sense.
+        """
+        with self.connect() as connection:
+            return connection.execute(
+                "SELECT DISTINCT words.title, words.lang, parts_of_speech.name, "
+                "senses.definition "
+                "FROM synonyms "
+                "JOIN senses ON synonyms.sense_id = senses.id "
+                "JOIN parts_of_speech ON senses.pos_id = parts_of_speech.id "
+                "JOIN words ON parts_of_speech.word_id = words.id "
+                "WHERE synonyms.text = ? COLLATE NOCASE "
+                "AND (? IS NULL OR words.lang = ?) "
+                "ORDER BY words.title",
+                (synonym, lang, lang),
+            ).fetchall()
+
+    def search(self, text: str, limit: int = 20) -> list[tuple]:
+        """Search the definitions and the synonyms with a full-text query.
+
+        Args:
+            text (str): The full-text query (see the FTS5 query syntax).
+            limit (int, optional): The maximum number of results. Defaults to 20.
+
+        Raises:
+            errors.InvalidQuery: An exception to indicate that the query is not valid FTS5 syntax.
+
+        Returns:
+            list[tuple]: The title, language, part of speech and definition of each matching sense, best first.
+        """
+        with self.connect() as connection:
+            try:
+                return connection.execute(
+                    "SELECT words.title, words.lang, parts_of_speech.name, "
+                    "senses.definition FROM ("
+                    "SELECT rowid AS sense_id, rank FROM senses_fts "
+                    "WHERE senses_fts MATCH ? "
+                    "UNION ALL "
+                    "SELECT synonyms.sense_id, synonyms_fts.rank FROM synonyms_fts "
+                    "JOIN synonyms ON synonyms.id = synonyms_fts.rowid "
+                    "WHERE synonyms_fts MATCH ?"
+                    ") AS matches "
+                    "JOIN senses ON matches.sense_id = senses.id "
+                    "JOIN parts_of_speech ON senses.pos_id = parts_of_speech.id "
+                    "JOIN words ON parts_of_speech.word_id = words.id "
+                    "GROUP BY senses.id ORDER BY MIN(matches.rank) LIMIT ?",
+                    (text, text, limit),
+                ).fetchall()
+            except sqlite3.OperationalError as error:
+                raise errors.InvalidQuery(text, str(error)) from error
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Answer a query from the command line.
+
+    Args:
+        argv (list[str] | None, optional): The command line arguments. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Query the local word store.")
+    parser.add_argument("--store", default=STORE_FILE, help="the database file")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    lookup_parser = subparsers.add_parser("lookup", help="get the data of a word")
+    lookup_parser.add_argument("word")
+    lookup_parser.add_argument("--lang")
+    synonym_parser = subparsers.add_parser(
+        "synonym-of", help="get the words which have a given synonym"
+    )
+    synonym_parser.add_argument("synonym")
+    synonym_parser.add_argument("--lang")
+    search_parser = subparsers.add_parser(
+        "search", help="search the definitions and the synonyms"
+    )
+    search_parser.add_argument("text")
+    search_parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    word_store = WordStore(args.store)
+    if args.command == "lookup":
+        for data in word_store.lookup(args.word, args.lang):
+            print(json.dumps(data, ensure_ascii=False, indent=2))
+    else:
+        try:
+            rows = (
+                word_store.synonym_of(args.synonym, args.lang)
+                if args.command == "synonym-of"
+                else word_store.search(args.text, args.limit)
+            )
+        except errors.InvalidQuery as error:
+            parser.error(str(error))
+        for title, lang, pos, definition in rows:
+            print(f"{title} ({lang}, {pos}): {definition}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""A custom module to limit the rate of the requests sent by every process."""
+
+# System imports
+import multiprocessing
+import time
+
+
+class RateLimiter:
+    """A rate limiter shared by the main process and its workers."""
+
+    def __init__(self, rate: float) -> None:
+        """The initialization function of RateLimiter.
+
+        Args:
+            rate (float): The maximum number of requests per second.
+        """
+        self.rate = rate
+        self.interval = 1 / rate
+        # The time of the next free slot, shared between the processes.
+        self.next_slot = multiprocessing.Value("d", 0.0)
+        # The number of requests sent since the creation of the rate limiter.
+        self.count = multiprocessing.Value("L", 0, lock=False)
+        self.created_at = time.monotonic()
+
+    def acquire(self) -> float:
+        """Wait until a request can be sent.
+
+        Returns:
+            float: The time waited, in seconds.
+        """
+        with self.next_slot.get_lock():
+            now = time.monotonic()
+            slot = max(now, self.next_slot.value)
+            self.next_slot.value = slot + self.interval
+            self.count.value += 1
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def backlog(self) -> float:
+        """Get the time needed to send the requests which are already waiting.
+
+        Returns:
+            float: The time, in seconds.
+        """
+        return max(0.0, self.next_slot.value - time.monotonic())
+
+    def throughput(self) -> float:
+        """Get the average number of requests per second since the creation of the rate limiter.
+
+        Returns:
+            float: The number of requests per second.
+        """
+        return self.count.value / max(time.monotonic() - self.created_at, 1e-9)
@@ -1,5 +1,10 @@
 """A custom module for utility functions."""
 
+# System imports
+import importlib.util
+import sys
+import types
+
 
 @staticmethod
 def prettify(something: str) -> str:
@@ -30,3 +35,24 @@ def dict_get_element_by_index(dictionary: dict, index: int) -> str:
         str: The value corresponding to the key index given.
     """
     return list(dictionary.keys())[index]
+
+
+@staticmethod
+def lazy_import(name: str) -> types.ModuleType:
+    """Get a module which is only imported the first time one of its attributes is used.
+
+    Args:
+        name (str): The name of the module you want to import.
+
+    Returns:
+        types.ModuleType: The module, or a placeholder loading it on first use.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
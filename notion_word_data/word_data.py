@@ -1,15 +1,17 @@
 """A custom module to fetch Google Dictionary's data for a given word."""
 
+from __future__ import annotations
+
 # System imports
 import random
 import types
 
-# Third party imports
-import bs4
-import requests
-
 # Custom imports
-from notion_word_data import errors, logs, utils
+from notion_word_data import errors, languages, logs, profiles, utils
+
+# Third party imports
+bs4 = utils.lazy_import("bs4")
+requests = utils.lazy_import("requests")
 
 general_logger = logs.setup_logging_general(f"{__name__}.general")
 
@@ -18,17 +20,22 @@ class WordData:
     """A class to fetch Google Dictionary's data for a given word, in a given language."""
 
     def __init__(
-        self, word: str, lang: str, session: requests.sessions.Session
+        self,
+        word: str,
+        lang: str,
+        session: requests.sessions.Session | None,
+        content: bytes | None = None,
     ) -> None:
         """The initialization function of WordData.
 
         Args:
             word (str): The word you want to fetch data for.
             lang (str): The language you want to fetch data in.
-            session (requests.sessions.Session): The session used to fetch data.
+            session (requests.sessions.Session | None): The session used to fetch data, unused if the content is given.
+            content (bytes | None, optional): The page of the word, if already fetched. Defaults to fetching it.
         """
 
-        self.check_language(lang)
+        self.language = self.check_language(lang)
 
         self.search_word = word.lower()
         self.queried_language = lang.lower()
@@ -37,28 +44,52 @@ class WordData:
             self.search_word,
             self.queried_language,
         )
-        self.url = f"https://www.google.com/search?hl={self.queried_language}&q=define+{self.search_word}&num=1"
+        self.url = self.get_url(self.search_word, self.language)
         self.data = {}
+        self.profile = None
 
-        self.consent_cookie = (
-            f"YES+cb.20220219-22-p0.en-US+FX+{random.randint(100, 900)}"
-        )
-        self.headers = {
-            "cookie": f"CONSENT={self.consent_cookie};",
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/99.0.4844.83 Safari/537.36",
-        }
+        self.headers = self.get_request_headers()
         self.session = session
 
         def fetch_word_data() -> None:
             """Fetch Google Dictionary's data for a given word."""
-            response = self.get_web_data(self.url, self.headers, self.session)
-            soup = self.parse_web_data(response)
+            if content is None:
+                response = self.get_web_data(self.url, self.headers, self.session)
+                soup = self.parse_web_data(response)
+            else:
+                soup = self.parse_content(content)
             self.set_word_data(soup)
 
         fetch_word_data()
 
     @classmethod
-    def check_language(cls, lang: str) -> None:
+    def get_url(cls, word: str, language: languages.Language) -> str:
+        """Get the URL of the Google Search page of a word.
+
+        Args:
+            word (str): The word, in lowercase.
+            language (languages.Language): The language of the page.
+
+        Returns:
+            str: The URL of the page.
+        """
+        return f"https://www.google.com/search?hl={language.hl}&q=define+{word}&num=1"
+
+    @classmethod
+    def get_request_headers(cls) -> dict:
+        """Get the headers of a request to Google Search, with a new consent cookie.
+
+        Returns:
+            dict: The headers.
+        """
+        consent_cookie = f"YES+cb.20220219-22-p0.en-US+FX+{random.randint(100, 900)}"
+        return {
+            "cookie": f"CONSENT={consent_cookie};",
+            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/99.0.4844.83 Safari/537.36",
+        }
+
+    @classmethod
+    def check_language(cls, lang: str) -> languages.Language:
         """Check if a given language is valid.
 
         Args:
@@ -66,11 +97,12 @@ class WordData:
 
         Raises:
             errors.InvalidLanguage: An exception to indicate that the given language cannot be found in SUPPORTED_LANGUAGES.md.
+
+        Returns:
+            languages.Language: The corresponding supported language.
         """
         general_logger.debug('Checking the validity of "%s".', lang)
-        with open("SUPPORTED_LANGUAGES.md", "r", encoding="utf-8") as file:
-            if ("```" + lang.lower() + "```") not in file.read():
-                raise errors.InvalidLanguage(lang)
+        return languages.get_registry().get(lang)
 
     @classmethod
     def get_web_data(
@@ -101,8 +133,20 @@ class WordData:
         Returns:
             bs4.BeautifulSoup: The parsed data from the request result.
         """
+        return cls.parse_content(response.content)
+
+    @classmethod
+    def parse_content(cls, content: bytes) -> bs4.BeautifulSoup:
+        """Get the parsed data from the content of a page.
+
+        Args:
+            content (bytes): The content of the page.
+
+        Returns:
+            bs4.BeautifulSoup: The parsed data from the page.
+        """
         general_logger.debug("Parsing web data.")
-        soup = bs4.BeautifulSoup(response.content, "html.parser")
+        soup = bs4.BeautifulSoup(content, "html.parser")
         return soup
 
     def set_word_data(self, soup: bs4.BeautifulSoup) -> dict:
@@ -113,12 +157,15 @@ class WordData:
 
         Raises:
             errors.InvalidWord: An exception to indicate that the given word cannot be found on Google Search.
+            errors.UnknownLayout: An exception to indicate that no extraction profile matches the page.
         """
         general_logger.debug(
             'Setting word data for "%s" in "%s".',
             self.search_word,
             self.queried_language,
         )
+        # Detected once for the page, instead of failing on each missing element.
+        self.profile = profiles.detect(soup, self.queried_language, self.search_word)
 
         def set_word_name() -> None:
             """Set the word name.
@@ -131,7 +178,7 @@ class WordData:
                 self.search_word,
                 self.queried_language,
             )
-            name = soup.find(attrs={"data-dobid": "hdw"})
+            name = self.profile.select_one("name", soup)
             if not isinstance(name, types.NoneType):
                 self.data[utils.prettify(name.text)] = {}
             else:
@@ -146,9 +193,9 @@ class WordData:
                 self.search_word,
                 self.queried_language,
             )
-            pos_wrapper = soup.find_all("div", "lW8rQd")
+            pos_wrapper = self.profile.select("pos_wrapper", soup)
             for index, _ in enumerate(pos_wrapper, 0):
-                pos = pos_wrapper[index].find("span", "YrbPuc")
+                pos = self.profile.select_one("pos", pos_wrapper[index])
                 self.data[utils.dict_get_element_by_index(self.data, 0)][
                     utils.prettify(pos.text)
                 ] = {}
@@ -162,15 +209,13 @@ class WordData:
                 self.search_word,
                 self.queried_language,
             )
-            info_wrapper = soup.find_all("ol", "eQJLDd")
+            info_wrapper = self.profile.select("info_wrapper", soup)
             for index_wrapper, _ in enumerate(info_wrapper, 0):
-                info_number = info_wrapper[index_wrapper].find_all(
-                    "div", class_="thODed"
-                )
+                info_number = self.profile.select("sense", info_wrapper[index_wrapper])
                 for index_number, _ in enumerate(info_number, 0):
                     # Definitions
-                    definition = info_number[index_number].find(
-                        attrs={"data-dobid": "dfn"}
+                    definition = self.profile.select_one(
+                        "definition", info_number[index_number]
                     )
                     self.data[utils.dict_get_element_by_index(self.data, 0)][
                         utils.dict_get_element_by_index(
@@ -179,9 +224,7 @@ class WordData:
                         )
                     ][utils.prettify(definition.text)] = [[], []]
                     # Examples
-                    examples = info_number[index_number].find_all(
-                        "div", class_="ubHt5c"
-                    )
+                    examples = self.profile.select("example", info_number[index_number])
                     for example in examples:
                         self.data[utils.dict_get_element_by_index(self.data, 0)][
                             utils.dict_get_element_by_index(
@@ -194,10 +237,7 @@ class WordData:
                             "”" + utils.prettify((example.text).replace('"', "")) + "”"
                         )
                     # Synonyms
-                    synonyms = info_number[index_number].find_all(
-                        "div",
-                        class_="EmSASc gWUzU MR2UAc F5z5N jEdCLc LsYFnd p9F8Cd I6a0ee rjpYgb gjoUyf",
-                    )
+                    synonyms = self.profile.select("synonym", info_number[index_number])
                     for synonym in synonyms:
                         self.data[utils.dict_get_element_by_index(self.data, 0)][
                             utils.dict_get_element_by_index(
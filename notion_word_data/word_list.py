@@ -0,0 +1,223 @@
+"""A custom module to read the words of WORDS.md, and to delete the handled ones."""
+
+from __future__ import annotations
+
+# System imports
+import os
+
+# Custom imports
+from notion_word_data import (
+    dead_letter,
+    errors,
+    languages,
+    logs,
+    pipeline,
+    scheduler,
+    utils,
+)
+
+general_logger = logs.setup_logging_general(f"{__name__}.general")
+exception_logger = logs.setup_logging_exception(f"{__name__}.exception")
+
+
+def get_valid_words(
+    file_name: str,
+    index: int,
+    dead_letters: dead_letter.DeadLetterStore | None = None,
+    with_priority: bool = False,
+) -> list[list[str]]:
+    """Get the words of a file whose language is supported, and log the others.
+
+    Args:
+        file_name (str): The file name containing the words.
+        index (int): The number of lines that should be ignored at the beginning of the file.
+        dead_letters (dead_letter.DeadLetterStore | None, optional): The store where the invalid lines are moved. Defaults to keeping them in the file.
+        with_priority (bool, optional): True to also get the priority of each word. Defaults to False.
+
+    Returns:
+        list[list[str]]: A list containing each valid word, its language, and its priority if requested.
+    """
+    invalid_lines = []
+    words, invalid_words = languages.get_registry().validate(
+        get_words_to_find(
+            file_name, index, invalid_lines=invalid_lines, with_priority=with_priority
+        )
+    )
+    for word in invalid_words:
+        general_logger.warning(
+            'An error has been encountered trying to add the word "%s" for the language "%s". Error type: %s. Message: %s',
+            word[0],
+            word[1],
+            word[-1].__class__.__name__,
+            word[-1],
+        )
+    if dead_letters is not None and (invalid_words or invalid_lines):
+        for word in invalid_words:
+            dead_letters.add(word[0], word[1], word[-1])
+        for line, error in invalid_lines:
+            dead_letters.add(line, "", error)
+        delete_word(
+            [(word[0], word[1]) for word in invalid_words]
+            + [(line, "") for line, _ in invalid_lines],
+            file_name,
+            index,
+        )
+    return words
+
+
+def get_due_words(
+    words: list[list[str]], dead_letters: dead_letter.DeadLetterStore | None
+) -> list[list[str]]:
+    """Add the failed words whose next attempt is due to a list of words.
+
+    Args:
+        words (list[list[str]]): A list containing each word and its language.
+        dead_letters (dead_letter.DeadLetterStore | None): The store of the failed words.
+
+    Returns:
+        list[list[str]]: The words, then the due words which are not already in it.
+    """
+    if dead_letters is None:
+        return words
+    keys = {tuple(word[:2]) for word in words}
+    due_words = [word for word in dead_letters.get_due() if tuple(word) not in keys]
+    if due_words:
+        general_logger.debug("Sending %i failed word(s) again.", len(due_words))
+    return words + due_words
+
+
+def handle_result(
+    result: list, dead_letters: dead_letter.DeadLetterStore | None
+) -> bool:
+    """Log the result of a word, and move it to the dead letters if it failed.
+
+    Args:
+        result (list): The result returned by pipeline.worker_process.
+        dead_letters (dead_letter.DeadLetterStore | None): The store of the failed words.
+
+    Raises:
+        errors.InvalidConfiguration: An exception to indicate that the word failed because of the configuration of Notion.
+
+    Returns:
+        bool: True if the word should be deleted from WORDS.md, False otherwise.
+    """
+    if pipeline.log_result(result):
+        if dead_letters is not None:
+            dead_letters.remove(result[0], result[1])
+        return True
+    if dead_letter.is_configuration_error(result[3]):
+        # Every word would fail the same way, so the run stops instead of moving the words to the dead letters.
+        raise errors.InvalidConfiguration(result[3]) from result[3]
+    if dead_letters is None:
+        return False
+    dead_letters.add(result[0], result[1], result[3])
+    return True
+
+
+def get_words_to_find(
+    file_name: str,
+    index: int,
+    default_lang="en",
+    invalid_lines: list | None = None,
+    with_priority: bool = False,
+) -> list[str]:
+    """Get the list of words you want to fetch data for, and their corresponding languages.
+
+    Args:
+        file_name (str): The file name containing the words.
+        index (int): The number of lines that should be ignored at the beginning of the file.
+        default_lang (str, optional): The default word language. Defaults to "en".
+        invalid_lines (list | None, optional): A list to be filled with each invalid line and its error. Defaults to None.
+        with_priority (bool, optional): True to also get the priority of each word. Defaults to False.
+
+    Raises:
+        errors.InvalidDeclaration: An exception to indicate that a declaration in WORDS.md is invalid.
+
+    Returns:
+        list[str]: A list containing each word to find, its language, and its priority if requested.
+    """
+    general_logger.debug("Searching for words.")
+    words_list = []
+    with open(file_name, "r", encoding="utf-8") as file:
+        lines = file.readlines()[index:]
+        for line in lines:
+            try:
+                data = line.split(",")
+                data[-1] = data[-1].strip().replace("\n", "")
+                if data[-1] == "":
+                    data.pop()
+                if (
+                    len(data) > 3
+                    or not data
+                    or (len(data) == 3 and not is_priority(data[2]))
+                ):
+                    line_index = lines.index(line) + index + 1
+                    raise errors.InvalidDeclaration(data, line_index)
+                if len(data) < 2:
+                    data.append(default_lang)
+                if len(data) < 3:
+                    data.append(str(scheduler.DEFAULT_PRIORITY))
+            except errors.InvalidDeclaration as error:
+                general_logger.warning(
+                    "An error has been encountered trying to get the words in WORDS.md. Error type: %s. Message: %s",
+                    error.__class__.__name__,
+                    error,
+                )
+                exception_logger.exception("Caught an expected error.", exc_info=True)
+                if invalid_lines is not None and line.strip():
+                    invalid_lines.append([line.strip(), error])
+            else:
+                general_logger.debug("OK %s", data)
+                word = [
+                    utils.prettify(data[0].replace("\n", "")),
+                    utils.prettify(data[1].replace("\n", "")).lower(),
+                ]
+                if with_priority:
+                    word.append(int(data[2]))
+                words_list.append(word)
+    general_logger.debug("Found %i word(s).", len(words_list))
+    return words_list
+
+
+def is_priority(string: str) -> bool:
+    """Check if a string is a valid priority, a positive or negative integer.
+
+    Args:
+        string (str): The string to be checked.
+
+    Returns:
+        bool: True if the string is a priority, False otherwise.
+    """
+    return string.strip().lstrip("+-").isdigit()
+
+
+def delete_word(
+    words: list[tuple[str, str]], file_name: str, index: int, default_lang="en"
+) -> None:
+    """Delete the words in a file from a given list.
+
+    Args:
+        words (list[tuple[str, str]]): Each word to be deleted and its language, or each invalid line to be deleted and an empty language.
+        file_name (str): The file name containing the words.
+        index (int): The number of lines that should be ignored at the beginning of the file.
+        default_lang (str, optional): The language of the lines without language. Defaults to "en".
+    """
+    general_logger.debug("Deleting %i word(s).", len(words))
+    keys = {(word, lang.lower()) for word, lang in words}
+    with open(file_name, "r", encoding="utf-8") as file:
+        lines = file.readlines()
+        first_lines = lines[:index]
+        other_lines = lines[index:]
+    with open(file_name + ".tmp", "w", encoding="utf-8") as file:
+        for first_line in first_lines:
+            file.write(first_line)
+        for other_line in other_lines:
+            # The whole word and its language are compared, so that deleting "Test" in English keeps "Testing" and "Test" in French.
+            data = other_line.split(",")
+            line_lang = utils.prettify(data[1]).lower() if len(data) > 1 else ""
+            line_key = (utils.prettify(data[0]), line_lang or default_lang)
+            if line_key not in keys and (other_line.strip(), "") not in keys:
+                file.write(other_line)
+    # Replaced at once, so that an interrupted run never leaves a partial file.
+    os.replace(file_name + ".tmp", file_name)
+    general_logger.debug("Deleted %s.", words)
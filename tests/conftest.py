@@ -0,0 +1,88 @@
+# System imports
+import queue
+
+# Third party imports
+import pytest
+
+# Custom imports
+from notion_word_data import notion, scheduler
+
+
+class FakePipeline:
+    """A pipeline answering each word with the data of get_data, without any worker.
+
+    The words are queued in a FairScheduler and sent within the window, like in Pipeline.
+    """
+
+    def __init__(self, get_data=lambda word: {}, window=2, on_result=None):
+        self.get_data = get_data
+        self.on_result = on_result
+        self.processes = 1
+        self.window = window
+        self.scheduler = scheduler.FairScheduler()
+        self.dispatched = 0
+        self.admission = None
+        self.integrations = [None]
+        self.index = notion.NotionIndex()
+        self.in_flight = {}
+        self.results = queue.SimpleQueue()
+        self.submitted = []
+        self.requests = 0
+
+    def get_request_count(self):
+        return self.requests
+
+    def get_cached(self, word):
+        return None
+
+    def forget(self, word):
+        pass
+
+    def submit(self, word, dispatch=True):
+        key = tuple(word[:2])
+        if key in self.in_flight:
+            return False
+        self.in_flight[key] = None
+        self.scheduler.push(list(key), word[2] if len(word) > 2 else 0)
+        if dispatch:
+            self.dispatch()
+        return True
+
+    def drop_queued(self):
+        words = self.scheduler.clear()
+        for word in words:
+            del self.in_flight[tuple(word)]
+        return words
+
+    def dispatch(self):
+        while self.dispatched < self.window and (
+            self.admission is None or self.admission(self.dispatched)
+        ):
+            word = self.scheduler.pop()
+            if word is None:
+                return
+            self.dispatched += 1
+            self.submitted.append(word[0])
+            self.results.put([*word, "success", self.get_data(word[0]), "id"])
+
+    def get_result(self, timeout=None):
+        result = self.results.get()
+        del self.in_flight[(result[0], result[1])]
+        self.dispatched -= 1
+        self.scheduler.done(result)
+        if self.on_result is not None:
+            self.on_result(result)
+        self.dispatch()
+        return result
+
+    def run(self, words):
+        for word in words:
+            self.submit(word, dispatch=False)
+        self.dispatch()
+        while self.in_flight:
+            yield self.get_result()
+
+
+@pytest.fixture
+def fake_pipeline():
+    return FakePipeline
@@ -1,10 +1,60 @@
+# System imports
+import subprocess
+import sys
+
 # Third party imports
 import pytest
 
 # Custom imports
-from notion_word_data import app
-from notion_word_data import errors
+from notion_word_data import app, deadline, errors, word_list
+
+# Importing the CLI entry point should not import these modules, nor take more than this (in seconds).
+HEAVY_MODULES = ("bs4.element", "urllib3", "alive_progress.core", "dotenv.main")
+IMPORT_TIME_BUDGET = 0.15
 
 
 def test_get_word_to_find():
-    assert ["Example", "en"] in app.get_words_to_find("WORDS.md", 4)
+    assert ["Example", "en"] in word_list.get_words_to_find("WORDS.md", 4)
+
+
+def test_import_time_budget():
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import notion_word_data.app\n"
+        "print(time.perf_counter() - start)\n"
+        f"print(any(name in sys.modules for name in {HEAVY_MODULES}))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout.split()
+    assert float(output[0]) < IMPORT_TIME_BUDGET
+    assert output[1] == "False"
+
+
+def test_report_deferred(caplog):
+    run_deadline = deadline.Deadline(60)
+    run_deadline.deferred = [["Test", "en", 0], ["Chat", "fr", 0], ["Word", "en", 0]]
+    with caplog.at_level("INFO", logger="notion_word_data"):
+        app.report_deferred(run_deadline)
+    assert (
+        "3 word(s) deferred to the next run (2 in en, 1 in fr), no throughput measured."
+        in caplog.messages
+    )
+
+
+def test_run_once_configuration_error_keeps_the_handled_words_deleted(
+    tmp_path, monkeypatch, fake_pipeline
+):
+    file_name = tmp_path / "WORDS.md"
+    file_name.write_text("\n\n\n---\nTest, en\nOther, en\n", encoding="utf-8")
+    monkeypatch.setattr(app, "WORDS_FILE", str(file_name))
+    word_pipeline = fake_pipeline()
+    results = [
+        ["Test", "en", "success", {}, "id"],
+        ["Other", "en", "error", errors.InvalidToken("token")],
+    ]
+    monkeypatch.setattr(word_pipeline, "run", lambda words: iter(results))
+    with pytest.raises(errors.InvalidConfiguration):
+        app.run_once(word_pipeline)
+    assert file_name.read_text(encoding="utf-8") == "\n\n\n---\nOther, en\n"
@@ -0,0 +1,39 @@
+# Custom imports
+from notion_word_data import cleanup
+
+
+def get_entry(page_id, has_infos, last_edited_time):
+    return {
+        "id": page_id,
+        "title": "Test",
+        "last_edited_time": last_edited_time,
+        "has_infos": has_infos,
+        "database_id": "database",
+    }
+
+
+def test_select_survivor():
+    entries = [
+        get_entry("empty", False, "2022-04-03T00:00:00.000Z"),
+        get_entry("old", True, "2022-04-01T00:00:00.000Z"),
+        get_entry("new", True, "2022-04-02T00:00:00.000Z"),
+    ]
+    survivor, others = cleanup.select_survivor(entries)
+    assert survivor["id"] == "new"
+    assert [entry["id"] for entry in others] == ["old", "empty"]
+
+
+def test_get_garbage(monkeypatch):
+    def refresh(self, session):
+        self.pages = {
+            "Test": [
+                get_entry("a", True, "2022-04-02T00:00:00.000Z"),
+                get_entry("b", False, "2022-04-01T00:00:00.000Z"),
+            ],
+            "Other": [get_entry("c", False, "2022-04-01T00:00:00.000Z")],
+        }
+
+    monkeypatch.setattr(cleanup.notion.NotionIndex, "refresh", refresh)
+    assert [entry["id"] for entry in cleanup.GarbageCollector().get_garbage()] == ["b"]
+    collector = cleanup.GarbageCollector(archive_empty=True)
+    assert [entry["id"] for entry in collector.get_garbage()] == ["b", "c"]
@@ -0,0 +1,30 @@
+# Custom imports
+from notion_word_data import crawl
+
+SYNONYMS = {
+    "Test": ["Trial", "Check"],
+    "Trial": ["Test", "Experiment"],
+    "Check": ["Test", "Verify"],
+}
+
+
+def get_data(word):
+    return {word: {"Noun": {"Definition.": [[], SYNONYMS.get(word, [])]}}}
+
+
+def test_get_synonyms():
+    data = {"Test": {"Noun": {"A.": [[], ["Trial", "Check"]], "B.": [[], ["Trial"]]}}}
+    assert crawl.get_synonyms(data) == ["Trial", "Check"]
+
+
+def test_crawler_depth(fake_pipeline):
+    word_pipeline = fake_pipeline(get_data)
+    list(crawl.Crawler(word_pipeline, 1, 10).run([["Test", "en"]]))
+    assert word_pipeline.submitted == ["Test", "Trial", "Check"]
+
+
+def test_crawler_max_words_and_index(fake_pipeline):
+    word_pipeline = fake_pipeline(get_data)
+    word_pipeline.index.set("Trial", "id")
+    list(crawl.Crawler(word_pipeline, 2, 2).run([["Test", "en"]]))
+    assert word_pipeline.submitted == ["Test", "Check", "Verify"]
@@ -0,0 +1,61 @@
+# Third party imports
+import requests
+
+# Custom imports
+from notion_word_data import dead_letter, errors
+
+
+def get_http_error(status_code, url=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    return requests.HTTPError(f"{status_code} Error", response=response)
+
+
+def test_classify():
+    assert dead_letter.classify(errors.InvalidWord("test")) == "permanent"
+    assert (
+        dead_letter.classify(errors.UnknownLayout("en", ["google-2022-04"]))
+        == "permanent"
+    )
+    assert dead_letter.classify(get_http_error(400)) == "permanent"
+    assert dead_letter.classify(get_http_error(429)) == "transient"
+    assert dead_letter.classify(get_http_error(502)) == "transient"
+    assert dead_letter.classify(requests.Timeout()) == "transient"
+
+
+def test_is_configuration_error():
+    assert dead_letter.is_configuration_error(errors.InvalidToken("token"))
+    assert dead_letter.is_configuration_error(
+        get_http_error(403, "https://api.notion.com/v1/pages/")
+    )
+    assert not dead_letter.is_configuration_error(
+        get_http_error(403, "https://www.google.com/search")
+    )
+    assert not dead_letter.is_configuration_error(errors.InvalidWord("test"))
+
+
+def test_dead_letter_store_schedule(tmp_path, monkeypatch):
+    monkeypatch.setattr(dead_letter, "MAX_ATTEMPTS", 3)
+    dead_letters = dead_letter.DeadLetterStore(str(tmp_path / "dead_letter.sqlite3"))
+    first = dead_letters.add("Test", "en", get_http_error(429))
+    second = dead_letters.add("Test", "en", get_http_error(429))
+    assert first["status"] == second["status"] == "scheduled"
+    assert (
+        second["next_attempt_at"] - second["last_failed_at"]
+        > first["next_attempt_at"] - first["last_failed_at"]
+    )
+    assert dead_letters.get_due() == []
+    assert dead_letters.get_due(second["next_attempt_at"]) == [["Test", "en"]]
+    assert dead_letters.add("Test", "en", get_http_error(429))["status"] == "parked"
+
+
+def test_dead_letter_store_replay(tmp_path):
+    dead_letters = dead_letter.DeadLetterStore(str(tmp_path / "dead_letter.sqlite3"))
+    dead_letters.add("Tset", "en", errors.InvalidWord("Tset"))
+    dead_letters.add("Test, en, fr", "", errors.InvalidDeclaration("Test", 5))
+    assert dead_letters.get_due() == []
+    assert dead_letters.replay() == 1
+    assert dead_letters.get_due() == [["Tset", "en"]]
+    dead_letters.remove("Tset", "en")
+    assert len(dead_letters.get_entries("parked")) == 1
@@ -0,0 +1,59 @@
+# Third party imports
+import pytest
+
+# Custom imports
+from notion_word_data import deadline
+
+
+def test_parse_duration():
+    assert deadline.parse_duration("90") == 90
+    assert deadline.parse_duration("45m") == 45 * 60
+    assert deadline.parse_duration("1.5h") == 5400
+    with pytest.raises(ValueError):
+        deadline.parse_duration("soon")
+
+
+def test_deadline_rate_limited_by_notion():
+    run_deadline = deadline.Deadline(600, margin=0)
+    run_deadline.notion_rate = 3
+    now = run_deadline.started_at
+    run_deadline.observe(10, 40, now + 2)
+    # 5 words per second are fetched, but Notion only writes 3 / 4 words per second.
+    assert run_deadline.get_rate() == pytest.approx(0.75)
+    assert run_deadline.get_eta(3) == pytest.approx(4)
+    assert run_deadline.can_admit(2, now + 595)
+    assert not run_deadline.can_admit(2, now + 597)
+
+
+def test_deadline_run_defers_the_lowest_priority(fake_pipeline):
+    run_deadline = deadline.Deadline(600, margin=0)
+    run_deadline.word_rate = 1 / 200
+
+    def on_result(result):
+        # A word takes 200 seconds.
+        run_deadline.ends_at -= 200
+
+    word_pipeline = fake_pipeline(on_result=on_result)
+    words = [["Low", "en", -1], ["High", "en", 5], ["Middle", "en", 0]]
+    results = list(run_deadline.run(word_pipeline, words))
+    # After the first word, 400 seconds are left for the word in flight and a third word.
+    assert word_pipeline.submitted == ["High", "Middle"]
+    assert len(results) == 2
+    assert run_deadline.deferred == [["Low", "en"]]
+    assert run_deadline.get_summary()["languages"] == {"en": 1}
+
+
+def test_deadline_run_languages_take_turns(fake_pipeline):
+    run_deadline = deadline.Deadline(600, margin=0)
+    run_deadline.word_rate = 1 / 200
+
+    def on_result(result):
+        run_deadline.ends_at -= 200
+
+    word_pipeline = fake_pipeline(on_result=on_result)
+    words = [["One", "en"], ["Two", "en"], ["Three", "en"], ["Chat", "fr"]]
+    list(run_deadline.run(word_pipeline, words))
+    # The French word is not held back by the English batch queued before it.
+    assert word_pipeline.submitted == ["One", "Chat"]
+    assert run_deadline.get_summary()["languages"] == {"en": 2}
+    assert word_pipeline.admission is None
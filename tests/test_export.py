@@ -0,0 +1,42 @@
+# Third party imports
+import requests
+
+# Custom imports
+from notion_word_data import export, notion
+
+DATA = {"Test": {"Noun": {"A trial.": [[], ["Trial"]]}}}
+
+
+def test_payload_writer(tmp_path):
+    file_name = str(tmp_path / "words.ndjson.gz")
+    with export.PayloadWriter(file_name) as writer:
+        writer.write("Tests", "en", DATA)
+        writer.write("Test", "en", DATA)
+    records = list(export.iter_records(file_name, 1))
+    assert [(position, record["word"]) for position, record in records] == [(1, "Test")]
+    assert records[0][1]["create"] == notion.NotionSync.get_payloads(DATA)["create"]
+
+
+def test_replayer_resumes(tmp_path, monkeypatch):
+    file_name = str(tmp_path / "words.ndjson.gz")
+    with export.PayloadWriter(file_name) as writer:
+        for word in ("A", "B", "C"):
+            writer.write(word, "en", DATA)
+    published = []
+
+    def publish(record, headers, session, page_ids=None, integration=None):
+        if record["word"] == "B" and "B" not in published:
+            published.append("B")
+            raise requests.HTTPError("429 Too Many Requests")
+        published.append(record["word"])
+        return record["word"].lower()
+
+    monkeypatch.setattr(notion.NotionSync, "publish", publish)
+    monkeypatch.setattr(notion.NotionIndex, "refresh", lambda self, session: None)
+    results = list(export.Replayer(file_name).run())
+    assert [result[2] for result in results] == ["success", "error"]
+    assert export.get_checkpoint(file_name) == 1
+    results = list(export.Replayer(file_name).run())
+    assert [result[0] for result in results] == ["B", "C"]
+    assert published == ["A", "B", "B", "C"]
+    assert export.get_checkpoint(file_name) == 3
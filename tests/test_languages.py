@@ -0,0 +1,29 @@
+# Third party imports
+import pytest
+
+# Custom imports
+from notion_word_data import errors, languages
+
+
+def test_get_registry_success():
+    registry = languages.get_registry()
+    assert "en" in registry
+    assert registry.get("EN").name == "English"
+
+
+def test_get_registry_hl():
+    assert languages.get_registry().get("zh-cn").hl == "zh-CN"
+
+
+def test_get_registry_failure_InvalidLanguage():
+    with pytest.raises(errors.InvalidLanguage):
+        languages.get_registry().get("invalid")
+
+
+def test_validate():
+    valid_words, invalid_words = languages.get_registry().validate(
+        [["Example", "en"], ["Exemple", "invalid"]]
+    )
+    assert valid_words == [["Example", "en"]]
+    assert invalid_words[0][:2] == ["Exemple", "invalid"]
+    assert isinstance(invalid_words[0][2], errors.InvalidLanguage)
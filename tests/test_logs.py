@@ -0,0 +1,62 @@
+# System imports
+import logging
+
+# Custom imports
+from notion_word_data import logs
+
+
+def make_record(level: int, func_name: str) -> logging.LogRecord:
+    record = logging.LogRecord("test", level, __file__, 0, "message", (), None)
+    record.funcName = func_name
+    return record
+
+
+def test_sampling_filter_debug():
+    sampling_filter = logs.SamplingFilter({"stage": 3})
+    kept = [
+        sampling_filter.filter(make_record(logging.DEBUG, "stage")) for _ in range(6)
+    ]
+    assert kept == [True, False, False, True, False, False]
+
+
+def test_sampling_filter_other_levels():
+    sampling_filter = logs.SamplingFilter({"stage": 3})
+    assert all(
+        sampling_filter.filter(make_record(logging.INFO, "stage")) for _ in range(3)
+    )
+
+
+def test_setup_logging_general_no_handler():
+    logger = logs.setup_logging_general("notion_word_data.test.general")
+    logs.setup_logging_general("notion_word_data.test.general")
+    assert logger.handlers == []
+
+
+def test_parse_sampling_invalid_entries():
+    sampling, invalid_entries = logs.parse_sampling(
+        "set_word_info=10, bad, get_web_data=x,"
+    )
+    assert sampling == {"set_word_info": 10}
+    assert invalid_entries == ["bad", "get_web_data=x"]
+
+
+def test_get_level(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "warning")
+    assert logs.get_level() == (logging.WARNING, None)
+    monkeypatch.setenv("LOG_LEVEL", "verbose")
+    assert logs.get_level() == (logging.DEBUG, "verbose")
+
+
+def test_stop_listener_restores_the_handlers(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(logs, "LOG_FILE", str(tmp_path / "logs.log"))
+    monkeypatch.setenv("LOG_LEVEL", "verbose")
+    package_logger = logging.getLogger(logs.PACKAGE_LOGGER)
+    handlers = list(package_logger.handlers)
+    logs.start_listener()
+    logs.stop_listener()
+    assert package_logger.handlers == handlers
+    logs.setup_logging_general("notion_word_data.test.general").warning("After.")
+    assert "Logging error" not in capsys.readouterr().err
+    assert (
+        'Ignored the invalid LOG_LEVEL "verbose"' in (tmp_path / "logs.log").read_text()
+    )
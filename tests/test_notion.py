@@ -37,3 +37,53 @@ def test_query_database_failure_InvalidDatabaseID():
 def test_query_database_failure_InvalidToken():
     with pytest.raises(errors.InvalidToken):
         notion.NotionSync.query_database("", PAYLOAD, requests.Session())
+
+
+def test_get_page_entry():
+    page = {
+        "id": "page",
+        "last_edited_time": "2022-04-01T00:00:00.000Z",
+        "properties": {
+            "Word": {"title": [{"plain_text": "Te"}, {"plain_text": "st"}]},
+            "Informations": {"rich_text": []},
+        },
+    }
+    assert notion.NotionIndex.get_page_entry(page) == {
+        "id": "page",
+        "title": "Test",
+        "last_edited_time": "2022-04-01T00:00:00.000Z",
+        "has_infos": False,
+    }
+
+
+def test_get_payloads():
+    data = {"Test": {"Noun": {"A trial.": [["A test"], ["Trial", "Check"]]}}}
+    payloads = notion.NotionSync.get_payloads(data)
+    assert payloads["title"] == "Test"
+    assert payloads["create"]["properties"]["Part Of Speech"] == {
+        "multi_select": [{"name": "Noun"}]
+    }
+    resolved = notion.NotionSync.resolve_pos_colors(
+        payloads["update"], {"Noun": "blue"}
+    )
+    assert [
+        text["text"]["content"]
+        for text in resolved["properties"]["Informations"]["rich_text"]
+    ] == ["1. A trial.\n", "A test\n", "Trial, Check\n", ""]
+    assert resolved["properties"]["Informations"]["rich_text"][0]["annotations"] == {
+        "bold": True,
+        "color": "blue",
+    }
+
+
+def test_get_integration(monkeypatch):
+    monkeypatch.setenv("TOKEN_2", "token_2")
+    monkeypatch.setenv("DATABASE_ID_2", "database_2")
+    # The integrations read from the patched environment are not kept for the other tests.
+    monkeypatch.setattr(notion, "get_integrations", notion.get_integrations.__wrapped__)
+    integrations = notion.get_integrations()
+    assert [integration.name for integration in integrations] == ["1", "2"]
+    assert integrations[1].database_id == "database_2"
+    shards = {notion.get_integration(f"Word{i}", "en").name for i in range(20)}
+    assert shards == {"1", "2"}
+    assert notion.get_integration("Test", "en") == notion.get_integration("Test", "en")
@@ -0,0 +1,166 @@
+# System imports
+import types
+
+# Third party imports
+import pytest
+
+# Custom imports
+from notion_word_data import errors, pipeline
+
+
+def test_log_result_success():
+    assert pipeline.log_result(["Test", "en", "success", {"Test": {}}, "id"])
+
+
+def test_log_result_failure():
+    assert not pipeline.log_result(
+        ["Test", "en", "failure", errors.InvalidWord("test")]
+    )
+
+
+def test_cache_lru(monkeypatch):
+    monkeypatch.setattr(pipeline, "CACHE_SIZE", 2)
+    word_pipeline = pipeline.Pipeline()
+    word_pipeline.set_cached(["A", "en"], {"A": {}})
+    word_pipeline.set_cached(["B", "en"], {"B": {}})
+    word_pipeline.get_cached(["A", "en"])
+    word_pipeline.set_cached(["C", "en"], {"C": {}})
+    assert word_pipeline.get_cached(["A", "en"]) == {"A": {}}
+    assert word_pipeline.get_cached(["B", "en"]) is None
+
+
+def test_parse_process_shared_memory():
+    content = b"<html><body><p>No definition.</p></body></html>"
+    memory = pipeline.multiprocessing.shared_memory.SharedMemory(
+        create=True, size=len(content)
+    )
+    try:
+        memory.buf[: len(content)] = content
+        result = pipeline.parse_process(["Test", "en"], memory.name, len(content))
+    finally:
+        memory.close()
+        memory.unlink()
+    assert result[:3] == ["Test", "en", "failure"]
+    assert isinstance(result[3], errors.InvalidWord)
+
+
+def test_exit_terminates_after_an_error():
+    word_pipeline = pipeline.Pipeline(1)
+    try:
+        with word_pipeline:
+            word_pipeline.pool.apply_async(pipeline.time.sleep, (60,))
+            raise KeyboardInterrupt
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pipeline.logs.stop_listener()
+    assert word_pipeline.pool is None
+
+
+def fake_worker_process(word, data=None, page_ids=None, session=None, dry_run=False):
+    return [word[0], word[1], "success", {word[0]: {}}, None]
+
+
+def test_run_shard_stats(monkeypatch):
+    monkeypatch.setattr(pipeline, "worker_process", fake_worker_process)
+    try:
+        with pipeline.Pipeline(2, dry_run=True) as word_pipeline:
+            results = list(word_pipeline.run([[f"Word{i}", "en"] for i in range(10)]))
+            stats = word_pipeline.get_shard_stats()
+    finally:
+        pipeline.logs.stop_listener()
+    assert sorted(result[0] for result in results) == sorted(
+        f"Word{i}" for i in range(10)
+    )
+    assert sum(integration["in_flight"] for integration in stats) == 0
+
+
+def test_drop_queued(monkeypatch):
+    monkeypatch.setattr(pipeline, "worker_process", fake_worker_process)
+    try:
+        with pipeline.Pipeline(1, dry_run=True) as word_pipeline:
+            for i in range(10):
+                word_pipeline.submit([f"Word{i}", "en"], dispatch=False)
+            word_pipeline.dispatch()
+            assert len(word_pipeline.drop_queued()) == 10 - word_pipeline.window
+            results = []
+            while word_pipeline.in_flight:
+                results.append(word_pipeline.get_result())
+    finally:
+        pipeline.logs.stop_listener()
+    assert len(results) == word_pipeline.window
+    assert len(word_pipeline.scheduler) == 0
+
+
+PAGE = """
+<span data-dobid="hdw">{word}</span>
+<div class="lW8rQd"><span class="YrbPuc">noun</span></div>
+<ol class="eQJLDd">
+    <div class="thODed"><div data-dobid="dfn">a procedure.</div></div>
+</ol>
+{padding}"""
+# The size of the page which cannot be copied to shared memory.
+FULL_SIZE = 4096
+
+
+class FakeNotionSync:
+    def __init__(self, data, session, page_ids=None, integration=None):
+        if "Rejected" in data:
+            raise OSError("Notion is unreachable")
+        self.identifier = "page"
+
+
+def get_web_data(url, headers, session):
+    word = url.split("define+")[1].split("&")[0]
+    if word == "offline":
+        raise pipeline.requests.ConnectionError("offline")
+    page = PAGE.format(word=word, padding="")
+    if word == "full":
+        page = PAGE.format(word=word, padding=" " * (FULL_SIZE - len(page)))
+    return types.SimpleNamespace(content=page.encode())
+
+
+def test_run_hybrid(monkeypatch):
+    created = []
+
+    class SharedMemory(pipeline.multiprocessing.shared_memory.SharedMemory):
+        def __init__(self, name=None, create=False, size=0):
+            if create and size == FULL_SIZE:
+                raise OSError("No space left on device")
+            super().__init__(name, create, size)
+            if create:
+                created.append(self.name)
+
+    monkeypatch.setattr(
+        pipeline.multiprocessing.shared_memory, "SharedMemory", SharedMemory
+    )
+    monkeypatch.setattr(pipeline.word_data.WordData, "get_web_data", get_web_data)
+    monkeypatch.setattr(pipeline.notion, "NotionSync", FakeNotionSync)
+    words = [
+        ["Test", "en"],
+        ["Full", "en"],
+        ["Offline", "en"],
+        ["Rejected", "en"],
+        ["Other", "en"],
+    ]
+    try:
+        with pipeline.Pipeline(1, fetch_threads=2) as word_pipeline:
+            results = list(word_pipeline.run(words))
+            assert word_pipeline.in_flight == {}
+            assert word_pipeline.dispatched == 0
+    finally:
+        pipeline.logs.stop_listener()
+    assert sorted(result[0] for result in results) == sorted(word[0] for word in words)
+    statuses = {result[0]: result[2] for result in results}
+    assert statuses == {
+        "Test": "success",
+        "Full": "error",
+        "Offline": "error",
+        "Rejected": "error",
+        "Other": "success",
+    }
+    assert all(result[4] == "page" for result in results if result[2] == "success")
+    assert len(created) == 3
+    for name in created:
+        with pytest.raises(FileNotFoundError):
+            pipeline.multiprocessing.shared_memory.SharedMemory(name)
@@ -0,0 +1,39 @@
+# Third party imports
+import bs4
+import pytest
+
+# Custom imports
+from notion_word_data import errors, profiles
+
+PAGE = """
+<span data-dobid="hdw">test</span>
+<div class="lW8rQd"><span class="YrbPuc">noun</span></div>
+<ol class="eQJLDd">
+    <div class="thODed">
+        <div data-dobid="dfn">a procedure.</div>
+        <div class="ubHt5c">"a test"</div>
+        <div class="EmSASc gjoUyf new">trial</div>
+    </div>
+</ol>
+"""
+
+
+def test_detect_fallback():
+    soup = bs4.BeautifulSoup(PAGE, "html.parser")
+    resolved = profiles.detect(soup, "en", "test")
+    assert resolved.profile is profiles.GOOGLE_2022_04
+    assert resolved.fallbacks["synonym"] == 1
+    sense = resolved.select("sense", soup)[0]
+    assert [synonym.text for synonym in resolved.select("synonym", sense)] == ["trial"]
+
+
+def test_detect_failure_InvalidWord():
+    soup = bs4.BeautifulSoup("<div></div>", "html.parser")
+    with pytest.raises(errors.InvalidWord):
+        profiles.detect(soup, "en", "test")
+
+
+def test_detect_failure_UnknownLayout():
+    soup = bs4.BeautifulSoup('<span data-dobid="hdw">test</span>', "html.parser")
+    with pytest.raises(errors.UnknownLayout):
+        profiles.detect(soup, "en", "test")
@@ -0,0 +1,49 @@
+# Custom imports
+from notion_word_data import notion, refresh, store
+
+OLD = {"Test": {"Noun": {"A trial.": [[], ["Trial"]]}}}
+NEW = {"Test": {"Noun": {"A trial.": [[], ["Trial", "Check"]]}}}
+
+
+def test_refresher(tmp_path, monkeypatch, fake_pipeline):
+    word_store = store.WordStore(str(tmp_path / "words.sqlite3"))
+    other = {"Other": OLD["Test"]}
+    word_store.add_many([("Test", "en", OLD, "page"), ("Other", "en", other, "page")])
+    word_store.add_many([("Third", "en", {"Third": OLD["Test"]}, "page")])
+    fetched = {
+        "Test": NEW,
+        "Other": {"Other": NEW["Test"]},
+        "Third": {"Third": OLD["Test"]},
+    }
+    word_pipeline = fake_pipeline(fetched.get)
+
+    def publish(payloads, headers, session, page_ids=None, integration=None):
+        assert page_ids == ["page"]
+        word_pipeline.requests += len(page_ids) + refresh.WRITE_COST
+        return "new_page"
+
+    monkeypatch.setattr(notion.NotionSync, "publish", publish)
+    refresher = refresh.Refresher(word_pipeline, word_store, 1 + refresh.WRITE_COST)
+    results = {result[0]: result[2] for result in refresher.run(3)}
+    assert sorted(results.values()) == ["deferred", "success", "unchanged"]
+    assert results["Third"] == "unchanged"
+    updated = [word for word, status in results.items() if status == "success"]
+    assert word_store.lookup(updated[0]) == [fetched[updated[0]]]
+    assert [entry["word"] for entry in word_store.get_stalest(1)] != updated
+
+
+def test_refresher_unknown_pages(tmp_path, monkeypatch, fake_pipeline):
+    word_store = store.WordStore(str(tmp_path / "words.sqlite3"))
+    word_store.add_many([("Test", "en", OLD, None)])
+    word_pipeline = fake_pipeline({"Test": NEW}.get)
+
+    def get_database_id(headers, payload, session, integration=None):
+        word_pipeline.requests += refresh.QUERY_COST
+        return ["page", "duplicate"]
+
+    monkeypatch.setattr(notion.NotionSync, "get_database_id", get_database_id)
+    # The query fits, but not the deletion of both pages with the creation and the update.
+    budget = refresh.QUERY_COST + 1 + refresh.WRITE_COST
+    refresher = refresh.Refresher(word_pipeline, word_store, budget)
+    assert [result[2] for result in refresher.run(1)] == ["deferred"]
+    assert refresher.get_used() == refresh.QUERY_COST
@@ -0,0 +1,41 @@
+# Custom imports
+from notion_word_data import scheduler
+
+
+def test_fair_scheduler_priority():
+    fair_scheduler = scheduler.FairScheduler()
+    for number in range(100):
+        fair_scheduler.push([f"Word{number}", "en"])
+    fair_scheduler.push(["Urgent", "fr"], 10)
+    assert fair_scheduler.pop() == ["Urgent", "fr"]
+    assert fair_scheduler.pop() == ["Word0", "en"]
+    assert len(fair_scheduler) == 99
+
+
+def test_fair_scheduler_round_robin():
+    fair_scheduler = scheduler.FairScheduler()
+    for lang in ("en", "en", "en", "fr", "de"):
+        fair_scheduler.push(["Test", lang])
+    langs = [fair_scheduler.pop()[1] for _ in range(5)]
+    assert langs == ["en", "fr", "de", "en", "en"]
+
+
+def test_fair_scheduler_language_concurrency():
+    fair_scheduler = scheduler.FairScheduler(language_concurrency=1)
+    fair_scheduler.push(["A", "en"])
+    fair_scheduler.push(["B", "en"])
+    assert fair_scheduler.pop() == ["A", "en"]
+    assert fair_scheduler.pop() is None
+    fair_scheduler.done(["A", "en"])
+    assert fair_scheduler.pop() == ["B", "en"]
+
+
+def test_fair_scheduler_clear():
+    fair_scheduler = scheduler.FairScheduler(language_concurrency=1)
+    fair_scheduler.push(["A", "en"])
+    fair_scheduler.push(["B", "en"])
+    fair_scheduler.push(["C", "fr"])
+    fair_scheduler.pop()
+    assert sorted(fair_scheduler.clear()) == [["B", "en"], ["C", "fr"]]
+    assert len(fair_scheduler) == 0
+    assert fair_scheduler.running["en"] == 1
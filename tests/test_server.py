@@ -0,0 +1,28 @@
+# Custom imports
+from notion_word_data import errors, server
+
+
+def test_job_queue_cached(tmp_path):
+    jobs = server.JobQueue(str(tmp_path / "jobs.sqlite3"))
+    job_id = jobs.add([["Test", "en"]], {("Test", "en"): {"Test": {}}})
+    assert jobs.get_status(job_id)["status"] == "done"
+    assert jobs.get_results(job_id) == [
+        {"word": "Test", "lang": "en", "status": "cached", "data": {"Test": {}}}
+    ]
+
+
+def test_job_queue_result(tmp_path):
+    jobs = server.JobQueue(str(tmp_path / "jobs.sqlite3"))
+    job_id = jobs.add([["Test", "en"], ["Wogewpvgfa", "en"]], {})
+    assert jobs.get_pending() == [["Test", "en"], ["Wogewpvgfa", "en"]]
+    assert jobs.get_pending() == []
+    jobs.set_result(["Test", "en", "success", {"Test": {}}, "page"])
+    assert jobs.get_status(job_id)["status"] == "running"
+    jobs.set_result(["Wogewpvgfa", "en", "failure", errors.InvalidWord("wogewpvgfa")])
+    assert jobs.get_status(job_id)["words"] == {"failure": 1, "success": 1}
+    assert jobs.get_results(job_id)[1]["error"] == "InvalidWord"
+
+
+def test_job_queue_unknown(tmp_path):
+    jobs = server.JobQueue(str(tmp_path / "jobs.sqlite3"))
+    assert jobs.get_status("unknown") is None
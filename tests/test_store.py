@@ -0,0 +1,48 @@
+# Third party imports
+import pytest
+
+# Custom imports
+from notion_word_data import errors, store
+
+DATA = {
+    "Test": {
+        "Noun": {
+            "A procedure intended to establish the quality of something.": [
+                ["”Both countries carried out nuclear tests”"],
+                ["Trial", "Check"],
+            ],
+            "Short for test match.": [[], []],
+        },
+        "Verb": {"Take measures to check the quality.": [[], ["Try out", "Trial"]]},
+    }
+}
+
+
+def test_word_store_lookup(tmp_path):
+    word_store = store.WordStore(str(tmp_path / "words.sqlite3"))
+    word_store.add_many([("Tests", "en", DATA, "page")])
+    word_store.add_many([("Tests", "en", DATA, "page")])
+    assert word_store.lookup("test") == [DATA]
+    assert word_store.lookup("tests", "en") == [DATA]
+    assert word_store.lookup("test", "fr") == []
+
+
+def test_word_store_synonym_of(tmp_path):
+    word_store = store.WordStore(str(tmp_path / "words.sqlite3"))
+    word_store.add_many([("Test", "en", DATA, "page")])
+    assert [row[2] for row in word_store.synonym_of("trial")] == ["Noun", "Verb"]
+    assert word_store.synonym_of("experiment") == []
+
+
+def test_word_store_search(tmp_path):
+    word_store = store.WordStore(str(tmp_path / "words.sqlite3"))
+    word_store.add_many([("Test", "en", DATA, "page")])
+    assert len(word_store.search("quality")) == 2
+    assert word_store.search("match")[0][3] == "Short for test match."
+
+
+def test_word_store_search_failure_InvalidQuery(tmp_path):
+    word_store = store.WordStore(str(tmp_path / "words.sqlite3"))
+    for text in ('"quality', "AND"):
+        with pytest.raises(errors.InvalidQuery):
+            word_store.search(text)
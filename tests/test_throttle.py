@@ -0,0 +1,27 @@
+# System imports
+import time
+
+# Custom imports
+from notion_word_data import throttle
+
+
+def test_rate_limiter_acquire():
+    rate_limiter = throttle.RateLimiter(20)
+    start = time.monotonic()
+    for _ in range(5):
+        rate_limiter.acquire()
+    assert time.monotonic() - start >= 4 / 20
+
+
+def test_rate_limiter_backlog():
+    rate_limiter = throttle.RateLimiter(1)
+    rate_limiter.acquire()
+    assert 0 < rate_limiter.backlog() <= 1
+
+
+def test_rate_limiter_throughput():
+    rate_limiter = throttle.RateLimiter(1000)
+    for _ in range(3):
+        rate_limiter.acquire()
+    assert rate_limiter.count.value == 3
+    assert rate_limiter.throughput() > 0
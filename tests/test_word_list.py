@@ -0,0 +1,44 @@
+# Third party imports
+import pytest
+
+# Custom imports
+from notion_word_data import dead_letter, errors, word_list
+
+
+def test_get_word_to_find_with_priority(tmp_path):
+    file_name = tmp_path / "WORDS.md"
+    file_name.write_text("---\nTest, en, 5\nExample\nBad, en, high\n", encoding="utf-8")
+    invalid_lines = []
+    words = word_list.get_words_to_find(
+        str(file_name), 1, invalid_lines=invalid_lines, with_priority=True
+    )
+    assert words == [["Test", "en", 5], ["Example", "en", 0]]
+    assert invalid_lines[0][0] == "Bad, en, high"
+
+
+def test_delete_word_whole_word(tmp_path):
+    file_name = tmp_path / "WORDS.md"
+    file_name.write_text(
+        "---\nTest, en\nTesting, en\nword, fr\nBad, en, high\n", encoding="utf-8"
+    )
+    word_list.delete_word(
+        [("Test", "en"), ("Word", "fr"), ("Bad, en, high", "")], str(file_name), 1
+    )
+    assert file_name.read_text(encoding="utf-8") == "---\nTesting, en\n"
+
+
+def test_delete_word_same_word_other_language(tmp_path):
+    file_name = tmp_path / "WORDS.md"
+    file_name.write_text("---\nChat, FR\nChat\nChat, en\n", encoding="utf-8")
+    word_list.delete_word([("Chat", "fr")], str(file_name), 1)
+    assert file_name.read_text(encoding="utf-8") == "---\nChat\nChat, en\n"
+    word_list.delete_word([("Chat", "EN")], str(file_name), 1)
+    assert file_name.read_text(encoding="utf-8") == "---\n"
+
+
+def test_handle_result_failure_InvalidConfiguration(tmp_path):
+    dead_letters = dead_letter.DeadLetterStore(str(tmp_path / "dead_letter.sqlite3"))
+    result = ["Test", "en", "failure", errors.InvalidDatabaseID("database")]
+    with pytest.raises(errors.InvalidConfiguration):
+        word_list.handle_result(result, dead_letters)
+    assert dead_letters.get_entries() == []